@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Build the packed template bundle shipped in the wheel.
+
+This script packs every file of the templates directory into
+templates/templates.pack so the installed package reads its templates
+with a single open() instead of walking the loose files.
+
+Usage:
+    python scripts/build_bundle.py
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+# Find project root relative to script location
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from tdd_llm.bundle import BUNDLE_NAME, write_bundle  # noqa: E402
+
+
+def main():
+    templates_dir = project_root / "src" / "tdd_llm" / "templates"
+
+    if not templates_dir.exists():
+        print(f"Error: Templates directory not found: {templates_dir}")
+        sys.exit(1)
+
+    version = None
+    manifest_checksum = None
+    manifest_path = templates_dir / "manifest.json"
+    if manifest_path.exists():
+        manifest_bytes = manifest_path.read_bytes()
+        version = json.loads(manifest_bytes).get("version")
+        # The package ignores the bundle once manifest.json no longer matches it
+        manifest_checksum = hashlib.sha256(manifest_bytes).hexdigest()
+
+    bundle_path = templates_dir / BUNDLE_NAME
+    count = write_bundle(templates_dir, bundle_path, version, manifest_checksum)
+
+    print(f"Generated {BUNDLE_NAME}:")
+    print(f"  Version: {version}")
+    print(f"  Files: {count}")
+    print(f"  Path: {bundle_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,33 @@
 
 This script scans the templates directory and generates a manifest.json file
 containing version information and SHA256 checksums for all template files.
+With --archive, it also packs the templates into a tar.gz written outside
+the package, so the wheel never carries a second copy of them. With
+--archive-url, the manifest advertises where that archive is published,
+so clients with many changed files can update in a single request.
 
 Usage:
-    python scripts/generate_manifest.py <version>
+    python scripts/generate_manifest.py <version> [--archive PATH [--archive-url URL]]
 
 Example:
-    python scripts/generate_manifest.py 1.0.0
+    python scripts/generate_manifest.py 1.0.0 --archive dist/templates.tar.gz \\
+        --archive-url https://example.com/releases/templates-v1.0.0/templates.tar.gz
 """
 
+import argparse
+import gzip
 import hashlib
+import io
 import json
 import sys
+import tarfile
 from pathlib import Path
 
+ARCHIVE_NAME = "templates.tar.gz"
+
+# Generated files, never listed as templates
+EXCLUDED_FILES = {"manifest.json", "templates.pack", ARCHIVE_NAME}
+
 
 def generate_manifest(templates_dir: Path, version: str) -> dict:
     """Generate manifest from templates directory.
@@ -30,7 +44,7 @@ def generate_manifest(templates_dir: Path, version: str) -> dict:
     templates = {}
 
     for file_path in sorted(templates_dir.rglob("*")):
-        if file_path.is_file() and file_path.name != "manifest.json":
+        if file_path.is_file() and file_path.name not in EXCLUDED_FILES:
             rel_path = file_path.relative_to(templates_dir).as_posix()
             content = file_path.read_bytes()
             checksum = hashlib.sha256(content).hexdigest()
@@ -42,13 +56,54 @@ def generate_manifest(templates_dir: Path, version: str) -> dict:
     }
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/generate_manifest.py <version>")
-        print("Example: python scripts/generate_manifest.py 1.0.0")
-        sys.exit(1)
+def build_archive(templates_dir: Path, manifest: dict, dest: Path) -> str:
+    """Pack the manifest and its templates into a reproducible tar.gz.
+
+    Timestamps and ownership are fixed, so unchanged templates always give
+    a byte-identical archive. The manifest comes first, so the archive can
+    be used on its own as an offline update source:
 
-    version = sys.argv[1]
+        tdd-llm update --source path/to/templates.tar.gz
+
+    Args:
+        templates_dir: Path to templates directory.
+        manifest: Manifest with version and templates (relative path -> checksum).
+        dest: Archive path to write.
+
+    Returns:
+        SHA256 checksum of the archive.
+    """
+    entries = [("manifest.json", json.dumps(manifest, indent=2, sort_keys=True).encode())]
+    for rel_path in sorted(manifest["templates"]):
+        entries.append((rel_path, (templates_dir / rel_path).read_bytes()))
+
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gz:
+        with tarfile.open(fileobj=gz, mode="w", format=tarfile.PAX_FORMAT) as tar:
+            for rel_path, content in entries:
+                info = tarfile.TarInfo(rel_path)
+                info.size = len(content)
+                info.mode = 0o644
+                tar.addfile(info, io.BytesIO(content))
+
+    data = buffer.getvalue()
+    dest.write_bytes(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("version", help="Version string for the manifest")
+    parser.add_argument(
+        "--archive", type=Path, metavar="PATH", help="Also pack the templates into this tar.gz"
+    )
+    parser.add_argument(
+        "--archive-url", metavar="URL", help="Where the archive is published, for the manifest"
+    )
+    args = parser.parse_args()
+
+    if args.archive_url and not args.archive:
+        parser.error("--archive-url requires --archive")
 
     # Find templates directory relative to script location
     script_dir = Path(__file__).parent
@@ -59,7 +114,17 @@ def main():
         print(f"Error: Templates directory not found: {templates_dir}")
         sys.exit(1)
 
-    manifest = generate_manifest(templates_dir, version)
+    if args.archive and args.archive.resolve().is_relative_to(templates_dir.resolve()):
+        print("Error: The archive must be written outside the templates directory")
+        sys.exit(1)
+
+    manifest = generate_manifest(templates_dir, args.version)
+
+    if args.archive:
+        args.archive.parent.mkdir(parents=True, exist_ok=True)
+        checksum = build_archive(templates_dir, manifest, args.archive)
+        if args.archive_url:
+            manifest["archive"] = {"path": args.archive_url, "sha256": checksum}
 
     # Write manifest to templates directory
     manifest_path = templates_dir / "manifest.json"
@@ -67,8 +132,12 @@ def main():
         json.dump(manifest, f, indent=2, sort_keys=True)
 
     print("Generated manifest.json:")
-    print(f"  Version: {version}")
+    print(f"  Version: {args.version}")
     print(f"  Files: {len(manifest['templates'])}")
+    if args.archive:
+        print(f"  Archive: {args.archive}")
+    if "archive" in manifest:
+        print(f"  Archive URL: {manifest['archive']['path']}")
     print(f"  Path: {manifest_path}")
 
 
@@ -4,20 +4,255 @@ Uses local files for state storage:
 - docs/state.json: Global project state (epics, completion)
 - .tdd-state.local.json: Session state (current task, phase)
 - docs/epics/*.md: Epic and task definitions
+- .tdd-cache/epics.idx: Parsed epic and task files, keyed by their stat data
+
+Each public method is a unit of work: it reads the state files at most once
+and writes what it changed once, at the end (see FilesBackend.snapshot).
 """
 
 from __future__ import annotations
 
 import json
+import os
 import re
-from pathlib import Path
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from functools import partial, wraps
+from pathlib import Path, PurePosixPath
+from typing import Any
 
 from .base import Backend, Epic, Task, WorkflowState
+from .markdown import DESCRIPTION, TASK, TITLE, tokenize_epic, tokenize_task
 
 # File paths relative to project root
 STATE_FILE = "docs/state.json"
 LOCAL_STATE_FILE = ".tdd-state.local.json"
 EPICS_DIR = "docs/epics"
+EPIC_INDEX_FILE = ".tdd-cache/epics.idx"
+
+# Bumped when the parsers change, so indexes written by older versions are dropped
+EPIC_INDEX_FORMAT = 3
+# Entries modified this close to the index write may hide a same-tick change
+RACY_WINDOW_NS = 2_000_000_000
+
+# Epic file names: e1-name.md or E1.md, capturing the epic ID
+_EPIC_FILE_PATTERN = re.compile(r"^(e\d+)(?:-[^/]*)?\.md$", re.IGNORECASE)
+
+
+def _parse_epic_markdown(content: str, epic_id: str) -> dict:
+    """Parse an epic markdown file.
+
+    Args:
+        content: File content.
+        epic_id: Epic ID, used as the name when the file has no title.
+
+    Returns:
+        Dict with the epic name, description and the tasks defined inline.
+    """
+    name = epic_id
+    description = ""
+    tasks: list[dict] = []
+
+    for token in tokenize_epic(content):
+        if token.kind == TASK:
+            tasks.append(
+                {
+                    "id": token.task_id,
+                    "title": token.value,
+                    "description": "",
+                    "acceptance_criteria": None,
+                }
+            )
+        elif token.task_id is not None:
+            # Description or acceptance criteria of the last task, named by the token kind
+            tasks[-1][token.kind] = token.value
+        elif token.kind == TITLE:
+            name = token.value
+        elif token.kind == DESCRIPTION:
+            description = token.value
+
+    return {"name": name, "description": description, "tasks": tasks}
+
+
+def _parse_task_markdown(content: str, task_id: str) -> dict:
+    """Parse a task file from an E{N}/ subdirectory.
+
+    Args:
+        content: File content.
+        task_id: Task ID (the file stem), used as the title when the file has none.
+
+    Returns:
+        Task dict.
+    """
+    task = {"id": task_id, "title": task_id, "description": "", "acceptance_criteria": None}
+    for token in tokenize_task(content):
+        # Token kinds (title, description, acceptance_criteria) name the fields they fill
+        task[token.kind] = token.value
+    return task
+
+
+class _EpicIndex:
+    """Parsed epic and task files, keyed by their stat data.
+
+    A file whose size and mtime_ns match its entry is not read or parsed
+    again. As with the template hash cache, entries whose mtime is within
+    RACY_WINDOW_NS of the time the index was written are not trusted, since
+    the file may have changed again within the same mtime tick.
+
+    The entries also give a reverse index from task IDs to the epic files
+    defining them (see task_locations).
+    """
+
+    def __init__(self, project_root: Path):
+        """Load the index of a project.
+
+        Args:
+            project_root: Project root directory.
+        """
+        self.project_root = project_root
+        self.path = project_root / EPIC_INDEX_FILE
+        self.entries: dict[str, list] = {}
+        self.written_ns = 0
+        self.dirty = False
+        # Reverse index, rebuilt from the entries after any of them changes
+        self._task_locations: dict[str, list[tuple[str, str]]] | None = None
+        self._indexed_epics: set[str] = set()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data["format"] == EPIC_INDEX_FORMAT:
+                self.entries = dict(data["files"])
+                self.written_ns = int(data["written_ns"])
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError):
+            self.entries = {}
+
+    def lookup(self, file_path: Path, parse: Callable[[str], Any]) -> Any:
+        """Get the parsed content of a file, parsing it only if it changed.
+
+        Args:
+            file_path: File inside the project.
+            parse: Parser called with the file content on a miss.
+
+        Returns:
+            Parsed data, as returned by parse.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        rel_path = file_path.relative_to(self.project_root).as_posix()
+        stat = os.stat(file_path)
+
+        entry = self.entries.get(rel_path)
+        if (
+            entry
+            and entry[0] == stat.st_size
+            and entry[1] == stat.st_mtime_ns
+            and stat.st_mtime_ns + RACY_WINDOW_NS <= self.written_ns
+        ):
+            return entry[2]
+
+        data = parse(file_path.read_text(encoding="utf-8"))
+        self.entries[rel_path] = [stat.st_size, stat.st_mtime_ns, data]
+        self.dirty = True
+        self._task_locations = None
+        return data
+
+    def indexed_epics(self) -> set[str]:
+        """Get the IDs of the epics whose epic file is indexed."""
+        self.task_locations()
+        return self._indexed_epics
+
+    def task_locations(self) -> dict[str, list[tuple[str, str]]]:
+        """Map task IDs to the epics and files defining them.
+
+        Built from the indexed files as they were last parsed, so callers
+        must check a location before trusting it. Task IDs repeat across
+        epics: each one is listed both bare (T1) and qualified (E1/T1).
+
+        Returns:
+            Task ID -> list of (epic ID, file path relative to the project).
+        """
+        if self._task_locations is not None:
+            return self._task_locations
+
+        locations: dict[str, list[tuple[str, str]]] = {}
+        self._indexed_epics = set()
+        for rel_path, entry in self.entries.items():
+            data = entry[2]
+            path = PurePosixPath(rel_path)
+            if "tasks" in data:
+                # Epic file: e1-name.md, with its inline task sections
+                name_match = _EPIC_FILE_PATTERN.match(path.name)
+                if not name_match:
+                    continue
+                epic_id = name_match.group(1).upper()
+                task_ids = [task["id"] for task in data["tasks"]]
+                self._indexed_epics.add(epic_id)
+            else:
+                # Task file: E1/T2.md
+                epic_id = path.parent.name
+                task_ids = [data["id"]]
+            for task_id in task_ids:
+                locations.setdefault(task_id, []).append((epic_id, rel_path))
+                locations.setdefault(f"{epic_id}/{task_id}", []).append((epic_id, rel_path))
+
+        self._task_locations = locations
+        return locations
+
+    def save(self) -> None:
+        """Write the index if it changed, dropping entries of deleted files.
+
+        The index is only an accelerator: a project directory that cannot be
+        written is read without it.
+        """
+        if not self.dirty:
+            return
+        self.entries = {
+            rel_path: entry
+            for rel_path, entry in self.entries.items()
+            if (self.project_root / rel_path).is_file()
+        }
+        written_ns = time.time_ns()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            ignore_file = self.path.parent / ".gitignore"
+            if not ignore_file.exists():
+                ignore_file.write_text("# Created by tdd-llm\n*\n", encoding="utf-8")
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"format": EPIC_INDEX_FORMAT, "written_ns": written_ns, "files": self.entries},
+                    f,
+                    sort_keys=True,
+                )
+            os.replace(tmp, self.path)
+        except OSError:
+            return
+        self.written_ns = written_ns
+        self.dirty = False
+
+
+@dataclass
+class _StateSnapshot:
+    """State files read during a unit of work, and whether they were changed."""
+
+    state: dict | None = None
+    local_state: dict | None = None
+    state_dirty: bool = False
+    local_state_dirty: bool = False
+
+
+def _unit_of_work(method: Callable) -> Callable:
+    """Run a FilesBackend method inside a snapshot, so nested calls share it."""
+
+    @wraps(method)
+    def wrapper(self: FilesBackend, *args: Any, **kwargs: Any) -> Any:
+        with self.snapshot():
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class FilesBackend:
@@ -30,6 +265,10 @@ class FilesBackend:
             project_root: Project root directory. Defaults to cwd.
         """
         self.project_root = project_root or Path.cwd()
+        self._epic_index: _EpicIndex | None = None
+        # Epic ID -> file map, with the directory mtime and time of the scan
+        self._epic_files_cache: tuple[int, int, dict[str, Path]] | None = None
+        self._snapshot: _StateSnapshot | None = None
 
     @property
     def state_path(self) -> Path:
@@ -46,24 +285,78 @@ class FilesBackend:
         """Path to epics directory."""
         return self.project_root / EPICS_DIR
 
+    @property
+    def epic_index(self) -> _EpicIndex:
+        """Index of parsed epic files, loaded on first use."""
+        if self._epic_index is None:
+            self._epic_index = _EpicIndex(self.project_root)
+        return self._epic_index
+
+    @contextmanager
+    def snapshot(self) -> Iterator[FilesBackend]:
+        """Group backend calls into one read and one write of the state files.
+
+        Inside the block, docs/state.json and .tdd-state.local.json are read
+        once and served from memory, and saves only record the change. On
+        exit, the changed files and the epic index are written once. If the
+        block raises, nothing is written. Snapshots nest: only the outermost
+        one reads and writes.
+
+        Yields:
+            This backend.
+        """
+        if self._snapshot is not None:
+            yield self
+            return
+
+        snapshot = self._snapshot = _StateSnapshot()
+        try:
+            yield self
+        except BaseException:
+            self._snapshot = None
+            raise
+
+        # Write through from here on
+        self._snapshot = None
+        if snapshot.state_dirty and snapshot.state is not None:
+            self._save_state(snapshot.state)
+        if snapshot.local_state_dirty and snapshot.local_state is not None:
+            self._save_local_state(snapshot.local_state)
+        self.epic_index.save()
+
     def _load_state(self) -> dict:
         """Load global state from docs/state.json."""
+        if self._snapshot is not None and self._snapshot.state is not None:
+            return self._snapshot.state
+
         if not self.state_path.exists():
             raise FileNotFoundError(
                 f"Project not initialized. Run '/tdd:init:1-project' first. "
                 f"(Missing: {self.state_path})"
             )
         with open(self.state_path, encoding="utf-8") as f:
-            return json.load(f)
+            state = json.load(f)
+
+        if self._snapshot is not None:
+            self._snapshot.state = state
+        return state
 
     def _save_state(self, state: dict) -> None:
         """Save global state to docs/state.json."""
+        if self._snapshot is not None:
+            self._snapshot.state = state
+            self._snapshot.state_dirty = True
+            return
+
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.state_path, "w", encoding="utf-8") as f:
             json.dump(state, f, indent=2)
 
     def _load_local_state(self) -> dict:
         """Load local session state from .tdd-state.local.json."""
+        if self._snapshot is not None and self._snapshot.local_state is not None:
+            return self._snapshot.local_state
+
         if not self.local_state_path.exists():
             # Create default local state
             state = self._load_state()
@@ -80,33 +373,64 @@ class FilesBackend:
             return local_state
 
         with open(self.local_state_path, encoding="utf-8") as f:
-            return json.load(f)
+            local_state = json.load(f)
+
+        if self._snapshot is not None:
+            self._snapshot.local_state = local_state
+        return local_state
 
     def _save_local_state(self, state: dict) -> None:
         """Save local session state to .tdd-state.local.json."""
+        if self._snapshot is not None:
+            self._snapshot.local_state = state
+            self._snapshot.local_state_dirty = True
+            return
+
         with open(self.local_state_path, "w", encoding="utf-8") as f:
             json.dump(state, f, indent=2)
 
     def _find_epic_file(self, epic_id: str) -> Path | None:
         """Find the markdown file for an epic.
 
-        Looks for files matching pattern: e{n}-*.md or E{n}.md
+        Looks for files named e{n}-*.md or E{n}.md, matching the epic number
+        exactly (E1 never resolves to e10-*.md).
         """
-        if not self.epics_dir.exists():
-            return None
+        return self._epic_files().get(epic_id.upper())
 
-        # Normalize epic_id (E1 -> e1)
-        epic_lower = epic_id.lower()
+    def _epic_files(self) -> dict[str, Path]:
+        """Map epic IDs to their files, rescanning only when the directory changes.
 
-        for file in self.epics_dir.glob("*.md"):
-            # Match e1-name.md or e1.md
-            if file.stem.lower().startswith(epic_lower):
-                return file
+        As with the epic index, a scan of a directory modified within
+        RACY_WINDOW_NS of the scan is not reused, since a file may have been
+        added within the same mtime tick.
 
-        return None
+        Returns:
+            Upper-case epic ID (e.g., 'E1') -> epic file path.
+        """
+        try:
+            mtime_ns = os.stat(self.epics_dir).st_mtime_ns
+        except OSError:
+            self._epic_files_cache = None
+            return {}
+
+        cached = self._epic_files_cache
+        if cached is not None and cached[0] == mtime_ns and mtime_ns + RACY_WINDOW_NS <= cached[1]:
+            return cached[2]
+
+        scanned_ns = time.time_ns()
+        epic_files: dict[str, Path] = {}
+        with os.scandir(self.epics_dir) as entries:
+            # Sorted so that duplicates (e1.md and e1-setup.md) resolve the same way every time
+            for entry in sorted(entries, key=lambda e: e.name):
+                match = _EPIC_FILE_PATTERN.match(entry.name)
+                if match and entry.is_file():
+                    epic_files.setdefault(match.group(1).upper(), Path(entry.path))
+
+        self._epic_files_cache = (mtime_ns, scanned_ns, epic_files)
+        return epic_files
 
     def _parse_epic_file(self, epic_id: str) -> tuple[str, str, list[dict]]:
-        """Parse an epic markdown file.
+        """Parse an epic markdown file, through the epic index.
 
         Returns:
             Tuple of (name, description, tasks_list).
@@ -115,51 +439,13 @@ class FilesBackend:
         if not file_path:
             raise KeyError(f"Epic file not found for {epic_id}")
 
-        content = file_path.read_text(encoding="utf-8")
-
-        # Parse title: # E{N}: {Name} or # E{N} - {Name}
-        title_match = re.search(r"^#\s+E\d+[:\-]\s*(.+)$", content, re.MULTILINE)
-        name = title_match.group(1).strip() if title_match else epic_id
-
-        # Parse description (text between title and first ## section)
-        desc_match = re.search(
-            r"^#\s+E\d+[:\-].+?\n\n(.+?)(?=\n##|\Z)", content, re.DOTALL | re.MULTILINE
-        )
-        description = desc_match.group(1).strip() if desc_match else ""
-
-        # Parse task sections: ## T{N}: {Title} or ### T{N}: {Title}
-        tasks = []
-        task_pattern = re.compile(
-            r"^#{2,3}\s+(T\d+):\s*(.+?)$\n\n(.+?)(?=\n#{2,3}\s+T\d+:|\n#{2,3}\s+Completion|\n#{2,3}\s+Estimation|\Z)",
-            re.MULTILINE | re.DOTALL,
-        )
-
-        for match in task_pattern.finditer(content):
-            task_id = match.group(1)
-            task_title = match.group(2).strip()
-            task_desc = match.group(3).strip()
-
-            # Try to extract acceptance criteria if in task description
-            ac_match = re.search(
-                r"\*\*Acceptance criteria:?\*\*\s*\n(.+?)(?=\n\*\*|\Z)",
-                task_desc,
-                re.DOTALL | re.IGNORECASE,
-            )
-            acceptance_criteria = ac_match.group(1).strip() if ac_match else None
-
-            tasks.append(
-                {
-                    "id": task_id,
-                    "title": task_title,
-                    "description": task_desc,
-                    "acceptance_criteria": acceptance_criteria,
-                }
-            )
+        parsed = self.epic_index.lookup(file_path, partial(_parse_epic_markdown, epic_id=epic_id))
+        tasks = list(parsed["tasks"])
 
         # Also look for task files in E{N}/ subdirectory
         tasks.extend(self._parse_task_files(epic_id))
 
-        return name, description, tasks
+        return parsed["name"], parsed["description"], tasks
 
     def _parse_task_files(self, epic_id: str) -> list[dict]:
         """Parse task files from E{N}/ subdirectory.
@@ -183,33 +469,8 @@ class FilesBackend:
                 continue
 
             task_id = task_file.stem  # e.g., "T1"
-            content = task_file.read_text(encoding="utf-8")
-
-            # Parse title: # [E{N}] T{M} - {Title} or # T{M}: {Title}
-            title_match = re.search(
-                r"^#\s+(?:\[E\d+\]\s+)?T\d+\s*[:\-]\s*(.+)$", content, re.MULTILINE
-            )
-            task_title = title_match.group(1).strip() if title_match else task_id
-
-            # Description is everything after the title
-            desc_match = re.search(r"^#\s+.+?\n\n(.+)", content, re.DOTALL | re.MULTILINE)
-            task_desc = desc_match.group(1).strip() if desc_match else ""
-
-            # Try to extract acceptance criteria
-            ac_match = re.search(
-                r"\*\*Acceptance criteria:?\*\*\s*\n(.+?)(?=\n\*\*|\Z)",
-                task_desc,
-                re.DOTALL | re.IGNORECASE,
-            )
-            acceptance_criteria = ac_match.group(1).strip() if ac_match else None
-
             tasks.append(
-                {
-                    "id": task_id,
-                    "title": task_title,
-                    "description": task_desc,
-                    "acceptance_criteria": acceptance_criteria,
-                }
+                self.epic_index.lookup(task_file, partial(_parse_task_markdown, task_id=task_id))
             )
 
         return tasks
@@ -224,11 +485,28 @@ class FilesBackend:
         epic_state = state.get("epics", {}).get(epic_id, {})
         return epic_state.get("completed", [])
 
+    @_unit_of_work
     def get_epic(self, epic_id: str) -> Epic:
         """Get an epic by ID."""
         state = self._load_state()
         local_state = self._load_local_state()
 
+        return self._build_epic(epic_id, state, local_state)
+
+    def _build_epic(self, epic_id: str, state: dict, local_state: dict) -> Epic:
+        """Build an epic from its file and already loaded state.
+
+        Args:
+            epic_id: Epic ID.
+            state: Global state.
+            local_state: Local session state.
+
+        Returns:
+            Epic with task statuses.
+
+        Raises:
+            KeyError: If the epic file is not found.
+        """
         name, description, task_dicts = self._parse_epic_file(epic_id)
         completed_tasks = self._get_completed_tasks(epic_id, state)
 
@@ -273,15 +551,20 @@ class FilesBackend:
             tasks=tasks,
         )
 
+    @_unit_of_work
     def list_epics(self, status: str | None = None) -> list[Epic]:
         """List all epics, optionally filtered by status."""
         state = self._load_state()
-        epic_ids = list(state.get("epics", {}).keys())
+        local_state = self._load_local_state()
+
+        return self._build_epics(state, local_state, status)
 
+    def _build_epics(self, state: dict, local_state: dict, status: str | None = None) -> list[Epic]:
+        """Build every epic of the state that has a file, optionally filtered by status."""
         epics = []
-        for epic_id in epic_ids:
+        for epic_id in state.get("epics", {}):
             try:
-                epic = self.get_epic(epic_id)
+                epic = self._build_epic(epic_id, state, local_state)
                 if status is None or epic.status == status:
                     epics.append(epic)
             except KeyError:
@@ -290,11 +573,13 @@ class FilesBackend:
 
         return epics
 
+    @_unit_of_work
     def get_task(self, task_id: str) -> Task:
         """Get a task by ID.
 
-        Note: For files backend, task_id alone is not unique.
-        We search through all epics to find the task.
+        Note: For files backend, task_id alone is not unique. The current
+        task wins, then the first epic of state.json defining it. An
+        'E1/T2' ID names the epic explicitly.
         """
         state = self._load_state()
         local_state = self._load_local_state()
@@ -304,23 +589,45 @@ class FilesBackend:
         current_task_id = local_state.get("current", {}).get("task")
 
         if task_id == current_task_id and current_epic_id:
-            epic = self.get_epic(current_epic_id)
-            for task in epic.tasks:
-                if task.id == task_id:
-                    return task
+            task = self._find_task(current_epic_id, task_id, state, local_state)
+            if task is not None:
+                return task
+
+        epic_ids = list(state.get("epics", {}))
+        bare_id = task_id
+        if "/" in task_id:
+            qualified_epic, bare_id = task_id.split("/", 1)
+            epic_ids = [epic_id for epic_id in epic_ids if epic_id == qualified_epic]
+
+        # Bring the reverse index up to date first: files unchanged since they
+        # were indexed cost a stat, edited ones are parsed again
+        indexed = self.epic_index.indexed_epics()
+        for epic_id in epic_ids:
+            if epic_id in indexed:
+                with suppress(KeyError, OSError):
+                    self._parse_epic_file(epic_id)
 
-        # Search all epics
-        for epic_id in state.get("epics", {}).keys():
-            try:
-                epic = self.get_epic(epic_id)
-                for task in epic.tasks:
-                    if task.id == task_id:
-                        return task
-            except KeyError:
+        # Only read the epics the reverse index places the task in, and those
+        # not indexed yet, so the first epic in state order still wins
+        located = {epic_id for epic_id, _ in self.epic_index.task_locations().get(task_id, [])}
+        for epic_id in epic_ids:
+            if epic_id in indexed and epic_id not in located:
                 continue
+            task = self._find_task(epic_id, bare_id, state, local_state)
+            if task is not None:
+                return task
 
         raise KeyError(f"Task not found: {task_id}")
 
+    def _find_task(self, epic_id: str, task_id: str, state: dict, local_state: dict) -> Task | None:
+        """Find a task in an epic, None if the epic or the task does not exist."""
+        try:
+            epic = self._build_epic(epic_id, state, local_state)
+        except KeyError:
+            return None
+        return next((task for task in epic.tasks if task.id == task_id), None)
+
+    @_unit_of_work
     def get_next_task(self, epic_id: str) -> Task | None:
         """Get the next incomplete task in an epic.
 
@@ -329,6 +636,7 @@ class FilesBackend:
         epic = self.get_epic(epic_id)
         return next((task for task in epic.tasks if task.status != "completed"), None)
 
+    @_unit_of_work
     def update_task_status(self, task_id: str, status: str) -> None:
         """Update a task's status."""
         state = self._load_state()
@@ -364,9 +672,10 @@ class FilesBackend:
             self._save_state(state)
             self._save_local_state(local_state)
 
+    @_unit_of_work
     def get_state(self) -> WorkflowState:
         """Get the current workflow state."""
-        self._load_state()  # Validate state file exists
+        state = self._load_state()
         local_state = self._load_local_state()
 
         current_epic_id = local_state.get("current", {}).get("epic")
@@ -377,7 +686,7 @@ class FilesBackend:
 
         if current_epic_id:
             try:
-                current_epic = self.get_epic(current_epic_id)
+                current_epic = self._build_epic(current_epic_id, state, local_state)
                 if current_task_id:
                     for task in current_epic.tasks:
                         if task.id == current_task_id:
@@ -386,7 +695,7 @@ class FilesBackend:
             except KeyError:
                 pass
 
-        epics = self.list_epics()
+        epics = self._build_epics(state, local_state)
 
         return WorkflowState(
             backend="files",
@@ -395,6 +704,7 @@ class FilesBackend:
             epics=epics,
         )
 
+    @_unit_of_work
     def set_phase(self, task_id: str, phase: str) -> None:
         """Set the TDD phase for a task."""
         local_state = self._load_local_state()
@@ -406,6 +716,7 @@ class FilesBackend:
         local_state["current"]["phase"] = phase
         self._save_local_state(local_state)
 
+    @_unit_of_work
     def set_current_task(self, epic_id: str, task_id: str | None) -> None:
         """Set the current active task."""
         state = self._load_state()
@@ -469,6 +780,7 @@ class FilesBackend:
         slug = slug.strip("-")
         return slug[:50]  # Limit length
 
+    @_unit_of_work
     def create_epic(
         self,
         name: str,
@@ -524,6 +836,7 @@ class FilesBackend:
             tasks=[],
         )
 
+    @_unit_of_work
     def create_task(
         self,
         epic_id: str,
@@ -574,6 +887,8 @@ class FilesBackend:
 
         # Write updated content
         file_path.write_text(content, encoding="utf-8")
+        # Index it now, so the reverse index already knows the new task
+        self.epic_index.lookup(file_path, partial(_parse_epic_markdown, epic_id=epic_id))
 
         return Task(
             id=task_id,
@@ -22,8 +22,6 @@ from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import httpx
-
 if TYPE_CHECKING:
     from .client import JiraConfig
 
@@ -34,6 +32,7 @@ except ImportError:
     Fernet = None  # type: ignore
     InvalidToken = Exception  # type: ignore
 
+from ...http_client import get_shared_client, send_with_retry
 from ...paths import get_config_dir
 
 # OAuth constants for Atlassian
@@ -512,28 +511,29 @@ class JiraOAuthFlow:
         Raises:
             OAuthError: If token exchange fails.
         """
-        with httpx.Client() as client:
-            response = client.post(
-                ATLASSIAN_TOKEN_URL,
-                data={
-                    "grant_type": "authorization_code",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "code": code,
-                    "redirect_uri": redirect_uri,
-                },
-            )
+        response = send_with_retry(
+            get_shared_client(),
+            "POST",
+            ATLASSIAN_TOKEN_URL,
+            data={
+                "grant_type": "authorization_code",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "code": code,
+                "redirect_uri": redirect_uri,
+            },
+        )
 
-            if response.status_code != 200:
-                error = response.json().get("error_description", response.text)
-                raise OAuthError(f"Token exchange failed: {error}")
+        if response.status_code != 200:
+            error = response.json().get("error_description", response.text)
+            raise OAuthError(f"Token exchange failed: {error}")
 
-            data = response.json()
-            return (
-                data["access_token"],
-                data["refresh_token"],
-                data.get("expires_in", 3600),
-            )
+        data = response.json()
+        return (
+            data["access_token"],
+            data["refresh_token"],
+            data.get("expires_in", 3600),
+        )
 
     def refresh_access_token(self, refresh_token: str) -> tuple[str, str, int]:
         """Refresh expired access token.
@@ -547,30 +547,31 @@ class JiraOAuthFlow:
         Raises:
             OAuthTokenError: If refresh fails (token expired or revoked).
         """
-        with httpx.Client() as client:
-            response = client.post(
-                ATLASSIAN_TOKEN_URL,
-                data={
-                    "grant_type": "refresh_token",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "refresh_token": refresh_token,
-                },
-            )
-
-            if response.status_code != 200:
-                error = response.json().get("error_description", response.text)
-                raise OAuthTokenError(
-                    f"Token refresh failed: {error}. Please run 'tdd-llm jira login' again."
-                )
+        response = send_with_retry(
+            get_shared_client(),
+            "POST",
+            ATLASSIAN_TOKEN_URL,
+            data={
+                "grant_type": "refresh_token",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": refresh_token,
+            },
+        )
 
-            data = response.json()
-            return (
-                data["access_token"],
-                data.get("refresh_token", refresh_token),  # May not always be returned
-                data.get("expires_in", 3600),
+        if response.status_code != 200:
+            error = response.json().get("error_description", response.text)
+            raise OAuthTokenError(
+                f"Token refresh failed: {error}. Please run 'tdd-llm jira login' again."
             )
 
+        data = response.json()
+        return (
+            data["access_token"],
+            data.get("refresh_token", refresh_token),  # May not always be returned
+            data.get("expires_in", 3600),
+        )
+
     def get_accessible_resources(self, access_token: str) -> list[dict]:
         """Get list of Atlassian sites accessible with this token.
 
@@ -580,16 +581,17 @@ class JiraOAuthFlow:
         Returns:
             List of accessible resources with 'id', 'url', 'name' keys.
         """
-        with httpx.Client() as client:
-            response = client.get(
-                ATLASSIAN_RESOURCES_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
+        response = send_with_retry(
+            get_shared_client(),
+            "GET",
+            ATLASSIAN_RESOURCES_URL,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
 
-            if response.status_code != 200:
-                raise OAuthError(f"Failed to get accessible resources: {response.text}")
+        if response.status_code != 200:
+            raise OAuthError(f"Failed to get accessible resources: {response.text}")
 
-            return response.json()
+        return response.json()
 
 
 class JiraAuthManager:
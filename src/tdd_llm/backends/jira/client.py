@@ -7,10 +7,15 @@ from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from ...http_client import get_shared_client, send_with_retry
+
 if TYPE_CHECKING:
     from ...config import JiraConfig
     from .auth import JiraAuthManager
 
+# Headers sent with every REST API request
+API_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
+
 
 class JiraAPIError(Exception):
     """Error from Jira API."""
@@ -317,8 +322,11 @@ class JiraClient:
     def _ensure_client(self) -> httpx.Client:
         """Ensure HTTP client is initialized.
 
+        The process-wide client is used, so API calls reuse the connections
+        opened by the OAuth flow (and by other JiraClient instances).
+
         Returns:
-            Configured httpx.Client.
+            Shared httpx.Client.
 
         Raises:
             ValueError: If not properly configured.
@@ -342,14 +350,7 @@ class JiraClient:
             base_url = self.config.effective_base_url.rstrip("/")
 
         self._base_url = f"{base_url}/rest/api/3"
-        self._client = httpx.Client(
-            base_url=self._base_url,
-            headers={
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
+        self._client = get_shared_client()
         return self._client
 
     def _request(
@@ -375,10 +376,11 @@ class JiraClient:
         auth_header = auth_manager.get_auth_header()
 
         # Merge headers
-        headers = kwargs.pop("headers", {})
+        headers = {**API_HEADERS, **kwargs.pop("headers", {})}
         headers.update(auth_header)
 
-        response = client.request(method, path, headers=headers, **kwargs)
+        url = f"{self._base_url}{path}"
+        response = send_with_retry(client, method, url, headers=headers, **kwargs)
 
         # Handle 401 by refreshing token and retrying (OAuth only)
         if response.status_code == 401 and auth_manager.has_valid_tokens():
@@ -386,17 +388,15 @@ class JiraClient:
                 auth_manager.ensure_valid_token(force_refresh=True)
                 auth_header = auth_manager.get_auth_header()
                 headers.update(auth_header)
-                response = client.request(method, path, headers=headers, **kwargs)
+                response = send_with_retry(client, method, url, headers=headers, **kwargs)
             except Exception:
                 pass  # Let the original 401 propagate
 
         return response
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        """Release the HTTP client (the shared pool stays open for other users)."""
+        self._client = None
 
     def __enter__(self) -> JiraClient:
         return self
@@ -507,7 +507,8 @@ class JiraClient:
         if next_page_token:
             payload["nextPageToken"] = next_page_token
 
-        response = self._request("POST", "/search/jql", json=payload)
+        # A search changes nothing, so throttled attempts are safe to replay
+        response = self._request("POST", "/search/jql", json=payload, retry_non_idempotent=True)
         data = self._handle_response(response)
         issues = data.get("issues", [])  # type: ignore
         next_token = data.get("nextPageToken")  # type: ignore
@@ -0,0 +1,205 @@
+"""Single-pass tokenizer for epic and task markdown files.
+
+The files backend reads epics and tasks from markdown laid out like this:
+
+    # E1: Name                      <- title
+
+    Epic description.               <- description
+
+    ## T1: Task title               <- task
+
+    Task description.               <- description of T1
+
+    **Acceptance criteria:**
+    - Criterion                     <- acceptance criteria of T1
+
+    ## Completion criteria          <- ends the task sections
+
+Task files in docs/epics/E{N}/ hold a single task: a "# T1: Title" (or
+"# [E1] T1 - Title") heading, then its description.
+
+Heading lines are found with one regex scan of the content, and the text
+between them is sliced by offset, so parsing is linear in the size of the
+file however many tasks it holds. Each token records where its value sits
+in the content, as character offsets into the decoded str (not byte
+offsets into the file).
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+# Token kinds
+TITLE = "title"
+DESCRIPTION = "description"
+TASK = "task"
+ACCEPTANCE_CRITERIA = "acceptance_criteria"
+
+# Level 1 to 3 headings: "#"s, then the heading text
+_HEADING_PATTERN = re.compile(r"^(#{1,3})[ \t]+(.*)$", re.MULTILINE)
+# Epic title heading text: E{N}: {Name} or E{N} - {Name}
+_EPIC_TITLE_PATTERN = re.compile(r"E\d+[:\-][ \t]*(.*)")
+# Task file title heading text: [E{N}] T{M} - {Title} or T{M}: {Title}
+_TASK_TITLE_PATTERN = re.compile(r"(?:\[E\d+\][ \t]+)?T\d+[ \t]*[:\-][ \t]*(.*)")
+# Task section heading text: T{N}: {Title}
+_TASK_HEADING_PATTERN = re.compile(r"(T\d+):[ \t]*(.*)")
+# Headings that close a task section without opening one
+_SECTION_END_PREFIXES = ("Completion", "Estimation")
+_ACCEPTANCE_CRITERIA_PATTERN = re.compile(r"\*\*Acceptance criteria:?\*\*[ \t]*\n", re.IGNORECASE)
+
+
+@dataclass
+class Token:
+    """A section of a markdown file."""
+
+    kind: str
+    """TITLE, DESCRIPTION, TASK or ACCEPTANCE_CRITERIA."""
+
+    start: int
+    """Character offset of the first character of the value in the content."""
+
+    end: int
+    """Character offset just past the last character of the value."""
+
+    value: str
+    """Stripped text: the heading text for TITLE and TASK, the body otherwise."""
+
+    task_id: str | None = None
+    """Task the token belongs to, for TASK tokens and the sections inside a task."""
+
+
+def _token(kind: str, content: str, start: int, end: int, task_id: str | None = None) -> Token:
+    """Build a token for content[start:end], with surrounding whitespace trimmed."""
+    raw = content[start:end]
+    value = raw.strip()
+    if value:
+        start += len(raw) - len(raw.lstrip())
+    return Token(kind, start, start + len(value), value, task_id)
+
+
+def _after_blank_line(content: str, heading_end: int) -> int | None:
+    """Find where the body after a heading starts: past the first blank line."""
+    blank = content.find("\n\n", heading_end)
+    return blank + 2 if blank >= 0 else None
+
+
+def _acceptance_criteria(content: str, start: int, end: int, task_id: str | None) -> Token | None:
+    """Find the acceptance criteria block of a description.
+
+    The block follows a "**Acceptance criteria:**" line and runs until the
+    next line starting with "**" or the end of the description.
+    """
+    marker = _ACCEPTANCE_CRITERIA_PATTERN.search(content, start, end)
+    if marker is None:
+        return None
+    block_end = content.find("\n**", marker.end(), end)
+    token = _token(
+        ACCEPTANCE_CRITERIA, content, marker.end(), end if block_end < 0 else block_end, task_id
+    )
+    return token if token.value else None
+
+
+def tokenize_epic(content: str) -> Iterator[Token]:
+    """Tokenize an epic markdown file.
+
+    Yields the epic TITLE (when not empty) and DESCRIPTION (when present),
+    then for each task section a TASK token (value: task title), its
+    DESCRIPTION and, when present, its ACCEPTANCE_CRITERIA, all tagged with
+    the task ID.
+
+    Args:
+        content: File content.
+
+    Yields:
+        Tokens in document order.
+    """
+    title_seen = False
+    # Task whose section is still open: (task ID, offset where its body starts)
+    open_task: tuple[str, int] | None = None
+
+    for heading in _HEADING_PATTERN.finditer(content):
+        level = len(heading.group(1))
+        text = heading.group(2)
+
+        if level == 1:
+            if title_seen:
+                continue
+            title_match = _EPIC_TITLE_PATTERN.match(text)
+            if not title_match:
+                continue
+            title_seen = True
+            title = _token(TITLE, content, heading.start(2) + title_match.start(1), heading.end())
+            # "# E1:" with nothing after it has no title, so callers fall back to the ID
+            if title.value:
+                yield title
+            body_start = _after_blank_line(content, heading.end())
+            if body_start is not None:
+                next_section = content.find("\n##", body_start)
+                body_end = len(content) if next_section < 0 else next_section
+                yield _token(DESCRIPTION, content, body_start, body_end)
+            continue
+
+        task_match = _TASK_HEADING_PATTERN.match(text)
+        if not task_match and not text.startswith(_SECTION_END_PREFIXES):
+            # Other level 2-3 headings belong to the current section
+            continue
+
+        if open_task is not None:
+            yield from _task_body(content, open_task[0], open_task[1], heading.start())
+            open_task = None
+
+        if task_match and task_match.group(2).strip():
+            task_id = task_match.group(1)
+            yield _token(
+                TASK, content, heading.start(2) + task_match.start(2), heading.end(), task_id
+            )
+            open_task = (task_id, heading.end())
+
+    if open_task is not None:
+        yield from _task_body(content, open_task[0], open_task[1], len(content))
+
+
+def _task_body(content: str, task_id: str, start: int, end: int) -> Iterator[Token]:
+    """Yield the DESCRIPTION and ACCEPTANCE_CRITERIA tokens of a task section."""
+    description = _token(DESCRIPTION, content, start, end, task_id)
+    yield description
+    criteria = _acceptance_criteria(content, description.start, description.end, task_id)
+    if criteria is not None:
+        yield criteria
+
+
+def tokenize_task(content: str) -> Iterator[Token]:
+    """Tokenize a task file.
+
+    Yields the task TITLE, its DESCRIPTION (everything after the first
+    heading) and its ACCEPTANCE_CRITERIA, each only when present.
+
+    Args:
+        content: File content.
+
+    Yields:
+        Tokens.
+    """
+    first_heading = None
+    for heading in _HEADING_PATTERN.finditer(content):
+        if len(heading.group(1)) != 1:
+            continue
+        if first_heading is None:
+            first_heading = heading
+        title_match = _TASK_TITLE_PATTERN.match(heading.group(2))
+        if title_match and title_match.group(1).strip():
+            yield _token(TITLE, content, heading.start(2) + title_match.start(1), heading.end())
+            break
+
+    if first_heading is None:
+        return
+    body_start = _after_blank_line(content, first_heading.end())
+    if body_start is None:
+        return
+    description = _token(DESCRIPTION, content, body_start, len(content))
+    yield description
+    criteria = _acceptance_criteria(content, description.start, description.end, None)
+    if criteria is not None:
+        yield criteria
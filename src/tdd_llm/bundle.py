@@ -0,0 +1,469 @@
+"""Packed template bundles.
+
+A bundle stores many template files in a single file so they can be read
+with one open() instead of walking and reading the loose templates tree.
+The package ships one next to its templates, and `tdd-llm update` writes
+one into the templates cache, which is memory-mapped on use.
+
+While the cache bundle exists it is the source of cached templates: the
+loose files beside it are only what it was packed from, so editing them by
+hand has no effect on deploys.
+
+Format: a single line of JSON header followed by the concatenated UTF-8
+bodies. The header maps each relative path to an [offset, length] pair,
+with offsets counted from the first byte after the header line, and may
+record the SHA-256 of the manifest.json the bundle was built against:
+
+    {"format": 1, "version": "1.0.0", "manifest": "<sha256>",
+     "files": {"commands/a.md": [0, 42]}}\\n
+    <body bytes...>
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+from collections.abc import Iterable
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .paths import get_templates_cache_dir
+
+if TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
+
+# Bundle file name, inside the package templates directory and the cache
+BUNDLE_NAME = "templates.pack"
+BUNDLE_FORMAT = 1
+
+# Files never packed into a bundle: manifest and update archive are metadata
+EXCLUDED_FILES = {"manifest.json", "templates.tar.gz", BUNDLE_NAME}
+
+# Project file marking a source checkout, relative to the package templates
+SOURCE_CHECKOUT_MARKER = Path("..", "..", "..", "pyproject.toml")
+
+
+class TemplateBundle:
+    """Read-only view over a packed template bundle."""
+
+    def __init__(
+        self,
+        data: bytes | memoryview,
+        index: dict[str, tuple[int, int]],
+        version: str | None,
+        manifest_checksum: str | None = None,
+    ):
+        """Initialize the bundle.
+
+        Args:
+            data: Concatenated file bodies (bytes, or a view over a mapped file).
+            index: Relative path -> (offset, length) into data.
+            version: Template version recorded when the bundle was built.
+            manifest_checksum: SHA-256 of the manifest.json the bundle was built
+                against, if recorded.
+        """
+        self._data = data
+        self.index = index
+        self.version = version
+        self.manifest_checksum = manifest_checksum
+        # Memory map behind data, closed by close()
+        self._mapped: mmap.mmap | None = None
+
+    @classmethod
+    def from_bytes(cls, raw: bytes | mmap.mmap) -> TemplateBundle:
+        """Parse a bundle from its serialized bytes.
+
+        The bodies are not copied: they stay a view over raw.
+
+        Args:
+            raw: Full bundle contents, as bytes or a memory map.
+
+        Returns:
+            TemplateBundle instance.
+
+        Raises:
+            ValueError: If the data is not a valid bundle.
+        """
+        header_end = raw.find(b"\n")
+        if header_end < 0:
+            raise ValueError("Bundle header not found")
+
+        try:
+            header = json.loads(raw[:header_end])
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid bundle header: {e}") from e
+
+        if not isinstance(header, dict) or header.get("format") != BUNDLE_FORMAT:
+            raise ValueError("Unsupported bundle format")
+
+        index = {path: (offset, length) for path, (offset, length) in header["files"].items()}
+        return cls(
+            memoryview(raw)[header_end + 1 :],
+            index,
+            header.get("version"),
+            header.get("manifest"),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> TemplateBundle | None:
+        """Load a bundle file.
+
+        Args:
+            path: Path to the bundle file.
+
+        Returns:
+            TemplateBundle, or None if the file is missing or invalid.
+        """
+        try:
+            return cls.from_bytes(path.read_bytes())
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @classmethod
+    def open_mapped(cls, path: Path) -> TemplateBundle | None:
+        """Memory-map a bundle file.
+
+        File bodies are sliced out of the mapping on demand, so reading a
+        template only touches its own pages.
+
+        Args:
+            path: Path to the bundle file.
+
+        Returns:
+            TemplateBundle, or None if the file is missing or invalid.
+        """
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # ValueError: empty files cannot be mapped
+            return None
+
+        try:
+            bundle = cls.from_bytes(mapped)
+        except (ValueError, KeyError, TypeError):
+            mapped.close()
+            return None
+        bundle._mapped = mapped
+        return bundle
+
+    def close(self) -> None:
+        """Release the memory map behind the bundle, if any.
+
+        A mapped file cannot be replaced or deleted on Windows while it is
+        open. The bundle is empty once closed: reads return None.
+        """
+        if isinstance(self._data, memoryview):
+            self._data.release()
+        self._data = b""
+        self.index = {}
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+
+    def __contains__(self, rel_path: str) -> bool:
+        return rel_path in self.index
+
+    def read_bytes(self, rel_path: str) -> bytes | None:
+        """Read a file from the bundle as bytes.
+
+        Args:
+            rel_path: POSIX path relative to the templates directory.
+
+        Returns:
+            File content, or None if not in the bundle.
+        """
+        entry = self.index.get(rel_path)
+        if entry is None:
+            return None
+        offset, length = entry
+        return bytes(self._data[offset : offset + length])
+
+    def read_text(self, rel_path: str) -> str | None:
+        """Read a file from the bundle.
+
+        Args:
+            rel_path: POSIX path relative to the templates directory.
+
+        Returns:
+            File content, or None if not in the bundle.
+        """
+        entry = self.index.get(rel_path)
+        if entry is None:
+            return None
+        offset, length = entry
+        return str(self._data[offset : offset + length], "utf-8")
+
+    def files(self, prefix: str) -> list[str]:
+        """List files under a directory, recursively.
+
+        Args:
+            prefix: POSIX directory path relative to the templates directory.
+
+        Returns:
+            Sorted paths relative to prefix.
+        """
+        prefix = prefix.rstrip("/") + "/"
+        return sorted(path[len(prefix) :] for path in self.index if path.startswith(prefix))
+
+    def subdirs(self, prefix: str) -> list[str]:
+        """List the immediate subdirectories of a directory.
+
+        Args:
+            prefix: POSIX directory path relative to the templates directory.
+
+        Returns:
+            Sorted subdirectory names.
+        """
+        return sorted({path.split("/")[0] for path in self.files(prefix) if "/" in path})
+
+
+def pack_files(
+    files: dict[str, bytes], version: str | None = None, manifest_checksum: str | None = None
+) -> bytes:
+    """Pack file contents into bundle bytes.
+
+    Args:
+        files: POSIX relative path -> content.
+        version: Template version to record in the header.
+        manifest_checksum: SHA-256 of the matching manifest.json, to record in
+            the header.
+
+    Returns:
+        Serialized bundle.
+    """
+    index: dict[str, list[int]] = {}
+    bodies: list[bytes] = []
+    offset = 0
+
+    for rel_path in sorted(files):
+        body = files[rel_path]
+        index[rel_path] = [offset, len(body)]
+        bodies.append(body)
+        offset += len(body)
+
+    header_fields: dict[str, object] = {"format": BUNDLE_FORMAT, "version": version}
+    if manifest_checksum is not None:
+        header_fields["manifest"] = manifest_checksum
+    header_fields["files"] = index
+    header = json.dumps(header_fields, separators=(",", ":"))
+    return header.encode("utf-8") + b"\n" + b"".join(bodies)
+
+
+def pack_templates(
+    templates_dir: Path, version: str | None = None, manifest_checksum: str | None = None
+) -> bytes:
+    """Pack a templates directory into bundle bytes.
+
+    Args:
+        templates_dir: Templates directory (containing commands/ and placeholders/).
+        version: Template version to record in the header.
+        manifest_checksum: SHA-256 of the matching manifest.json, to record in
+            the header.
+
+    Returns:
+        Serialized bundle.
+    """
+    files: dict[str, bytes] = {}
+    for file_path in templates_dir.rglob("*"):
+        # Hidden files hold cache metadata and temporary files, not templates
+        name = file_path.name
+        if not file_path.is_file() or name in EXCLUDED_FILES or name.startswith("."):
+            continue
+        files[file_path.relative_to(templates_dir).as_posix()] = file_path.read_bytes()
+
+    return pack_files(files, version, manifest_checksum)
+
+
+def _replace_bundle(dest: Path, raw: bytes) -> None:
+    """Write bundle bytes to dest through a temporary file and a rename."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    # Replace rather than rewrite in place: the old file may be mapped
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    tmp.write_bytes(raw)
+    os.replace(tmp, dest)
+
+
+def write_bundle(
+    templates_dir: Path,
+    dest: Path,
+    version: str | None = None,
+    manifest_checksum: str | None = None,
+) -> int:
+    """Pack a templates directory into a bundle file.
+
+    Args:
+        templates_dir: Templates directory to pack.
+        dest: Bundle file to write.
+        version: Template version to record in the header.
+        manifest_checksum: SHA-256 of the matching manifest.json, to record in
+            the header.
+
+    Returns:
+        Number of files packed.
+    """
+    raw = pack_templates(templates_dir, version, manifest_checksum)
+    _replace_bundle(dest, raw)
+    return len(TemplateBundle.from_bytes(raw).index)
+
+
+def repack_bundle(
+    templates_dir: Path,
+    dest: Path,
+    changed: Iterable[str],
+    removed: Iterable[str],
+    version: str | None = None,
+) -> int:
+    """Rewrite a bundle after some templates changed.
+
+    Unchanged bodies are taken from the existing bundle, so only the changed
+    files are read from disk. Without a readable existing bundle, the whole
+    directory is packed instead.
+
+    Args:
+        templates_dir: Templates directory the bundle describes.
+        dest: Bundle file to rewrite.
+        changed: Relative paths of added or modified files.
+        removed: Relative paths of deleted files.
+        version: Template version to record in the header.
+
+    Returns:
+        Number of files packed.
+    """
+    old = TemplateBundle.load(dest)
+    if old is None:
+        return write_bundle(templates_dir, dest, version)
+
+    removed_paths = set(removed)
+    files = {
+        rel_path: old.read_bytes(rel_path) or b""
+        for rel_path in old.index
+        if rel_path not in removed_paths
+    }
+    for rel_path in changed:
+        files[rel_path] = (templates_dir / rel_path).read_bytes()
+
+    _replace_bundle(dest, pack_files(files, version))
+    return len(files)
+
+
+def _manifest_checksum(templates: Traversable) -> str | None:
+    """Hash the manifest.json of a templates directory, None if it has none."""
+    try:
+        return hashlib.sha256((templates / "manifest.json").read_bytes()).hexdigest()
+    except (OSError, AttributeError, TypeError):
+        return None
+
+
+def _edited_after(templates_dir: Path, bundle_mtime_ns: int) -> bool:
+    """Check whether loose templates changed after the bundle was built.
+
+    Added and removed files show up as a change to their directory.
+
+    Args:
+        templates_dir: Package templates directory.
+        bundle_mtime_ns: Modification time of the bundle file.
+
+    Returns:
+        True if any packed file or directory is newer than the bundle.
+    """
+    for path in templates_dir.rglob("*"):
+        name = path.name
+        if name in EXCLUDED_FILES or name.startswith("."):
+            continue
+        try:
+            if path.stat().st_mtime_ns > bundle_mtime_ns:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+def load_package_bundle(templates: Traversable) -> TemplateBundle | None:
+    """Load the bundle of a package templates directory, unless it is stale.
+
+    A bundle built against another manifest.json than the one beside it is
+    ignored, which costs one small read. In a source checkout the loose
+    templates are also edited without regenerating the manifest, so there
+    the bundle is ignored as well once any of them is newer than it. That
+    walk is skipped in installed packages, where the bundle and the loose
+    files come from the same wheel.
+
+    Args:
+        templates: Package templates directory.
+
+    Returns:
+        TemplateBundle, or None if there is no valid, up to date bundle.
+    """
+    try:
+        bundle = TemplateBundle.from_bytes((templates / BUNDLE_NAME).read_bytes())
+    except (OSError, AttributeError, TypeError, ValueError, KeyError):
+        return None
+
+    if bundle.manifest_checksum != _manifest_checksum(templates):
+        return None
+
+    if isinstance(templates, Path) and (templates / SOURCE_CHECKOUT_MARKER).is_file():
+        try:
+            bundle_mtime_ns = os.stat(templates / BUNDLE_NAME).st_mtime_ns
+        except OSError:
+            return None
+        if _edited_after(templates, bundle_mtime_ns):
+            return None
+
+    return bundle
+
+
+@lru_cache(maxsize=1)
+def get_package_bundle() -> TemplateBundle | None:
+    """Get the bundle shipped with the package, loaded once per process.
+
+    Read through importlib.resources so it also works from zipped installs.
+
+    Returns:
+        TemplateBundle, or None if the package has no bundle (loose files
+        only) or its bundle no longer matches the loose templates.
+    """
+    return load_package_bundle(resources.files(__package__) / "templates")
+
+
+# Mapped cache bundle, with the (path, mtime_ns, size) it was opened for
+_cache_bundle: tuple[tuple[str, int, int], TemplateBundle] | None = None
+
+
+def get_cache_bundle() -> TemplateBundle | None:
+    """Get the bundle written into the templates cache by `tdd-llm update`.
+
+    The file is mapped once and reused until it changes on disk, so
+    repeated lookups in one process cost a single stat().
+
+    Returns:
+        TemplateBundle, or None if the cache has no bundle.
+    """
+    global _cache_bundle
+
+    path = get_templates_cache_dir() / BUNDLE_NAME
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if _cache_bundle is not None and _cache_bundle[0] == key:
+        return _cache_bundle[1]
+
+    bundle = TemplateBundle.open_mapped(path)
+    _cache_bundle = (key, bundle) if bundle is not None else None
+    return bundle
+
+
+def clear_cache_bundle() -> None:
+    """Close the mapped cache bundle so the cache directory can be replaced."""
+    global _cache_bundle
+    if _cache_bundle is not None:
+        _cache_bundle[1].close()
+    _cache_bundle = None
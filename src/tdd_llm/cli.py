@@ -3,6 +3,7 @@
 import functools
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from pathlib import Path
 from typing import Annotated
 
 import click
@@ -23,8 +24,18 @@ from .config import (
     get_project_config_path,
     is_first_run,
 )
-from .deployer import deploy
-from .updater import UpdateResult, get_local_manifest, update_templates
+from .deployer import deploy, deploy_projects, find_projects
+from .updater import (
+    DEFAULT_DOWNLOAD_WORKERS,
+    TEMPLATES_BASE_URL,
+    UpdateResult,
+    get_local_manifest,
+    get_update_hint,
+    rollback_templates,
+    start_background_check,
+    update_check_due,
+    update_templates,
+)
 
 app = typer.Typer(
     name="tdd-llm",
@@ -74,6 +85,32 @@ def _update_progress(quiet: bool) -> Iterator[Callable[[int, int, str], None]]:
             progress.stop()
 
 
+def _templates_source(config: Config, override: str | None = None) -> tuple[str, str]:
+    """Resolve where templates are updated from.
+
+    Returns:
+        Tuple of (source passed to update_templates, label for messages).
+    """
+    source = override or config.get_templates_source()
+    if not source:
+        return TEMPLATES_BASE_URL, "GitHub"
+    return source, source
+
+
+def _background_update_check(config: Config) -> None:
+    """Hint at newer templates found earlier, and check again if the record is stale.
+
+    Never waits on the network: the check runs in a detached process and its
+    result is shown by a later command.
+    """
+    hint = get_update_hint()
+    if hint:
+        rprint(f"[yellow]{hint}[/yellow]")
+    if update_check_due(config.update_check_ttl):
+        source, _ = _templates_source(config)
+        start_background_check(source)
+
+
 def _display_update_result(result: UpdateResult) -> None:
     """Display the result of an update operation and exit on error."""
     if result.status == "up_to_date":
@@ -88,6 +125,8 @@ def _display_update_result(result: UpdateResult) -> None:
             rprint(f"  Files updated: {len(result.files_updated)}")
         if result.files_unchanged:
             rprint(f"  Files unchanged: {len(result.files_unchanged)}")
+        if result.files_removed:
+            rprint(f"  Files removed: {len(result.files_removed)}")
     elif result.status == "error":
         rprint("\n[red]Update failed[/red]")
         for error in result.errors:
@@ -324,25 +363,53 @@ def _deploy_cmd(
         bool,
         typer.Option("--quiet", "-q", help="Suppress update progress output (only with --update)"),
     ] = False,
+    projects: Annotated[
+        str | None,
+        typer.Option(
+            "--projects",
+            help="Deploy to many projects: a glob of project dirs or a file listing them",
+        ),
+    ] = None,
+    jobs: Annotated[
+        int | None,
+        typer.Option("--jobs", "-j", min=1, help="Parallel writers for --projects (default: auto)"),
+    ] = None,
 ):
     """Deploy TDD templates to .claude and .gemini directories.
 
     Use --update --force to update templates from GitHub then deploy with overwrite.
+    Use --projects to deploy to many projects in one run, each with its own config.
     """
+    if jobs is not None and projects is None:
+        rprint("[red]Error:[/red] --jobs only applies to --projects deployments")
+        raise typer.Exit(1)
+
     config = Config.load()
 
     # If --update is specified, run update first
     if update:
-        rprint("\n[bold]Step 1: Updating templates from GitHub...[/bold]\n")
+        source, label = _templates_source(config)
+        rprint(f"\n[bold]Step 1: Updating templates from {label}...[/bold]\n")
 
         with _update_progress(quiet) as progress_callback:
-            update_result = update_templates(force=force, progress_callback=progress_callback)
+            update_result = update_templates(
+                force=force, progress_callback=progress_callback, source=source
+            )
 
         _display_update_result(update_result)
 
         rprint("\n[bold]Step 2: Deploying TDD templates[/bold]")
         # Force no_cache=False when using --update since we just updated the cache
         no_cache = False
+    elif not no_cache:
+        _background_update_check(config)
+
+    if projects is not None:
+        if target and target != "project":
+            rprint("[red]Error:[/red] --projects only supports project-level deployment")
+            raise typer.Exit(1)
+        _deploy_projects(projects, lang, backend, platforms, dry_run, force, no_cache, jobs)
+        return
 
     # Use config defaults if not specified
     effective_lang = lang or config.default_language
@@ -420,6 +487,9 @@ def _deploy_cmd(
         for p in sorted(unique_placeholders):
             rprint(f"  - {{{{{p}}}}}")
 
+    if result.files_unchanged:
+        rprint(f"[dim]Skipped {len(result.files_unchanged)} unchanged files[/dim]")
+
     if result.skipped:
         rprint(f"[yellow]Skipped {len(result.skipped)} existing files[/yellow]")
         rprint("  (use --force to overwrite)")
@@ -431,7 +501,7 @@ def _deploy_cmd(
         raise typer.Exit(1)
 
     if result.success:
-        rprint("\n[green]Done![/green]")
+        rprint(f"\n[green]Done![/green] [dim]({result.duration:.2f}s)[/dim]")
     else:
         raise typer.Exit(1)
 
@@ -439,6 +509,76 @@ def _deploy_cmd(
 app.command(name="deploy")(_deploy_cmd)
 
 
+def _deploy_projects(
+    spec: str,
+    lang: str,
+    backend: str,
+    platforms: list[str] | None,
+    dry_run: bool,
+    force: bool,
+    no_cache: bool,
+    jobs: int | None,
+) -> None:
+    """Deploy to every project matched by --projects and show a summary table."""
+    project_paths = find_projects(spec)
+    if not project_paths:
+        rprint(f"[red]Error:[/red] No project directories found for '{spec}'")
+        raise typer.Exit(1)
+
+    rprint(f"\n[bold]Deploying TDD templates to {len(project_paths)} projects[/bold]")
+    if dry_run:
+        rprint("  [yellow](dry run - no files will be written)[/yellow]")
+    rprint()
+
+    results = deploy_projects(
+        project_paths,
+        lang=lang or None,
+        backend=backend or None,
+        platforms=platforms or None,
+        dry_run=dry_run,
+        force=force,
+        no_cache=no_cache,
+        max_workers=jobs,
+    )
+
+    table = Table(title="Deployment Summary")
+    table.add_column("Project", style="bold")
+    table.add_column("Created", justify="right", style="green")
+    table.add_column("Unchanged", justify="right")
+    table.add_column("Skipped", justify="right", style="yellow")
+    table.add_column("Time", justify="right", style="dim")
+    table.add_column("Status")
+
+    cwd = Path.cwd()
+    failed = 0
+    for project_path, result in results.items():
+        try:
+            name = str(project_path.relative_to(cwd))
+        except ValueError:
+            name = str(project_path)
+        if result.success and not result.errors:
+            status = "[green]ok[/green]"
+        else:
+            failed += 1
+            status = f"[red]{result.errors[0] if result.errors else 'failed'}[/red]"
+        table.add_row(
+            name,
+            str(len(result.files_created)),
+            str(len(result.files_unchanged)),
+            str(len(result.skipped)),
+            f"{result.duration:.2f}s",
+            status,
+        )
+
+    console.print(table)
+
+    if failed:
+        rprint(f"\n[red]{failed} of {len(results)} projects failed[/red]")
+        raise typer.Exit(1)
+
+    rprint("\n[green]Done![/green]")
+
+
 def _list_cmd():
     """List available languages and backends."""
     # Languages table
@@ -581,6 +721,13 @@ def _config_cmd(
         int | None,
         typer.Option("--set-coverage-branch", help="Set branch coverage threshold (%)"),
     ] = None,
+    set_templates_source: Annotated[
+        str | None,
+        typer.Option(
+            "--set-templates-source",
+            help="Set where 'update' fetches templates (URL, directory or archive; '' for GitHub)",
+        ),
+    ] = None,
 ):
     """Show or modify configuration."""
     config = Config.load()
@@ -657,6 +804,11 @@ def _config_cmd(
         modified = True
         rprint(f"Set branch coverage threshold to: [cyan]{set_coverage_branch}%[/cyan]")
 
+    if set_templates_source is not None:
+        config.templates_source = set_templates_source
+        modified = True
+        rprint(f"Set templates source to: [cyan]{set_templates_source or 'GitHub'}[/cyan]")
+
     if modified:
         saved_path = config.save(project=project)
         scope = "project" if project else "global"
@@ -674,6 +826,7 @@ def _config_cmd(
         table.add_row("Platforms", ", ".join(config.platforms))
         table.add_row("Coverage (line)", f"{config.coverage.line}%")
         table.add_row("Coverage (branch)", f"{config.coverage.branch}%")
+        table.add_row("Templates source", config.get_templates_source() or "GitHub")
 
         console.print(table)
         console.print()
@@ -712,17 +865,56 @@ def _update_cmd(
         bool,
         typer.Option("--quiet", "-q", help="Suppress progress output"),
     ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option("--jobs", "-j", min=1, help="Parallel downloads"),
+    ] = DEFAULT_DOWNLOAD_WORKERS,
+    rollback: Annotated[
+        bool,
+        typer.Option("--rollback", help="Switch back to the previously installed templates"),
+    ] = False,
+    verify: Annotated[
+        bool,
+        typer.Option(
+            "--verify",
+            help="Rehash every cached file and repair mismatches, even at the same version",
+        ),
+    ] = False,
+    source: Annotated[
+        str | None,
+        typer.Option(
+            "--source",
+            help="Mirror URL, local templates directory or archive (default: GitHub)",
+        ),
+    ] = None,
 ):
     """Update templates from GitHub repository.
 
     Fetches the latest templates from the tdd-llm-workflow repository
     and caches them locally. Cached templates are used by deploy command.
+    The previous version is kept, so --rollback restores it without
+    downloading. --source (or templates_source in config, or
+    TDD_LLM_TEMPLATES_SOURCE) points at a mirror for offline machines.
     """
+    if rollback:
+        if force:
+            rprint("[red]Error:[/red] --rollback cannot be combined with --force")
+            raise typer.Exit(1)
+        _display_update_result(rollback_templates())
+        return
+
+    source, label = _templates_source(Config.load(), source)
     if not quiet:
-        rprint("\n[bold]Updating templates from GitHub...[/bold]\n")
+        rprint(f"\n[bold]Updating templates from {label}...[/bold]\n")
 
     with _update_progress(quiet) as progress_callback:
-        result = update_templates(force=force, progress_callback=progress_callback)
+        result = update_templates(
+            force=force,
+            progress_callback=progress_callback,
+            max_workers=jobs,
+            source=source,
+            verify=verify,
+        )
 
     _display_update_result(result)
 
@@ -755,8 +947,6 @@ def _migrate_cmd(
 
     Requires Jira to be configured (tdd-llm config --set-backend jira).
     """
-    from pathlib import Path
-
     from .migrate import FilesToJiraMigrator
 
     config = Config.load()
@@ -885,7 +1075,7 @@ def _format_json(obj) -> str:
 
 @backend_app.command(name="get-task")
 def backend_get_task(
-    task_id: Annotated[str, typer.Argument(help="Task ID (e.g., T1 or PROJ-1234)")],
+    task_id: Annotated[str, typer.Argument(help="Task ID (e.g., T1, E1/T1 or PROJ-1234)")],
 ):
     """Get task details from the configured backend.
 
@@ -13,6 +13,8 @@ from .paths import get_config_dir
 
 # Project-level config filename
 PROJECT_CONFIG_NAME = ".tdd-llm.yaml"
+# Default hours between background checks for newer templates
+DEFAULT_UPDATE_CHECK_TTL = 24
 
 
 @dataclass
@@ -253,8 +255,20 @@ class Config:
     platforms: list[str] = field(default_factory=lambda: ["claude", "gemini"])
     coverage: CoverageThresholds = field(default_factory=CoverageThresholds)
     jira: JiraConfig = field(default_factory=JiraConfig)
+    # Where `tdd-llm update` fetches templates: mirror URL, local directory or archive
+    templates_source: str = ""
+    # Hours between background checks for newer templates, 0 to disable
+    update_check_ttl: float = DEFAULT_UPDATE_CHECK_TTL
     source: ConfigSource = field(default_factory=ConfigSource)
 
+    def get_templates_source(self) -> str:
+        """Get the template update source, with environment override.
+
+        Returns:
+            Source from TDD_LLM_TEMPLATES_SOURCE or config, empty for the default (GitHub).
+        """
+        return os.environ.get("TDD_LLM_TEMPLATES_SOURCE", self.templates_source)
+
     @classmethod
     def _load_from_file(cls, path: Path) -> dict:
         """Load raw config data from a YAML file."""
@@ -308,6 +322,8 @@ class Config:
             platforms=data.get("platforms", ["claude", "gemini"]),
             coverage=coverage,
             jira=jira,
+            templates_source=data.get("templates_source", ""),
+            update_check_ttl=data.get("update_check_ttl", DEFAULT_UPDATE_CHECK_TTL),
             source=source,
         )
 
@@ -386,6 +402,11 @@ class Config:
         if jira_dict:
             data["jira"] = jira_dict
 
+        if self.templates_source:
+            data["templates_source"] = self.templates_source
+        if self.update_check_ttl != DEFAULT_UPDATE_CHECK_TTL:
+            data["update_check_ttl"] = self.update_check_ttl
+
         with open(config_path, "w", encoding="utf-8") as f:
             yaml.safe_dump(data, f, default_flow_style=False, allow_unicode=True)
 
@@ -405,6 +426,11 @@ class Config:
         if jira_dict:
             result["jira"] = jira_dict
 
+        if self.templates_source:
+            result["templates_source"] = self.templates_source
+        if self.update_check_ttl != DEFAULT_UPDATE_CHECK_TTL:
+            result["update_check_ttl"] = self.update_check_ttl
+
         return result
 
 
@@ -444,8 +470,13 @@ def get_available_languages() -> list[str]:
     Returns:
         List of language names with placeholder directories.
     """
+    from .bundle import get_package_bundle
     from .paths import get_placeholders_dir
 
+    bundle = get_package_bundle()
+    if bundle is not None:
+        return bundle.subdirs("placeholders/langs")
+
     langs_dir = get_placeholders_dir() / "langs"
     if not langs_dir.exists():
         return []
@@ -459,8 +490,13 @@ def get_available_backends() -> list[str]:
     Returns:
         List of backend names with placeholder directories.
     """
+    from .bundle import get_package_bundle
     from .paths import get_placeholders_dir
 
+    bundle = get_package_bundle()
+    if bundle is not None:
+        return bundle.subdirs("placeholders/backends")
+
     backends_dir = get_placeholders_dir() / "backends"
     if not backends_dir.exists():
         return []
@@ -1,49 +1,142 @@
 """Convert Claude .md files to Gemini .toml format."""
 
 import re
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import TextIO
 
+# Size of the content slices escaped and written at a time
+CHUNK_SIZE = 64 * 1024
 
-def extract_description(content: str) -> str:
-    """Extract description from markdown content.
+# Longest description taken from the content, before "..."
+DESCRIPTION_MAX_LENGTH = 100
 
-    Takes the first non-empty line after the title, or the title itself
-    if no description follows.
+
+def _iter_lines(content: str) -> Iterator[str]:
+    """Yield the lines of content one at a time, without splitting it all.
 
     Args:
-        content: Markdown content.
+        content: Text content.
+
+    Yields:
+        Lines without their newline.
+    """
+    pos = 0
+    while pos <= len(content):
+        end = content.find("\n", pos)
+        if end < 0:
+            yield content[pos:]
+            return
+        yield content[pos:end]
+        pos = end + 1
+
+
+def _description_from_lines(lines: Iterable[str]) -> str:
+    """Find the description in a sequence of markdown lines.
+
+    Stops at the first non-empty line that is not a heading.
+
+    Args:
+        lines: Markdown lines.
 
     Returns:
         Description string for TOML.
     """
-    lines = content.strip().split("\n")
-
-    # Find title line (starts with #)
     title = ""
-    description_start = 0
 
-    for i, line in enumerate(lines):
+    for line in lines:
         stripped = line.strip()
+        if not stripped:
+            continue
+
         if stripped.startswith("#"):
-            # Extract title without # prefix
-            title = re.sub(r"^#+\s*", "", stripped)
-            description_start = i + 1
-            break
-
-    # Look for first non-empty line after title for description
-    for i in range(description_start, len(lines)):
-        stripped = lines[i].strip()
-        if stripped and not stripped.startswith("#"):
-            # Use this as description (truncate if too long)
-            desc = stripped[:100]
-            if len(stripped) > 100:
-                desc += "..."
-            return desc
+            # Extract title without # prefix (first heading only)
+            if not title:
+                title = re.sub(r"^#+\s*", "", stripped)
+            continue
+
+        # Use this as description (truncate if too long)
+        desc = stripped[:DESCRIPTION_MAX_LENGTH]
+        if len(stripped) > DESCRIPTION_MAX_LENGTH:
+            desc += "..."
+        return desc
 
     # Fallback to title
     return title if title else "Command"
 
 
+def extract_description(content: str) -> str:
+    """Extract description from markdown content.
+
+    Takes the first non-empty line that is not a heading, or the first
+    heading if no such line exists. Lines are read lazily, so only the
+    beginning of the content is scanned.
+
+    Args:
+        content: Markdown content.
+
+    Returns:
+        Description string for TOML.
+    """
+    return _description_from_lines(_iter_lines(content))
+
+
+def _escape_chunks(content: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Escape triple quotes in content, one slice at a time.
+
+    Quotes at the end of a slice that could start a triple quote spanning
+    the next slice are carried over, so the output matches escaping the
+    whole content at once.
+
+    Args:
+        content: Text content.
+        chunk_size: Size of each slice.
+
+    Yields:
+        Escaped pieces of content.
+    """
+    carry = ""
+    for start in range(0, len(content), chunk_size):
+        piece = carry + content[start : start + chunk_size]
+        # Triples are matched left to right within a run of quotes, so only
+        # the trailing run's remainder can still combine with the next slice
+        keep = (len(piece) - len(piece.rstrip('"'))) % 3
+        carry = piece[len(piece) - keep :] if keep else ""
+        yield piece[: len(piece) - keep].replace('"""', '\\"\\"\\"')
+
+    if carry:
+        yield carry
+
+
+def iter_toml(content: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Convert markdown content to Gemini TOML format, piece by piece.
+
+    Args:
+        content: Markdown content from Claude command file.
+        chunk_size: Size of the content slices escaped at a time.
+
+    Yields:
+        Consecutive pieces of the TOML content.
+    """
+    yield f'description = "{extract_description(content)}"\nprompt = """\n'
+    yield from _escape_chunks(content, chunk_size)
+    yield '\n"""'
+
+
+def write_toml(content: str, out: TextIO, chunk_size: int = CHUNK_SIZE) -> None:
+    """Write markdown content as Gemini TOML to a file handle.
+
+    The TOML is written incrementally, never built as a whole in memory.
+
+    Args:
+        content: Markdown content from Claude command file.
+        out: Text file handle to write to.
+        chunk_size: Size of the content slices escaped at a time.
+    """
+    for piece in iter_toml(content, chunk_size):
+        out.write(piece)
+
+
 def md_to_toml(content: str) -> str:
     """Convert markdown content to Gemini TOML format.
 
@@ -53,20 +146,7 @@ def md_to_toml(content: str) -> str:
     Returns:
         TOML content for Gemini command file.
     """
-    description = extract_description(content)
-
-    # Escape any triple quotes in the content
-    escaped_content = content.replace('"""', '\\"\\"\\"')
-
-    # Build TOML
-    toml_lines = [
-        f'description = "{description}"',
-        'prompt = """',
-        escaped_content,
-        '"""',
-    ]
-
-    return "\n".join(toml_lines)
+    return "".join(iter_toml(content))
 
 
 def convert_file(source: Path, dest: Path) -> None:
@@ -77,10 +157,10 @@ def convert_file(source: Path, dest: Path) -> None:
         dest: Destination .toml file path.
     """
     content = source.read_text(encoding="utf-8")
-    toml_content = md_to_toml(content)
 
     dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_text(toml_content, encoding="utf-8")
+    with open(dest, "w", encoding="utf-8") as f:
+        write_toml(content, f)
 
 
 def get_toml_path(md_path: Path) -> Path:
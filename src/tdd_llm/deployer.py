@@ -1,12 +1,23 @@
 """Deployment logic for tdd-llm templates."""
 
+from __future__ import annotations
+
+import contextlib
+import glob
+import hashlib
+import json
+import os
 import shutil
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
 from . import converter, placeholder
-from .config import Config
+from .bundle import get_cache_bundle, get_package_bundle
+from .config import Config, get_available_backends, get_available_languages
 from .paths import (
     get_base_templates_dir,
     get_cached_base_templates_dir,
@@ -27,6 +38,259 @@ class DeploymentResult:
     placeholders_replaced: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     skipped: list[str] = field(default_factory=list)
+    files_unchanged: list[str] = field(default_factory=list)
+    duration: float = 0.0
+    """Wall-clock time spent deploying, in seconds."""
+
+
+# Manifest written into each target commands directory
+DEPLOY_MANIFEST_NAME = ".tdd-llm-manifest.json"
+DEPLOY_MANIFEST_VERSION = 1
+
+
+@dataclass
+class DeployManifest:
+    """Record of deployed files and the inputs they were rendered from.
+
+    Maps each target file (relative to the commands directory) to the
+    checksum of its rendered output and a description of its inputs, so
+    re-deploys can skip unchanged files and leave user-edited ones alone.
+    """
+
+    files: dict[str, dict] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, target_dir: Path) -> DeployManifest:
+        """Load the manifest from a target directory.
+
+        Args:
+            target_dir: Target commands directory.
+
+        Returns:
+            DeployManifest (empty if missing, unreadable or from another format version).
+        """
+        manifest_path = target_dir / DEPLOY_MANIFEST_NAME
+        if not manifest_path.exists():
+            return cls()
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return cls()
+        if not isinstance(data, dict) or data.get("version") != DEPLOY_MANIFEST_VERSION:
+            return cls()
+        return cls(files=data.get("files", {}))
+
+    def dumps(self) -> str:
+        """Serialize the manifest to JSON text."""
+        return json.dumps(
+            {"version": DEPLOY_MANIFEST_VERSION, "files": self.files},
+            indent=2,
+            sort_keys=True,
+        )
+
+    def save(self, target_dir: Path) -> None:
+        """Save the manifest into a target directory atomically.
+
+        Args:
+            target_dir: Target commands directory.
+        """
+        write_files_atomic([(target_dir / DEPLOY_MANIFEST_NAME, self.dumps())])
+
+
+def write_files_atomic(files: list[tuple[Path, str]]) -> None:
+    """Write a batch of text files all-or-nothing.
+
+    Every file is first staged as a temporary sibling, creating each parent
+    directory once, and every existing target is backed up (hard link, or a
+    copy where links are unsupported). Only then are the staged files moved
+    into place with os.replace(), in order. If one of them fails, the files
+    already moved are rolled back from their backups, or removed if they
+    did not exist, so a failure never leaves a half-written file or a
+    partially updated batch behind. Callers put the file that records the
+    batch (the deploy manifest) last, so it only lands once the rest did.
+
+    Args:
+        files: (path, text) pairs to write as UTF-8.
+
+    Raises:
+        OSError: If a file cannot be staged or moved into place.
+    """
+    for directory in {path.parent for path, _ in files}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    token = uuid.uuid4().hex[:8]
+    staged: list[tuple[Path, Path]] = []
+    # Target -> backup of its previous content, None if it did not exist
+    backups: dict[Path, Path | None] = {}
+    committed: list[Path] = []
+    try:
+        for path, text in files:
+            temp_path = path.with_name(f".{path.name}.{token}.tmp")
+            with open(temp_path, "x", encoding="utf-8") as f:
+                f.write(text)
+            staged.append((temp_path, path))
+
+        for _, path in staged:
+            backups[path] = _backup_file(path, token) if path.exists() else None
+
+        try:
+            for temp_path, path in staged:
+                os.replace(temp_path, path)
+                committed.append(path)
+        except OSError:
+            _roll_back(committed, backups)
+            raise
+    finally:
+        for temp_path, _ in staged:
+            temp_path.unlink(missing_ok=True)
+        for backup in backups.values():
+            if backup is not None:
+                backup.unlink(missing_ok=True)
+
+
+def _backup_file(path: Path, token: str) -> Path:
+    """Keep the current content of a file aside, as a hard link or a copy."""
+    backup = path.with_name(f".{path.name}.{token}.bak")
+    try:
+        os.link(path, backup)
+    except OSError:
+        shutil.copy2(path, backup)
+    return backup
+
+
+def _roll_back(committed: list[Path], backups: dict[Path, Path | None]) -> None:
+    """Undo the replacements of a failed batch, newest first."""
+    for path in reversed(committed):
+        backup = backups[path]
+        with contextlib.suppress(OSError):
+            if backup is None:
+                path.unlink(missing_ok=True)
+            else:
+                os.replace(backup, path)
+
+
+@dataclass
+class _SourceTemplate:
+    """A source template compiled once per deployment run."""
+
+    checksum: str
+    template: placeholder.CompiledTemplate
+
+
+@dataclass
+class _RenderedFile:
+    """Final output of a template for one platform."""
+
+    rel_path: Path
+    """Target path relative to the commands directory."""
+
+    text: str
+    replaced: set[str]
+    inputs: dict
+    converted: bool = False
+
+
+class TemplateRenderer:
+    """Command templates rendered for one lang/backend/config combination.
+
+    Each template is read and compiled once, and each platform output is
+    produced once, however many target directories it is written to.
+    """
+
+    def __init__(
+        self,
+        source_dir: Path,
+        resolver: placeholder.PlaceholderResolver,
+        source_files: list[Path] | None = None,
+        contents: dict[Path, str] | None = None,
+    ):
+        """Initialize the renderer.
+
+        Args:
+            source_dir: Source commands directory.
+            resolver: Placeholder table for this combination.
+            source_files: Template paths relative to source_dir. Listed if None.
+            contents: Raw template text keyed by relative path, shared between
+                     renderers so each file is read once.
+        """
+        self.source_dir = source_dir
+        self.resolver = resolver
+        self.source_files = (
+            source_files if source_files is not None else _collect_templates(source_dir)
+        )
+        self._contents = contents if contents is not None else {}
+        self._sources: dict[Path, _SourceTemplate] = {}
+        self._outputs: dict[tuple[Path, str], _RenderedFile] = {}
+
+    def _source(self, rel_path: Path) -> _SourceTemplate:
+        """Get the compiled source template, reading it on first use."""
+        source = self._sources.get(rel_path)
+        if source is None:
+            content = self._contents.get(rel_path)
+            if content is None:
+                content = (self.source_dir / rel_path).read_text(encoding="utf-8")
+                self._contents[rel_path] = content
+            source = self._sources[rel_path] = _SourceTemplate(
+                checksum=_checksum(content),
+                template=self.resolver.compile(content),
+            )
+        return source
+
+    def render(self, rel_path: Path, platform: str) -> _RenderedFile:
+        """Render a template for a platform.
+
+        Args:
+            rel_path: Template path relative to the source directory.
+            platform: Platform name ("claude" or "gemini").
+
+        Returns:
+            Rendered output, converted to TOML for Gemini.
+
+        Raises:
+            placeholder.PlaceholderError: If the template's placeholders cannot be expanded.
+        """
+        key = (rel_path, platform)
+        output = self._outputs.get(key)
+        if output is not None:
+            return output
+
+        source = self._source(rel_path)
+        rendered = source.template.render(platform)
+        output = _RenderedFile(
+            rel_path=rel_path,
+            text=rendered.text,
+            replaced=rendered.replaced,
+            inputs=_deploy_inputs(source, rendered, self.resolver, platform),
+        )
+
+        # Convert to TOML for Gemini
+        if platform == "gemini" and rel_path.suffix == ".md":
+            output.rel_path = rel_path.with_suffix(".toml")
+            output.text = converter.md_to_toml(output.text)
+            output.converted = True
+
+        self._outputs[key] = output
+        return output
+
+    def prepare(self, platforms: list[str]) -> None:
+        """Render every template for the given platforms up front.
+
+        Args:
+            platforms: Platform names to render for.
+        """
+        for rel_path in self.source_files:
+            for platform in platforms:
+                try:
+                    self.render(rel_path, platform)
+                except placeholder.PlaceholderError:
+                    # Reported per project when the file is deployed
+                    continue
+
+
+def _checksum(text: str) -> str:
+    """Return the SHA-256 hex digest of text encoded as UTF-8."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
 def get_target_dirs(
@@ -60,6 +324,27 @@ def get_target_dirs(
     return dirs
 
 
+def get_source_commands_dir(no_cache: bool = False) -> Path:
+    """Get the command templates directory to deploy from.
+
+    Args:
+        no_cache: If True, use package templates ignoring cached updates.
+
+    Returns:
+        Cached commands directory if available, otherwise the package one.
+    """
+    cached_base_dir = get_cached_base_templates_dir()
+    package_base_dir = get_base_templates_dir()
+
+    # The cache directory may hold only update metadata, so look for commands
+    if no_cache or not (cached_base_dir / "commands").is_dir():
+        base_dir = package_base_dir
+    else:
+        base_dir = cached_base_dir
+
+    return base_dir / "commands"
+
+
 def deploy(
     target: Literal["project", "user"] = "project",
     lang: str = "python",
@@ -70,6 +355,7 @@ def deploy(
     force: bool = False,
     config: Config | None = None,
     no_cache: bool = False,
+    renderer: TemplateRenderer | None = None,
 ) -> DeploymentResult:
     """Deploy TDD templates to target directories.
 
@@ -83,6 +369,8 @@ def deploy(
         force: If True, overwrite existing files.
         config: Config instance for config-based placeholders.
         no_cache: If True, use package templates ignoring cached updates.
+        renderer: Pre-built renderer to share across deployments. When given,
+                 lang, backend, config and no_cache are taken from it.
 
     Returns:
         DeploymentResult with details of what was done.
@@ -90,41 +378,38 @@ def deploy(
     if platforms is None:
         platforms = ["claude", "gemini"]
 
-    if config is None:
-        config = Config.load()
-
+    started = time.perf_counter()
     result = DeploymentResult()
 
-    # Use cached templates if available, otherwise fall back to package
-    cached_base_dir = get_cached_base_templates_dir()
-    package_base_dir = get_base_templates_dir()
+    if renderer is None:
+        if config is None:
+            config = Config.load()
 
-    if no_cache or not cached_base_dir.exists():
-        base_dir = package_base_dir
-    else:
-        base_dir = cached_base_dir
+        # Use cached templates if available, otherwise fall back to package
+        source_commands = get_source_commands_dir(no_cache)
+        templates = _load_templates(source_commands)
+        if templates is None:
+            result.success = False
+            result.errors.append(f"Commands templates not found: {source_commands}")
+            return result
 
-    target_dirs = get_target_dirs(target, platforms, project_path)
+        # Compile placeholder table once, shared by every file in this run
+        resolver = placeholder.PlaceholderResolver(lang, backend, config, no_cache=no_cache)
 
-    # Get source commands directory
-    source_commands = base_dir / "commands"
-    if not source_commands.exists():
-        result.success = False
-        result.errors.append(f"Commands templates not found: {source_commands}")
-        return result
+        # Templates are listed and rendered once, then overlaid per platform
+        source_files, contents = templates
+        renderer = TemplateRenderer(source_commands, resolver, source_files, contents)
+
+    target_dirs = get_target_dirs(target, platforms, project_path)
 
     # Deploy to each platform
     for platform, target_dir in target_dirs.items():
         platform_result = _deploy_to_platform(
-            source_commands,
+            renderer,
             target_dir / "commands",
             platform,
-            lang,
-            backend,
             dry_run,
             force,
-            config,
-            no_cache,
         )
 
         result.files_created.extend(platform_result.files_created)
@@ -132,89 +417,309 @@ def deploy(
         result.placeholders_replaced.extend(platform_result.placeholders_replaced)
         result.errors.extend(platform_result.errors)
         result.skipped.extend(platform_result.skipped)
+        result.files_unchanged.extend(platform_result.files_unchanged)
 
         if not platform_result.success:
             result.success = False
 
+    result.duration = time.perf_counter() - started
     return result
 
 
+def find_projects(spec: str) -> list[Path]:
+    """Resolve a --projects specification to project directories.
+
+    Args:
+        spec: Path to a file listing one project directory per line (blank
+             lines and lines starting with # are ignored), or a glob pattern
+             matching project directories.
+
+    Returns:
+        Sorted, de-duplicated list of existing project directories.
+    """
+    spec_path = Path(spec)
+    if spec_path.is_file():
+        lines = [line.strip() for line in spec_path.read_text(encoding="utf-8").splitlines()]
+        candidates = [Path(line) for line in lines if line and not line.startswith("#")]
+    else:
+        candidates = [Path(match) for match in glob.glob(spec, recursive=True)]
+
+    return sorted({path.resolve() for path in candidates if path.is_dir()})
+
+
+def deploy_projects(
+    project_paths: list[Path],
+    lang: str | None = None,
+    backend: str | None = None,
+    platforms: list[str] | None = None,
+    dry_run: bool = False,
+    force: bool = False,
+    no_cache: bool = False,
+    max_workers: int | None = None,
+) -> dict[Path, DeploymentResult]:
+    """Deploy TDD templates to many projects in one run.
+
+    Each project's configuration (global merged with its .tdd-llm.yaml) is
+    loaded to pick its language, backend, platforms and coverage. Templates
+    are read once, rendered once per distinct combination, and the writes
+    are spread over a thread pool.
+
+    Args:
+        project_paths: Project roots to deploy to.
+        lang: Language override. Defaults to each project's configuration.
+        backend: Backend override. Defaults to each project's configuration.
+        platforms: Platforms override. Defaults to each project's configuration.
+        dry_run: If True, don't actually write files.
+        force: If True, overwrite existing files.
+        no_cache: If True, use package templates ignoring cached updates.
+        max_workers: Thread pool size. Defaults to ThreadPoolExecutor's default.
+
+    Returns:
+        Dict mapping each project path to its DeploymentResult.
+    """
+    results: dict[Path, DeploymentResult] = {}
+
+    source_commands = get_source_commands_dir(no_cache)
+    templates = _load_templates(source_commands)
+    if templates is None:
+        for project_path in project_paths:
+            results[project_path] = DeploymentResult(
+                success=False,
+                errors=[f"Commands templates not found: {source_commands}"],
+            )
+        return results
+
+    available_langs = get_available_languages()
+    available_backends = get_available_backends()
+    source_files, contents = templates
+    renderers: dict[tuple, TemplateRenderer] = {}
+    jobs: list[tuple[Path, TemplateRenderer, list[str]]] = []
+
+    # Plan every project and render each distinct combination once
+    for project_path in project_paths:
+        config = Config.load(project_path=project_path)
+        effective_lang = lang or config.default_language
+        effective_backend = backend or config.default_backend
+        effective_platforms = platforms or config.platforms
+
+        if available_langs and effective_lang not in available_langs:
+            results[project_path] = DeploymentResult(
+                success=False, errors=[f"Unknown language '{effective_lang}'"]
+            )
+            continue
+        if available_backends and effective_backend not in available_backends:
+            results[project_path] = DeploymentResult(
+                success=False, errors=[f"Unknown backend '{effective_backend}'"]
+            )
+            continue
+
+        key = (effective_lang, effective_backend, config.coverage.line, config.coverage.branch)
+        renderer = renderers.get(key)
+        if renderer is None:
+            resolver = placeholder.PlaceholderResolver(
+                effective_lang, effective_backend, config, no_cache=no_cache
+            )
+            renderer = renderers[key] = TemplateRenderer(
+                source_commands, resolver, source_files, contents
+            )
+        renderer.prepare(effective_platforms)
+        jobs.append((project_path, renderer, effective_platforms))
+
+    def _run(job: tuple[Path, TemplateRenderer, list[str]]) -> DeploymentResult:
+        project_path, renderer, job_platforms = job
+        try:
+            return deploy(
+                target="project",
+                platforms=job_platforms,
+                project_path=project_path,
+                dry_run=dry_run,
+                force=force,
+                renderer=renderer,
+            )
+        except OSError as e:
+            return DeploymentResult(success=False, errors=[str(e)])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for (project_path, _, _), result in zip(jobs, executor.map(_run, jobs)):
+            results[project_path] = result
+
+    return {path: results[path] for path in project_paths if path in results}
+
+
+def _load_templates(source_dir: Path) -> tuple[list[Path], dict[Path, str]] | None:
+    """List the command templates to deploy and preload their content if possible.
+
+    Package and cached templates come from their packed bundle when one
+    exists, so they are read with a single open; otherwise the loose files
+    are listed and read lazily.
+
+    Args:
+        source_dir: Source commands directory.
+
+    Returns:
+        Tuple of (relative template paths, preloaded contents), or None if
+        no templates were found.
+    """
+    if source_dir == get_base_templates_dir() / "commands":
+        bundle = get_package_bundle()
+    elif source_dir == get_cached_base_templates_dir() / "commands":
+        bundle = get_cache_bundle()
+    else:
+        bundle = None
+
+    if bundle is not None:
+        names = bundle.files("commands")
+        if names:
+            contents = {Path(name): bundle.read_text(f"commands/{name}") or "" for name in names}
+            return list(contents), contents
+
+    if not source_dir.exists():
+        return None
+
+    return _collect_templates(source_dir), {}
+
+
+def _collect_templates(source_dir: Path) -> list[Path]:
+    """List template files relative to the source directory.
+
+    Args:
+        source_dir: Source commands directory.
+
+    Returns:
+        Sorted relative paths of all template files.
+    """
+    return sorted(path.relative_to(source_dir) for path in source_dir.rglob("*") if path.is_file())
+
+
+def _deploy_inputs(
+    source: _SourceTemplate,
+    rendered: placeholder.SubstitutionResult,
+    resolver: placeholder.PlaceholderResolver,
+    platform: str,
+) -> dict:
+    """Describe the inputs a deployed file was rendered from.
+
+    Args:
+        source: Compiled source template.
+        rendered: Result of rendering the template for the platform.
+        resolver: Placeholder table used for rendering.
+        platform: Platform name ("claude" or "gemini").
+
+    Returns:
+        JSON-serializable dict of template/placeholder checksums and settings.
+    """
+    config = resolver.config
+    placeholders = {}
+    uses_config = False
+    for name in sorted(rendered.replaced | rendered.unresolved):
+        value = resolver.resolve(name, platform)
+        placeholders[name] = _checksum(value) if value is not None else None
+        uses_config = uses_config or placeholder.get_config_placeholder(name, config) is not None
+
+    # Coverage only matters to files that render config-based placeholders
+    return {
+        "template": source.checksum,
+        "placeholders": placeholders,
+        "lang": resolver.lang,
+        "backend": resolver.backend,
+        "coverage": config.coverage.to_dict() if config and uses_config else None,
+    }
+
+
 def _deploy_to_platform(
-    source_dir: Path,
+    renderer: TemplateRenderer,
     target_dir: Path,
     platform: str,
-    lang: str,
-    backend: str,
     dry_run: bool,
     force: bool,
-    config: Config,
-    no_cache: bool,
 ) -> DeploymentResult:
     """Deploy to a single platform.
 
+    Existing files recorded in the target's DeployManifest are rewritten only
+    when their inputs changed, and never when the user edited them (unless
+    forced). Existing files not in the manifest are skipped unless forced.
+
     Args:
-        source_dir: Source commands directory.
+        renderer: Templates rendered for this deployment's combination.
         target_dir: Target commands directory (.claude/commands or .gemini/commands).
         platform: Platform name ("claude" or "gemini").
-        lang: Language for placeholders.
-        backend: Backend for placeholders.
         dry_run: Don't write files.
         force: Overwrite existing.
-        config: Config instance for config-based placeholders.
-        no_cache: If True, use package placeholders only.
 
     Returns:
         DeploymentResult for this platform.
     """
     result = DeploymentResult()
     is_gemini = platform == "gemini"
+    manifest = DeployManifest.load(target_dir)
+    batch: list[tuple[Path, str]] = []
+    written = DeploymentResult()
 
-    # Walk through source directory
-    for source_file in source_dir.rglob("*"):
-        if not source_file.is_file():
-            continue
-
-        # Calculate relative path and target path
-        rel_path = source_file.relative_to(source_dir)
-        target_file = target_dir / rel_path
+    for rel_path in renderer.source_files:
+        target_rel_path = rel_path
+        is_markdown = rel_path.suffix == ".md"
 
         # For Gemini, convert .md to .toml
-        if is_gemini and source_file.suffix == ".md":
-            target_file = target_file.with_suffix(".toml")
+        if is_gemini and is_markdown:
+            target_rel_path = rel_path.with_suffix(".toml")
 
-        # Check if target exists
-        if target_file.exists() and not force:
+        target_file = target_dir / target_rel_path
+        key = target_rel_path.as_posix()
+        entry = manifest.files.get(key)
+        exists = target_file.exists()
+
+        # Existing file we did not deploy: leave it alone
+        if exists and not force and entry is None:
             result.skipped.append(str(target_file))
             continue
 
+        try:
+            output = renderer.render(rel_path, platform)
+        except placeholder.PlaceholderError as e:
+            result.success = False
+            result.errors.append(f"{rel_path.as_posix()}: {e}")
+            continue
+
+        if exists and not force and entry is not None:
+            # Modified since last deploy: keep the user's version
+            if _checksum(target_file.read_text(encoding="utf-8")) != entry.get("output"):
+                result.skipped.append(str(target_file))
+                continue
+            if entry.get("inputs") == output.inputs:
+                result.files_unchanged.append(str(target_file))
+                continue
+
         if dry_run:
             result.files_created.append(str(target_file))
-            if is_gemini and source_file.suffix == ".md":
+            if output.converted:
                 result.files_converted.append(str(target_file))
             continue
 
-        # Read and process content
-        content = source_file.read_text(encoding="utf-8")
+        # Queue file for the platform's write batch
+        batch.append((target_file, output.text))
+        written.files_created.append(str(target_file))
+        written.placeholders_replaced.extend(output.replaced)
+        if output.converted:
+            written.files_converted.append(str(target_file))
 
-        # Replace placeholders
-        processed = placeholder.replace_placeholders(
-            content, lang, backend, config, no_cache=no_cache, platform=platform
-        )
-        found_placeholders = placeholder.find_placeholders(content)
-        remaining_placeholders = placeholder.find_placeholders(processed)
-        replaced = found_placeholders - remaining_placeholders
-        result.placeholders_replaced.extend(replaced)
+        manifest.files[key] = {"output": _checksum(output.text), "inputs": output.inputs}
 
-        # Convert to TOML for Gemini
-        if is_gemini and source_file.suffix == ".md":
-            processed = converter.md_to_toml(processed)
-            result.files_converted.append(str(target_file))
+    if not batch:
+        return result
 
-        # Write file
-        target_file.parent.mkdir(parents=True, exist_ok=True)
-        target_file.write_text(processed, encoding="utf-8")
-        result.files_created.append(str(target_file))
+    # Commit all files plus the manifest, or none of them. The manifest goes
+    # last, so it is only replaced once every file it describes has been.
+    batch.append((target_dir / DEPLOY_MANIFEST_NAME, manifest.dumps()))
+    try:
+        write_files_atomic(batch)
+    except OSError as e:
+        result.success = False
+        result.errors.append(f"Failed to write {platform} commands to {target_dir}: {e}")
+        return result
 
+    result.files_created.extend(written.files_created)
+    result.files_converted.extend(written.files_converted)
+    result.placeholders_replaced.extend(written.placeholders_replaced)
     return result
 
 
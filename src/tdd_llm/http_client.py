@@ -0,0 +1,180 @@
+"""Shared HTTP client policy for tdd-llm.
+
+The template updater, the Jira OAuth flow and the Jira REST client all get
+their clients here, so they share one timeout, pool and retry policy. Calls
+that talk to the same hosts in one process (an OAuth refresh followed by API
+calls) reuse the shared client's keep-alive connections instead of paying a
+TLS handshake each time.
+
+HTTP/2 is used when the optional `h2` package is installed
+(`pip install tdd-llm[http2]`), unless TDD_LLM_HTTP2=0 is set.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from typing import Any
+
+import httpx
+
+# Connect fast, but leave slow responses (large searches, archives) time to arrive
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+# Keep-alive pool of the shared client
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+# Connection attempts retried by the transport, with its own exponential backoff
+CONNECT_RETRIES = 2
+# Responses retried by send_with_retry()
+RETRY_STATUSES = {429, 502, 503, 504}
+# Statuses meaning the request was not processed, retried for non-idempotent
+# methods when the caller opts in
+RETRY_ANY_METHOD_STATUSES = {429, 503}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+MAX_RETRIES = 2
+BACKOFF_FACTOR = 0.5
+# Longest wait honored from a Retry-After header, in seconds
+MAX_BACKOFF = 10.0
+
+_shared_client: httpx.Client | None = None
+_shared_lock = threading.Lock()
+
+
+def http2_enabled() -> bool:
+    """Check whether clients should negotiate HTTP/2.
+
+    Returns:
+        True if the h2 package is installed and TDD_LLM_HTTP2 is not "0".
+    """
+    if os.environ.get("TDD_LLM_HTTP2", "1") == "0":
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_client(
+    *,
+    max_connections: int | None = None,
+    timeout: httpx.Timeout | float = DEFAULT_TIMEOUT,
+    **kwargs: Any,
+) -> httpx.Client:
+    """Create a client with the shared timeout, retry and HTTP/2 policy.
+
+    For callers that need a pool of their own, such as parallel template
+    downloads sized to the number of workers. Others should use
+    get_shared_client().
+
+    Redirects are not followed unless the caller passes
+    follow_redirects=True: a redirected POST could carry credentials, such
+    as an OAuth token request, to another host.
+
+    Args:
+        max_connections: Pool size, defaults to the shared pool's.
+        timeout: Request timeout.
+        **kwargs: Extra httpx.Client arguments (base_url, headers, ...).
+
+    Returns:
+        New httpx.Client, to be closed by the caller.
+    """
+    limits = DEFAULT_LIMITS
+    if max_connections is not None:
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=DEFAULT_LIMITS.keepalive_expiry,
+        )
+    transport = httpx.HTTPTransport(retries=CONNECT_RETRIES, limits=limits, http2=http2_enabled())
+    return httpx.Client(timeout=timeout, transport=transport, **kwargs)
+
+
+def get_shared_client() -> httpx.Client:
+    """Get the process-wide client, created on first use and closed at exit.
+
+    Returns:
+        Shared httpx.Client. Callers must not close it.
+    """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = create_client()
+        return _shared_client
+
+
+def close_shared_client() -> None:
+    """Close the process-wide client; the next get_shared_client() makes a new one."""
+    global _shared_client
+    with _shared_lock:
+        client, _shared_client = _shared_client, None
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_shared_client)
+
+
+def _retry_delay(response: httpx.Response | None, attempt: int) -> float:
+    """Compute the wait before a retry, honoring Retry-After when given."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_BACKOFF)
+    return min(BACKOFF_FACTOR * 2**attempt, MAX_BACKOFF)
+
+
+def send_with_retry(
+    client: httpx.Client,
+    method: str,
+    url: str,
+    *,
+    max_retries: int = MAX_RETRIES,
+    retry_non_idempotent: bool = False,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Send a request, retrying throttling and transient gateway errors.
+
+    Only idempotent methods are retried by default, where a replay cannot
+    apply a change twice. 429 and 503 say the server did not process the
+    request, so callers sending a POST that is safe to replay (a search)
+    can opt in to retrying those two for any method.
+
+    Args:
+        client: HTTP client.
+        method: HTTP method.
+        url: Request URL (or path, with a client base_url).
+        max_retries: Retries after the first attempt.
+        retry_non_idempotent: If True, also retry 429 and 503 for
+            non-idempotent methods.
+        **kwargs: Extra client.request() arguments.
+
+    Returns:
+        The last response received.
+
+    Raises:
+        httpx.TransportError: If the last attempt failed without a response.
+    """
+    idempotent = method.upper() in IDEMPOTENT_METHODS
+    attempt = 0
+    while True:
+        try:
+            response = client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if not idempotent or attempt >= max_retries:
+                raise
+            time.sleep(_retry_delay(None, attempt))
+            attempt += 1
+            continue
+
+        if idempotent:
+            retryable = response.status_code in RETRY_STATUSES
+        else:
+            retryable = retry_non_idempotent and response.status_code in RETRY_ANY_METHOD_STATUSES
+        if not retryable or attempt >= max_retries:
+            return response
+        time.sleep(_retry_delay(response, attempt))
+        attempt += 1
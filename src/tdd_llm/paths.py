@@ -124,3 +124,12 @@ def get_cached_lang_placeholders_dir(lang: str) -> Path:
 def get_cached_backend_placeholders_dir(backend: str) -> Path:
     """Get the cached placeholders directory for a specific backend."""
     return get_cached_placeholders_dir() / "backends" / backend
+
+
+def get_templates_store_dir() -> Path:
+    """Get the content-addressed store of downloaded template versions.
+
+    Returns:
+        Path to template store directory within config dir.
+    """
+    return get_config_dir() / "template-store"
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .bundle import TemplateBundle, get_cache_bundle, get_package_bundle
 from .paths import (
     get_backend_placeholders_dir,
     get_cached_backend_placeholders_dir,
@@ -19,6 +22,48 @@ if TYPE_CHECKING:
 # Pattern to match {{PLACEHOLDER_NAME}}
 PLACEHOLDER_PATTERN = re.compile(r"\{\{([A-Z_][A-Z0-9_]*)\}\}")
 
+# Maximum nesting of placeholders referencing other placeholders
+MAX_PLACEHOLDER_DEPTH = 10
+
+# Placeholders whose value depends on the target platform
+PLATFORM_PLACEHOLDERS: dict[str, dict[str, str]] = {
+    "AGENT_FILE": {
+        "claude": "CLAUDE.md",
+        "gemini": "GEMINI.md",
+    },
+}
+
+
+class PlaceholderError(Exception):
+    """Placeholder values could not be expanded."""
+
+    pass
+
+
+class PlaceholderCycleError(PlaceholderError):
+    """Placeholders reference each other in a cycle."""
+
+    def __init__(self, chain: list[str]):
+        super().__init__("Placeholder cycle: " + " -> ".join(chain))
+        self.chain = chain
+
+
+class PlaceholderDepthError(PlaceholderError):
+    """Placeholders are nested deeper than the allowed limit."""
+
+    def __init__(self, chain: list[str], max_depth: int):
+        super().__init__(f"Placeholder nesting deeper than {max_depth}: " + " -> ".join(chain))
+        self.chain = chain
+
+
+@dataclass
+class SubstitutionResult:
+    """Result of a placeholder substitution pass."""
+
+    text: str
+    replaced: set[str] = field(default_factory=set)
+    unresolved: set[str] = field(default_factory=set)
+
 
 def find_placeholders(content: str) -> set[str]:
     """Find all placeholder names in content.
@@ -32,6 +77,193 @@ def find_placeholders(content: str) -> set[str]:
     return set(PLACEHOLDER_PATTERN.findall(content))
 
 
+class _Expander:
+    """Recursive placeholder expansion with a memo table.
+
+    Placeholder values may reference other placeholders. Each name is
+    looked up and expanded once; later references reuse the memoized text.
+
+    The expander may be shared between threads: the chain of names being
+    expanded is passed down each call rather than kept on the instance,
+    and each memo entry is stored in a single assignment.
+    """
+
+    def __init__(
+        self,
+        lookup: Callable[[str], str | None],
+        remove_unfound: bool = True,
+        keep: Callable[[str], bool] | None = None,
+        max_depth: int = MAX_PLACEHOLDER_DEPTH,
+    ):
+        """Initialize the expander.
+
+        Args:
+            lookup: Callable returning the raw value for a name, or None if not found.
+            remove_unfound: If True, remove placeholders without replacements.
+            keep: Predicate for names left as markers, to be filled in later.
+            max_depth: Maximum nesting of placeholder values.
+        """
+        self.lookup = lookup
+        self.remove_unfound = remove_unfound
+        self.keep = keep
+        self.max_depth = max_depth
+        # Expanded value of each name, with the names it used directly or
+        # through nesting: (value, replaced, unresolved)
+        self.memo: dict[str, tuple[str | None, set[str], set[str]]] = {}
+
+    def expand_text(
+        self, content: str, result: SubstitutionResult, stack: tuple[str, ...] = ()
+    ) -> str:
+        """Expand every placeholder in content.
+
+        Args:
+            content: Text content with {{PLACEHOLDER}} markers.
+            result: Collects the replaced and unresolved names.
+            stack: Names whose values are being expanded, outermost first.
+
+        Returns:
+            Expanded text.
+
+        Raises:
+            PlaceholderCycleError: If placeholder values reference each other in a cycle.
+            PlaceholderDepthError: If values are nested deeper than max_depth.
+        """
+
+        def _substitute(match: re.Match[str]) -> str:
+            name = match.group(1)
+            if self.keep is not None and self.keep(name):
+                return match.group(0)
+
+            value, replaced, unresolved = self._expand(name, stack)
+            result.replaced |= replaced
+            result.unresolved |= unresolved
+            if value is not None:
+                return value
+            return "" if self.remove_unfound else match.group(0)
+
+        return PLACEHOLDER_PATTERN.sub(_substitute, content)
+
+    def expand(self, name: str) -> str | None:
+        """Expand a single placeholder, memoized.
+
+        Args:
+            name: Placeholder name.
+
+        Returns:
+            Fully expanded value, or None if not found.
+        """
+        return self._expand(name, ())[0]
+
+    def _expand(self, name: str, stack: tuple[str, ...]) -> tuple[str | None, set[str], set[str]]:
+        """Expand a placeholder reached through stack, memoized."""
+        entry = self.memo.get(name)
+        if entry is not None:
+            return entry
+        if name in stack:
+            raise PlaceholderCycleError([*stack[stack.index(name) :], name])
+        if len(stack) >= self.max_depth:
+            raise PlaceholderDepthError([*stack, name], self.max_depth)
+
+        value = self.lookup(name)
+        nested = SubstitutionResult(text="")
+        if value is None:
+            nested.unresolved.add(name)
+        else:
+            nested.replaced.add(name)
+            if "{{" in value:
+                value = self.expand_text(value, nested, (*stack, name))
+
+        entry = self.memo[name] = (value, nested.replaced, nested.unresolved)
+        return entry
+
+
+def substitute_placeholders(
+    content: str,
+    lookup: Callable[[str], str | None],
+    remove_unfound: bool = True,
+    max_depth: int = MAX_PLACEHOLDER_DEPTH,
+) -> SubstitutionResult:
+    """Replace all placeholders in a single regex pass.
+
+    Placeholder values may themselves contain placeholders, which are
+    expanded recursively. Each distinct name is looked up and expanded
+    once, however often it appears.
+
+    Args:
+        content: Text content with {{PLACEHOLDER}} markers.
+        lookup: Callable returning the value for a name, or None if not found.
+        remove_unfound: If True, remove placeholders without replacements.
+                       If False, leave them as-is.
+        max_depth: Maximum nesting of placeholder values.
+
+    Returns:
+        SubstitutionResult with rendered text and replaced/unresolved names.
+
+    Raises:
+        PlaceholderCycleError: If placeholder values reference each other in a cycle.
+        PlaceholderDepthError: If values are nested deeper than max_depth.
+    """
+    result = SubstitutionResult(text=content)
+    expander = _Expander(lookup, remove_unfound, max_depth=max_depth)
+    result.text = expander.expand_text(content, result)
+    return result
+
+
+@dataclass
+class CompiledTemplate:
+    """Template rendered up to its platform-specific placeholders.
+
+    The platform-independent placeholders are already substituted; the
+    remaining platform slots are filled in by render().
+    """
+
+    chunks: list[str]
+    """Literal text around the platform slots (len(slots) + 1 items)."""
+
+    slots: list[str] = field(default_factory=list)
+    """Platform placeholder names, in order of appearance."""
+
+    replaced: set[str] = field(default_factory=set)
+    """Platform-independent placeholders that were replaced."""
+
+    unresolved: set[str] = field(default_factory=set)
+    """Platform-independent placeholders that had no value."""
+
+    remove_unfound: bool = True
+    """Whether unresolved platform slots are removed or kept as markers."""
+
+    def render(self, platform: str | None = None) -> SubstitutionResult:
+        """Fill in the platform slots.
+
+        Args:
+            platform: Platform name ("claude" or "gemini").
+
+        Returns:
+            SubstitutionResult with the final text and replaced/unresolved names.
+        """
+        result = SubstitutionResult(
+            text=self.chunks[0],
+            replaced=set(self.replaced),
+            unresolved=set(self.unresolved),
+        )
+        if not self.slots:
+            return result
+
+        parts = [self.chunks[0]]
+        for name, chunk in zip(self.slots, self.chunks[1:]):
+            value = get_platform_placeholder(name, platform)
+            if value is not None:
+                result.replaced.add(name)
+                parts.append(value)
+            else:
+                result.unresolved.add(name)
+                parts.append("" if self.remove_unfound else f"{{{{{name}}}}}")
+            parts.append(chunk)
+
+        result.text = "".join(parts)
+        return result
+
+
 def get_platform_placeholder(name: str, platform: str | None) -> str | None:
     """Get placeholder value based on platform.
 
@@ -45,14 +277,11 @@ def get_platform_placeholder(name: str, platform: str | None) -> str | None:
     if platform is None:
         return None
 
-    if name == "AGENT_FILE":
-        platform_files = {
-            "claude": "CLAUDE.md",
-            "gemini": "GEMINI.md",
-        }
-        return platform_files.get(platform)
+    platform_values = PLATFORM_PLACEHOLDERS.get(name)
+    if platform_values is None:
+        return None
 
-    return None
+    return platform_values.get(platform)
 
 
 def get_config_placeholder(name: str, config: Config | None) -> str | None:
@@ -117,19 +346,29 @@ def load_placeholder(
     if config_value is not None:
         return config_value
 
-    # Try cached placeholder (from tdd-llm update)
+    # Try cached placeholder (from tdd-llm update), packed or loose
     if not no_cache:
-        if lang:
-            cached_lang_file = get_cached_lang_placeholders_dir(lang) / f"{name}.md"
-            if cached_lang_file.exists():
-                return cached_lang_file.read_text(encoding="utf-8").strip()
-
-        if backend:
-            cached_backend_file = get_cached_backend_placeholders_dir(backend) / f"{name}.md"
-            if cached_backend_file.exists():
-                return cached_backend_file.read_text(encoding="utf-8").strip()
+        cache_bundle = get_cache_bundle()
+        if cache_bundle is not None:
+            value = _lookup_bundle_placeholder(cache_bundle, name, lang, backend)
+            if value is not None:
+                return value
+        else:
+            if lang:
+                cached_lang_file = get_cached_lang_placeholders_dir(lang) / f"{name}.md"
+                if cached_lang_file.exists():
+                    return cached_lang_file.read_text(encoding="utf-8").strip()
+
+            if backend:
+                cached_backend_file = get_cached_backend_placeholders_dir(backend) / f"{name}.md"
+                if cached_backend_file.exists():
+                    return cached_backend_file.read_text(encoding="utf-8").strip()
+
+    # Fall back to package placeholder (bundle first, then loose files)
+    bundle = get_package_bundle()
+    if bundle is not None:
+        return _lookup_bundle_placeholder(bundle, name, lang, backend)
 
-    # Fall back to package placeholder
     if lang:
         lang_dir = get_lang_placeholders_dir(lang)
         lang_file = lang_dir / f"{name}.md"
@@ -145,6 +384,281 @@ def load_placeholder(
     return None
 
 
+def _read_placeholder_dir(directory: Path) -> dict[str, str]:
+    """Read every placeholder file in a directory.
+
+    Args:
+        directory: Placeholder directory (may not exist).
+
+    Returns:
+        Dict mapping placeholder names to their stripped content.
+    """
+    if not directory.is_dir():
+        return {}
+
+    return {
+        file.stem: file.read_text(encoding="utf-8").strip()
+        for file in directory.glob("*.md")
+        if file.is_file()
+    }
+
+
+def _lookup_bundle_placeholder(
+    bundle: TemplateBundle, name: str, lang: str | None, backend: str | None
+) -> str | None:
+    """Look up a placeholder in a bundle, language first then backend.
+
+    Args:
+        bundle: Template bundle to read from.
+        name: Placeholder name.
+        lang: Language name.
+        backend: Backend name.
+
+    Returns:
+        Stripped placeholder content or None if not in the bundle.
+    """
+    for kind, kind_name in (("langs", lang), ("backends", backend)):
+        if kind_name:
+            value = bundle.read_text(f"placeholders/{kind}/{kind_name}/{name}.md")
+            if value is not None:
+                return value.strip()
+    return None
+
+
+def _read_bundle_placeholders(bundle: TemplateBundle, kind: str, name: str) -> dict[str, str]:
+    """Read every placeholder of a language or backend from a bundle.
+
+    Args:
+        bundle: Template bundle to read from.
+        kind: "langs" or "backends".
+        name: Language or backend name.
+
+    Returns:
+        Dict mapping placeholder names to their stripped content.
+    """
+    prefix = f"placeholders/{kind}/{name}"
+    return {
+        path.removesuffix(".md"): bundle.read_text(f"{prefix}/{path}").strip()
+        for path in bundle.files(prefix)
+        if "/" not in path and path.endswith(".md")
+    }
+
+
+def _read_package_placeholders(kind: str, name: str) -> dict[str, str]:
+    """Read the package placeholders of a language or backend.
+
+    Uses the packed template bundle when the package ships one, otherwise
+    the loose placeholder files.
+
+    Args:
+        kind: "langs" or "backends".
+        name: Language or backend name.
+
+    Returns:
+        Dict mapping placeholder names to their stripped content.
+    """
+    bundle = get_package_bundle()
+    if bundle is not None:
+        return _read_bundle_placeholders(bundle, kind, name)
+
+    if kind == "langs":
+        return _read_placeholder_dir(get_lang_placeholders_dir(name))
+    return _read_placeholder_dir(get_backend_placeholders_dir(name))
+
+
+def _read_cached_placeholders(kind: str, name: str) -> dict[str, str]:
+    """Read the cached placeholders of a language or backend.
+
+    Uses the memory-mapped cache bundle written by `tdd-llm update` when
+    present, otherwise the loose cached files.
+
+    Args:
+        kind: "langs" or "backends".
+        name: Language or backend name.
+
+    Returns:
+        Dict mapping placeholder names to their stripped content.
+    """
+    bundle = get_cache_bundle()
+    if bundle is not None:
+        return _read_bundle_placeholders(bundle, kind, name)
+
+    if kind == "langs":
+        return _read_placeholder_dir(get_cached_lang_placeholders_dir(name))
+    return _read_placeholder_dir(get_cached_backend_placeholders_dir(name))
+
+
+class PlaceholderResolver:
+    """Placeholder lookup table compiled once for a lang/backend combination.
+
+    Scans the cached and package placeholder directories a single time so that
+    rendering many templates does not hit the filesystem per placeholder.
+    Resolution order matches load_placeholder().
+    """
+
+    def __init__(
+        self,
+        lang: str | None,
+        backend: str | None,
+        config: Config | None = None,
+        no_cache: bool = False,
+    ):
+        """Build the lookup table.
+
+        Args:
+            lang: Language name (e.g., "python").
+            backend: Backend name (e.g., "jira").
+            config: Config instance for config-based placeholders.
+            no_cache: If True, skip cached placeholders and use package only.
+        """
+        self.lang = lang
+        self.backend = backend
+        self.config = config
+        self.no_cache = no_cache
+
+        # Lowest priority first, so higher priority sources override
+        self.values: dict[str, str] = {}
+        if backend:
+            self.values.update(_read_package_placeholders("backends", backend))
+        if lang:
+            self.values.update(_read_package_placeholders("langs", lang))
+        if not no_cache:
+            if backend:
+                self.values.update(_read_cached_placeholders("backends", backend))
+            if lang:
+                self.values.update(_read_cached_placeholders("langs", lang))
+
+        # Expanded values, memoized per remove_unfound mode for the whole run
+        self._expanders: dict[bool, _Expander] = {}
+
+    def resolve(self, name: str, platform: str | None = None) -> str | None:
+        """Resolve a placeholder value.
+
+        Args:
+            name: Placeholder name.
+            platform: Platform name ("claude" or "gemini") for platform-specific placeholders.
+
+        Returns:
+            Placeholder content or None if not found.
+        """
+        platform_value = get_platform_placeholder(name, platform)
+        if platform_value is not None:
+            return platform_value
+
+        config_value = get_config_placeholder(name, self.config)
+        if config_value is not None:
+            return config_value
+
+        return self.values.get(name)
+
+    def expand(self, name: str, remove_unfound: bool = True) -> str | None:
+        """Expand a placeholder, including placeholders nested in its value.
+
+        Expansion is memoized on the resolver, so each placeholder is
+        expanded once however many templates reference it. Platform
+        placeholders nested in values are kept as markers.
+
+        Args:
+            name: Placeholder name.
+            remove_unfound: If True, remove nested placeholders without replacements.
+
+        Returns:
+            Expanded content or None if not found.
+
+        Raises:
+            PlaceholderCycleError: If placeholder values reference each other in a cycle.
+            PlaceholderDepthError: If values are nested deeper than MAX_PLACEHOLDER_DEPTH.
+        """
+        return self._expander(remove_unfound).expand(name)
+
+    def _expander(self, remove_unfound: bool) -> _Expander:
+        """Get the memoizing expander for a remove_unfound mode."""
+        expander = self._expanders.get(remove_unfound)
+        if expander is None:
+            # setdefault so threads racing here end up sharing one memo
+            expander = self._expanders.setdefault(
+                remove_unfound,
+                _Expander(
+                    self.resolve, remove_unfound, keep=lambda name: name in PLATFORM_PLACEHOLDERS
+                ),
+            )
+        return expander
+
+    def compile(self, content: str, remove_unfound: bool = True) -> CompiledTemplate:
+        """Render the platform-independent part of a template.
+
+        Platform placeholders, including those nested in placeholder values,
+        are left as slots so the result can be rendered for every platform
+        without re-expanding the content.
+
+        Args:
+            content: Text content with {{PLACEHOLDER}} markers.
+            remove_unfound: If True, remove placeholders without replacements.
+
+        Returns:
+            CompiledTemplate ready for per-platform rendering.
+
+        Raises:
+            PlaceholderCycleError: If placeholder values reference each other in a cycle.
+            PlaceholderDepthError: If values are nested deeper than MAX_PLACEHOLDER_DEPTH.
+        """
+        expanded = SubstitutionResult(text="")
+        text = self._expander(remove_unfound).expand_text(content, expanded)
+
+        compiled = CompiledTemplate(
+            chunks=[],
+            replaced=expanded.replaced,
+            unresolved=expanded.unresolved,
+            remove_unfound=remove_unfound,
+        )
+        pos = 0
+        for match in PLACEHOLDER_PATTERN.finditer(text):
+            name = match.group(1)
+            if name in PLATFORM_PLACEHOLDERS:
+                compiled.chunks.append(text[pos : match.start()])
+                compiled.slots.append(name)
+                pos = match.end()
+
+        compiled.chunks.append(text[pos:])
+        return compiled
+
+    def render(
+        self,
+        content: str,
+        platform: str | None = None,
+        remove_unfound: bool = True,
+    ) -> SubstitutionResult:
+        """Render content using the compiled table.
+
+        Args:
+            content: Text content with {{PLACEHOLDER}} markers.
+            platform: Platform name ("claude" or "gemini") for platform-specific placeholders.
+            remove_unfound: If True, remove placeholders without replacements.
+
+        Returns:
+            SubstitutionResult with rendered text and replaced/unresolved names.
+        """
+        return self.compile(content, remove_unfound).render(platform)
+
+    def replace(
+        self,
+        content: str,
+        platform: str | None = None,
+        remove_unfound: bool = True,
+    ) -> str:
+        """Replace all placeholders in content using the compiled table.
+
+        Args:
+            content: Text content with {{PLACEHOLDER}} markers.
+            platform: Platform name ("claude" or "gemini") for platform-specific placeholders.
+            remove_unfound: If True, remove placeholders without replacements.
+
+        Returns:
+            Content with placeholders replaced.
+        """
+        return self.render(content, platform, remove_unfound).text
+
+
 def replace_placeholders(
     content: str,
     lang: str | None = None,
@@ -169,18 +683,12 @@ def replace_placeholders(
     Returns:
         Content with placeholders replaced.
     """
-    placeholders = find_placeholders(content)
-
-    for name in placeholders:
-        replacement = load_placeholder(name, lang, backend, config, no_cache, platform)
-
-        if replacement is not None:
-            content = content.replace(f"{{{{{name}}}}}", replacement)
-        elif remove_unfound:
-            # Remove the placeholder entirely
-            content = content.replace(f"{{{{{name}}}}}", "")
-
-    return content
+    result = substitute_placeholders(
+        content,
+        lambda name: load_placeholder(name, lang, backend, config, no_cache, platform),
+        remove_unfound,
+    )
+    return result.text
 
 
 def process_file(
@@ -203,17 +711,15 @@ def process_file(
         List of placeholder names that were replaced.
     """
     content = source.read_text(encoding="utf-8")
-    original_placeholders = find_placeholders(content)
 
-    processed = replace_placeholders(content, lang, backend, config)
+    result = substitute_placeholders(
+        content, lambda name: load_placeholder(name, lang, backend, config)
+    )
 
     dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_text(processed, encoding="utf-8")
+    dest.write_text(result.text, encoding="utf-8")
 
-    # Return which placeholders were actually replaced
-    remaining = find_placeholders(processed)
-    replaced = original_placeholders - remaining
-    return list(replaced)
+    return list(result.replaced)
 
 
 def get_all_placeholders_for_lang(lang: str) -> dict[str, str]:
@@ -225,16 +731,7 @@ def get_all_placeholders_for_lang(lang: str) -> dict[str, str]:
     Returns:
         Dict mapping placeholder names to their content.
     """
-    lang_dir = get_lang_placeholders_dir(lang)
-    if not lang_dir.exists():
-        return {}
-
-    result = {}
-    for file in lang_dir.glob("*.md"):
-        name = file.stem
-        result[name] = file.read_text(encoding="utf-8").strip()
-
-    return result
+    return _read_package_placeholders("langs", lang)
 
 
 def get_all_placeholders_for_backend(backend: str) -> dict[str, str]:
@@ -246,13 +743,4 @@ def get_all_placeholders_for_backend(backend: str) -> dict[str, str]:
     Returns:
         Dict mapping placeholder names to their content.
     """
-    backend_dir = get_backend_placeholders_dir(backend)
-    if not backend_dir.exists():
-        return {}
-
-    result = {}
-    for file in backend_dir.glob("*.md"):
-        name = file.stem
-        result[name] = file.read_text(encoding="utf-8").strip()
-
-    return result
+    return _read_package_placeholders("backends", backend)
@@ -0,0 +1,228 @@
+"""Content-addressed store of downloaded template versions.
+
+Every template body downloaded by `tdd-llm update` is kept as a blob named
+after its SHA-256 checksum, the same checksum the manifest lists, so a file
+shared by several releases is stored once. Each release is recorded by its
+manifest, and a pointer names the active one:
+
+    template-store/
+        objects/ab/cdef...     # blob, named by SHA-256 of its content
+        versions/1.2.0.json    # manifest of a stored release
+        active                 # version materialized in the templates cache
+        previous               # version active before it, for rollback
+
+The templates cache stays the working copy every reader uses; the store
+is what lets it be rebuilt for the previous version without downloading.
+Only the active and previous versions are kept: switching versions prunes
+the others and the blobs no kept version uses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+# Characters allowed in a version, which names its manifest file
+_VERSION_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._+-]*$")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file through a temporary file and a rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class TemplateStore:
+    """Blobs and manifests of every template version downloaded."""
+
+    def __init__(self, root: Path):
+        """Initialize the store.
+
+        Args:
+            root: Store directory, created on first write.
+        """
+        self.root = root
+        self.objects_dir = root / "objects"
+        self.versions_dir = root / "versions"
+
+    def blob_path(self, checksum: str) -> Path:
+        """Get the path of the blob with the given SHA-256 checksum."""
+        return self.objects_dir / checksum[:2] / checksum[2:]
+
+    def has_blob(self, checksum: str) -> bool:
+        """Check whether a blob is stored."""
+        return self.blob_path(checksum).is_file()
+
+    def add_file(self, path: Path, checksum: str) -> None:
+        """Store a file whose checksum is already known.
+
+        Args:
+            path: File to store.
+            checksum: SHA-256 checksum of its content, verified by the caller.
+        """
+        blob = self.blob_path(checksum)
+        if blob.is_file():
+            return
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_name(f".{blob.name}.{os.getpid()}.tmp")
+        shutil.copyfile(path, tmp)
+        os.replace(tmp, blob)
+
+    def read_blob(self, checksum: str) -> bytes | None:
+        """Read a blob, verifying its content.
+
+        A blob that no longer matches its name is deleted, so it will be
+        downloaded again.
+
+        Args:
+            checksum: SHA-256 checksum of the content.
+
+        Returns:
+            Content, or None if the blob is missing or corrupt.
+        """
+        blob = self.blob_path(checksum)
+        try:
+            content = blob.read_bytes()
+        except OSError:
+            return None
+        if hashlib.sha256(content).hexdigest() != checksum:
+            blob.unlink(missing_ok=True)
+            return None
+        return content
+
+    def restore(self, checksum: str, dest: Path) -> bool:
+        """Copy a blob out of the store.
+
+        Args:
+            checksum: SHA-256 checksum of the content.
+            dest: Where to write the content.
+
+        Returns:
+            True if the blob was available and written to dest.
+        """
+        content = self.read_blob(checksum)
+        if content is None:
+            return False
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(content)
+        return True
+
+    def _version_path(self, version: str) -> Path:
+        """Get the manifest path of a version, rejecting unsafe names."""
+        if not _VERSION_PATTERN.match(version):
+            raise ValueError(f"Invalid template version: {version!r}")
+        return self.versions_dir / f"{version}.json"
+
+    def save_version(self, version: str, manifest: dict) -> None:
+        """Record the manifest of a version.
+
+        Args:
+            version: Template version.
+            manifest: Manifest JSON data, with a "templates" path -> checksum map.
+
+        Raises:
+            ValueError: If the version cannot be used as a file name.
+        """
+        data = json.dumps(manifest, indent=2).encode("utf-8")
+        _write_atomic(self._version_path(version), data)
+
+    def load_version(self, version: str) -> dict | None:
+        """Load the manifest recorded for a version.
+
+        Args:
+            version: Template version.
+
+        Returns:
+            Manifest JSON data, or None if the version is not stored.
+        """
+        try:
+            with open(self._version_path(version), encoding="utf-8") as f:
+                data = json.load(f)
+        except (ValueError, OSError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def versions(self) -> list[str]:
+        """List the stored versions, sorted by name."""
+        if not self.versions_dir.is_dir():
+            return []
+        return sorted(path.stem for path in self.versions_dir.glob("*.json"))
+
+    def missing_blobs(self, manifest: dict) -> list[str]:
+        """List the files of a manifest whose blob is not stored.
+
+        Args:
+            manifest: Manifest JSON data.
+
+        Returns:
+            Relative paths of the files that would need a download.
+        """
+        templates = manifest.get("templates", {})
+        return [path for path, checksum in templates.items() if not self.has_blob(checksum)]
+
+    def _read_pointer(self, name: str) -> str | None:
+        """Read a version pointer file, None if unset."""
+        try:
+            value = (self.root / name).read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        return value or None
+
+    def active(self) -> str | None:
+        """Get the version materialized in the templates cache."""
+        return self._read_pointer("active")
+
+    def previous(self) -> str | None:
+        """Get the version that was active before the current one."""
+        return self._read_pointer("previous")
+
+    def set_active(self, version: str) -> None:
+        """Point the store at a new active version.
+
+        The version it replaces becomes the rollback target, and every
+        other version is pruned.
+
+        Args:
+            version: Template version, which must be stored.
+        """
+        current = self.active()
+        if current != version:
+            if current:
+                _write_atomic(self.root / "previous", current.encode("utf-8"))
+            _write_atomic(self.root / "active", version.encode("utf-8"))
+
+        self.prune({name for name in (version, self.previous()) if name})
+
+    def prune(self, keep: set[str]) -> None:
+        """Delete the versions not in keep, and the blobs none of them use.
+
+        Args:
+            keep: Versions to keep.
+        """
+        used: set[str] = set()
+        for version in keep:
+            manifest = self.load_version(version)
+            if manifest is not None:
+                used.update(manifest.get("templates", {}).values())
+
+        for version in self.versions():
+            if version not in keep:
+                (self.versions_dir / f"{version}.json").unlink(missing_ok=True)
+
+        if not self.objects_dir.is_dir():
+            return
+        for fanout in self.objects_dir.iterdir():
+            if not fanout.is_dir():
+                continue
+            for blob in fanout.iterdir():
+                # Hidden files are blobs being written by add_file()
+                if not blob.name.startswith(".") and fanout.name + blob.name not in used:
+                    blob.unlink(missing_ok=True)
+            if not any(fanout.iterdir()):
+                fanout.rmdir()
@@ -2,23 +2,60 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import itertools
 import json
+import os
 import shutil
+import subprocess
+import sys
+import tarfile
 import tempfile
-from collections.abc import Callable
+import time
+import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 
 import httpx
 
-from .paths import get_templates_cache_dir
+from .bundle import BUNDLE_NAME, clear_cache_bundle, repack_bundle
+from .http_client import create_client
+from .paths import get_templates_cache_dir, get_templates_dir, get_templates_store_dir
+from .store import TemplateStore
 
 # Constants
 GITHUB_RAW_BASE = "https://raw.githubusercontent.com/mxdumas/tdd-llm-workflow/main"
 TEMPLATES_PATH = "src/tdd_llm/templates"
-MANIFEST_URL = f"{GITHUB_RAW_BASE}/{TEMPLATES_PATH}/manifest.json"
+TEMPLATES_BASE_URL = f"{GITHUB_RAW_BASE}/{TEMPLATES_PATH}"
+MANIFEST_URL = f"{TEMPLATES_BASE_URL}/manifest.json"
+# Default number of files downloaded in parallel
+DEFAULT_DOWNLOAD_WORKERS = 8
+# HTTP validators (ETag / Last-Modified) of the cached manifest, kept in the cache
+VALIDATORS_NAME = ".http-cache.json"
+# (size, mtime_ns, sha256) of the cached files, to skip rehashing unchanged ones
+HASH_CACHE_NAME = ".hash-cache.json"
+# Files modified this close to the index write may share its mtime tick
+RACY_WINDOW_NS = 2_000_000_000
+# Largest template file accepted, to guard against a bad mirror
+MAX_FILE_SIZE = 10 * 1024 * 1024
+# Largest templates archive accepted
+MAX_ARCHIVE_SIZE = 100 * 1024 * 1024
+# Share of the templates that must be fetched before the whole archive is
+# downloaded instead of the files one by one
+ARCHIVE_MIN_SHARE = 0.3
+# Times an interrupted download is resumed before giving up
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# When the last background update check ran and what it found, next to manifest.json
+UPDATE_CHECK_NAME = ".update-check.json"
+# Background checks give up quickly: nobody waits for them
+UPDATE_CHECK_TIMEOUT = 10.0
 # Cache-busting headers to avoid stale CDN responses
 CACHE_BUSTING_HEADERS = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
 
@@ -29,18 +66,26 @@ class Manifest:
 
     version: str
     templates: dict[str, str]  # path -> checksum
+    archive: str | None = None  # tar.gz/zip of the templates tree, relative or absolute URL
+    archive_checksum: str | None = None
 
     @classmethod
     def from_json(cls, data: dict) -> Manifest:
         """Create manifest from JSON data."""
+        archive = data.get("archive") or {}
         return cls(
             version=data.get("version", "0.0.0"),
             templates=data.get("templates", {}),
+            archive=archive.get("path"),
+            archive_checksum=archive.get("sha256"),
         )
 
     def to_json(self) -> dict:
         """Convert manifest to JSON-serializable dict."""
-        return {"version": self.version, "templates": self.templates}
+        data: dict = {"version": self.version, "templates": self.templates}
+        if self.archive:
+            data["archive"] = {"path": self.archive, "sha256": self.archive_checksum}
+        return data
 
 
 @dataclass
@@ -52,6 +97,7 @@ class UpdateResult:
     previous_version: str | None = None
     files_updated: list[str] = field(default_factory=list)
     files_unchanged: list[str] = field(default_factory=list)
+    files_removed: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
 
 
@@ -67,24 +113,579 @@ def get_local_manifest() -> Manifest | None:
         return None
 
 
-def _fetch_remote_manifest(client: httpx.Client) -> Manifest:
-    """Fetch manifest from GitHub."""
-    response = client.get(MANIFEST_URL, headers=CACHE_BUSTING_HEADERS)
-    response.raise_for_status()
-    return Manifest.from_json(response.json())
+def _load_validators(cache_dir: Path) -> dict[str, dict[str, str]]:
+    """Load the HTTP validators recorded for the cached manifest.
 
+    Args:
+        cache_dir: Templates cache directory.
 
-def _download_file(client: httpx.Client, relative_path: str, dest: Path) -> str:
-    """Download a single file and return its checksum."""
-    url = f"{GITHUB_RAW_BASE}/{TEMPLATES_PATH}/{relative_path}"
-    response = client.get(url, headers=CACHE_BUSTING_HEADERS)
+    Returns:
+        Dict mapping relative paths to {"etag", "last_modified"} values.
+    """
+    try:
+        with open(cache_dir / VALIDATORS_NAME, encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_validators(directory: Path, validators: dict[str, dict[str, str]]) -> None:
+    """Write HTTP validators next to the manifest they describe.
+
+    Args:
+        directory: Templates directory (the cache or its staging copy).
+        validators: Dict mapping relative paths to their validators.
+    """
+    path = directory / VALIDATORS_NAME
+    tmp = path.with_name(f"{path.name}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(validators, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _request_headers(validators: dict[str, str] | None) -> dict[str, str]:
+    """Build request headers, conditional when validators are known.
+
+    Args:
+        validators: Validators from a previous response, if any.
+
+    Returns:
+        Headers for the GET request.
+    """
+    headers = dict(CACHE_BUSTING_HEADERS)
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _response_validators(response: httpx.Response) -> dict[str, str]:
+    """Extract the validators to send with the next request for a resource.
+
+    Args:
+        response: Successful response.
+
+    Returns:
+        Dict with "etag" and/or "last_modified", empty if the server sent neither.
+    """
+    validators = {}
+    if "ETag" in response.headers:
+        validators["etag"] = response.headers["ETag"]
+    if "Last-Modified" in response.headers:
+        validators["last_modified"] = response.headers["Last-Modified"]
+    return validators
+
+
+def _fetch_remote_manifest(
+    client: httpx.Client,
+    base_url: str = TEMPLATES_BASE_URL,
+    validators: dict[str, str] | None = None,
+) -> tuple[Manifest | None, dict[str, str]]:
+    """Fetch manifest from GitHub.
+
+    Args:
+        client: HTTP client.
+        base_url: URL of the templates directory.
+        validators: Validators of the cached manifest, to make the request conditional.
+
+    Returns:
+        Tuple of (manifest, its validators). The manifest is None if the
+        server answered 304 Not Modified.
+    """
+    response = client.get(f"{base_url}/manifest.json", headers=_request_headers(validators))
+    if validators and response.status_code == 304:
+        return None, validators
     response.raise_for_status()
+    return Manifest.from_json(response.json()), _response_validators(response)
+
+
+def _stream_download(
+    client: httpx.Client,
+    url: str,
+    dest: Path,
+    headers: dict[str, str],
+    max_size: int,
+) -> str:
+    """Stream a URL to a file, hashing it as it arrives.
 
-    content = response.content
+    The body goes to a ".part" file renamed to dest once complete, so memory
+    use does not grow with the file. If the connection drops mid-transfer,
+    the download resumes from the bytes received with an HTTP Range request
+    (guarded by If-Range), and starts over if the server ignores the range.
+    Bodies are requested without content encoding so ranges line up with
+    the bytes already written.
+
+    Args:
+        client: HTTP client.
+        url: URL to download.
+        dest: Where to write the file.
+        headers: Request headers.
+        max_size: Largest body accepted, in bytes.
+
+    Returns:
+        SHA-256 checksum of the body.
+
+    Raises:
+        ValueError: If the body is larger than max_size.
+        httpx.TransportError: If the transfer still fails after the retries.
+    """
+    part = dest.with_name(f"{dest.name}.part")
     dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_bytes(content)
+    digest = hashlib.sha256()
+    received = 0
+    validators: dict[str, str] = {}
+    attempt = 0
+
+    while True:
+        # Byte ranges must address the stored body, not a compressed encoding
+        request_headers = {**headers, "Accept-Encoding": "identity"}
+        if received:
+            # Resume the same representation
+            request_headers["Range"] = f"bytes={received}-"
+            if_range = validators.get("etag") or validators.get("last_modified")
+            if if_range:
+                request_headers["If-Range"] = if_range
+
+        try:
+            with client.stream("GET", url, headers=request_headers) as response:
+                response.raise_for_status()
+
+                if received and response.status_code != 206:
+                    # Range ignored or resource changed: the full body follows
+                    digest = hashlib.sha256()
+                    received = 0
+                if not received:
+                    validators = _response_validators(response)
+
+                length = response.headers.get("Content-Length")
+                if length is not None and length.isdigit() and received + int(length) > max_size:
+                    raise ValueError(_too_large(url, max_size))
+
+                with open(part, "ab" if received else "wb") as f:
+                    for chunk in response.iter_bytes():
+                        received += len(chunk)
+                        if received > max_size:
+                            raise ValueError(_too_large(url, max_size))
+                        f.write(chunk)
+                        digest.update(chunk)
+            break
+        except (httpx.TransportError, httpx.StreamError):
+            attempt += 1
+            if attempt > DOWNLOAD_RETRIES:
+                part.unlink(missing_ok=True)
+                raise
+        except ValueError:
+            part.unlink(missing_ok=True)
+            raise
+
+    os.replace(part, dest)
+    return digest.hexdigest()
+
+
+def _too_large(url: str, max_size: int) -> str:
+    """Format the error reported when a download exceeds its size cap."""
+    return f"Download of {url} exceeds the size limit of {max_size} bytes"
+
+
+def _hash_file(path: Path) -> str:
+    """Compute the SHA-256 checksum of a file, reading it in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _download_file(
+    client: httpx.Client,
+    relative_path: str,
+    dest: Path,
+    base_url: str = TEMPLATES_BASE_URL,
+    max_size: int = MAX_FILE_SIZE,
+) -> str:
+    """Download a single file.
+
+    Args:
+        client: HTTP client.
+        relative_path: File path relative to the templates directory.
+        dest: Where to write the file.
+        base_url: URL of the templates directory.
+        max_size: Largest file accepted, in bytes.
+
+    Returns:
+        SHA-256 checksum of the content.
+
+    Raises:
+        ValueError: If the file is larger than max_size.
+    """
+    url = f"{base_url}/{relative_path}"
+    return _stream_download(client, url, dest, dict(CACHE_BUSTING_HEADERS), max_size)
+
+
+def _download_archive(
+    client: httpx.Client, url: str, dest: Path, max_size: int = MAX_ARCHIVE_SIZE
+) -> str:
+    """Stream an archive to disk and return its checksum.
+
+    Args:
+        client: HTTP client.
+        url: Archive URL.
+        dest: Where to write the archive.
+        max_size: Largest archive accepted, in bytes.
+
+    Returns:
+        SHA-256 checksum of the archive.
+
+    Raises:
+        ValueError: If the archive is larger than max_size.
+    """
+    return _stream_download(client, url, dest, dict(CACHE_BUSTING_HEADERS), max_size)
+
+
+def _iter_archive(archive: Path) -> Iterator[tuple[str, bytes]]:
+    """Yield the regular files of a tar (any compression) or zip archive.
+
+    Args:
+        archive: Archive file.
+
+    Yields:
+        Tuples of (POSIX path inside the archive, content).
+    """
+    if zipfile.is_zipfile(archive):
+        with zipfile.ZipFile(archive) as zf:
+            for info in zf.infolist():
+                if not info.is_dir():
+                    yield info.filename.removeprefix("./"), zf.read(info)
+        return
+
+    with tarfile.open(archive, "r:*") as tf:
+        for member in tf:
+            file = tf.extractfile(member) if member.isfile() else None
+            if file is not None:
+                yield member.name.removeprefix("./"), file.read()
+
+
+def _extract_from_archive(
+    client: httpx.Client,
+    manifest: Manifest,
+    base_url: str,
+    dest: Path,
+    wanted: list[str],
+) -> dict[str, str] | None:
+    """Fetch the manifest's archive and extract the wanted files.
+
+    Only paths listed in wanted are written, so archive entries can never
+    land outside dest.
+
+    Args:
+        client: HTTP client.
+        manifest: Remote manifest advertising the archive.
+        base_url: URL of the templates directory.
+        dest: Staging directory to extract into.
+        wanted: Relative paths of the files to extract.
+
+    Returns:
+        Dict mapping extracted paths to their checksums, or None if the
+        archive is not available and files must be fetched one by one.
+
+    Raises:
+        ValueError: If the archive does not match its manifest checksum.
+    """
+    url = manifest.archive
+    if not url.startswith(("http://", "https://")):
+        url = f"{base_url}/{url}"
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        archive_path = Path(archive_dir) / Path(manifest.archive).name
+        try:
+            checksum = _download_archive(client, url, archive_path)
+        except httpx.HTTPStatusError:
+            return None
+
+        if checksum != manifest.archive_checksum:
+            raise ValueError(
+                _checksum_mismatch(manifest.archive, manifest.archive_checksum or "", checksum)
+            )
+
+        wanted_paths = set(wanted)
+        extracted: dict[str, str] = {}
+        for rel_path, content in _iter_archive(archive_path):
+            if rel_path not in wanted_paths:
+                continue
+            file_path = dest / rel_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(content)
+            extracted[rel_path] = hashlib.sha256(content).hexdigest()
+
+    return extracted
+
+
+def _checksum_mismatch(name: str, expected: str, actual: str) -> str:
+    """Format the error reported when a download does not match the manifest."""
+    return f"Checksum mismatch for {name}: expected {expected[:8]}..., got {actual[:8]}..."
+
+
+class _HttpSource:
+    """Templates directory served over HTTP, by GitHub or a mirror."""
+
+    def __init__(self, client: httpx.Client, base_url: str, max_workers: int, max_file_size: int):
+        self.client = client
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.max_file_size = max_file_size
+
+    def fetch_manifest(
+        self, validators: dict[str, str] | None
+    ) -> tuple[Manifest | None, dict[str, str]]:
+        """Fetch the manifest, None if not modified since validators were issued."""
+        return _fetch_remote_manifest(self.client, self.base_url, validators)
+
+    def fetch_files(
+        self,
+        manifest: Manifest,
+        wanted: list[str],
+        dest: Path,
+    ) -> Iterator[tuple[str, str]]:
+        """Download files into dest, from the archive or one by one.
+
+        The archive is only worth its size when a large share of the
+        templates is wanted: below ARCHIVE_MIN_SHARE, or when the manifest
+        advertises none, files are fetched individually.
+
+        Requests are unconditional: only files whose cached copy is missing
+        or differs from the manifest are wanted, so there is nothing for a
+        304 to confirm.
+
+        Args:
+            manifest: Remote manifest.
+            wanted: Relative paths of the files to fetch.
+            dest: Staging directory.
+
+        Yields:
+            Tuples of (relative path, SHA-256 checksum), in the calling thread
+            as each file lands.
+        """
+        extracted: dict[str, str] = {}
+        if manifest.archive and len(wanted) > ARCHIVE_MIN_SHARE * len(manifest.templates):
+            extracted = (
+                _extract_from_archive(self.client, manifest, self.base_url, dest, wanted) or {}
+            )
+            for rel_path in wanted:
+                if rel_path in extracted:
+                    yield rel_path, extracted[rel_path]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _download_file,
+                    self.client,
+                    rel_path,
+                    dest / rel_path,
+                    self.base_url,
+                    self.max_file_size,
+                ): rel_path
+                for rel_path in wanted
+                if rel_path not in extracted
+            }
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                # Stop queued downloads if the caller gave up
+                for future in futures:
+                    future.cancel()
+
+
+class _DirectorySource:
+    """Templates directory on disk, such as an internal mirror."""
+
+    def __init__(self, root: Path, max_file_size: int):
+        self.root = root
+        self.max_file_size = max_file_size
+
+    def fetch_manifest(
+        self, validators: dict[str, str] | None
+    ) -> tuple[Manifest | None, dict[str, str]]:
+        """Read the manifest; local files carry no HTTP validators."""
+        manifest_path = self.root / "manifest.json"
+        if not manifest_path.is_file():
+            raise ValueError(f"No manifest.json in template source {self.root}")
+        with open(manifest_path, encoding="utf-8") as f:
+            return Manifest.from_json(json.load(f)), {}
+
+    def fetch_files(
+        self,
+        manifest: Manifest,
+        wanted: list[str],
+        dest: Path,
+    ) -> Iterator[tuple[str, str]]:
+        """Copy files into dest, hashing them on the way (see _HttpSource.fetch_files)."""
+        for rel_path in wanted:
+            source_path = self.root / rel_path
+            if source_path.stat().st_size > self.max_file_size:
+                raise ValueError(_too_large(str(source_path), self.max_file_size))
+            target = dest / rel_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source_path, target)
+            yield rel_path, _hash_file(target)
+
+
+class _ArchiveSource:
+    """Templates archive on disk, as written by scripts/generate_manifest.py --archive."""
+
+    def __init__(self, archive: Path, max_file_size: int):
+        self.archive = archive
+        self.max_file_size = max_file_size
+
+    def fetch_manifest(
+        self, validators: dict[str, str] | None
+    ) -> tuple[Manifest | None, dict[str, str]]:
+        """Read the manifest packed in the archive, or the one next to it."""
+        for rel_path, content in _iter_archive(self.archive):
+            if rel_path == "manifest.json":
+                return Manifest.from_json(json.loads(content)), {}
+        return _DirectorySource(self.archive.parent, self.max_file_size).fetch_manifest(None)
+
+    def fetch_files(
+        self,
+        manifest: Manifest,
+        wanted: list[str],
+        dest: Path,
+    ) -> Iterator[tuple[str, str]]:
+        """Extract files into dest (see _HttpSource.fetch_files).
+
+        Files missing from the archive are not yielded, which fails the update.
+        """
+        wanted_paths = set(wanted)
+        for rel_path, content in _iter_archive(self.archive):
+            if rel_path not in wanted_paths:
+                continue
+            if len(content) > self.max_file_size:
+                raise ValueError(_too_large(rel_path, self.max_file_size))
+            target = dest / rel_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+            yield rel_path, hashlib.sha256(content).hexdigest()
+
+
+def _open_source(
+    source: str, client: httpx.Client, max_workers: int, max_file_size: int
+) -> _HttpSource | _DirectorySource | _ArchiveSource:
+    """Pick the template source for a URL or path.
+
+    Args:
+        source: http(s) URL of a templates directory, or a local templates
+            directory, manifest.json or archive, as a path or file:// URL.
+        client: HTTP client, used by HTTP sources.
+        max_workers: Maximum number of parallel downloads.
+        max_file_size: Largest template file accepted, in bytes.
+
+    Returns:
+        Source object providing fetch_manifest() and fetch_files().
+
+    Raises:
+        ValueError: If a local source does not exist.
+    """
+    if source.startswith(("http://", "https://")):
+        return _HttpSource(client, source, max_workers, max_file_size)
+
+    if source.startswith("file://"):
+        path = Path(url2pathname(urlparse(source).path))
+    else:
+        path = Path(source).expanduser()
+
+    if path.is_file() and path.name == "manifest.json":
+        path = path.parent
+    if path.is_dir():
+        return _DirectorySource(path, max_file_size)
+    if path.is_file():
+        return _ArchiveSource(path, max_file_size)
+    raise ValueError(f"Template source not found: {source}")
+
+
+class _HashCache:
+    """SHA-256 checksums of the cached files, keyed by their stat data.
+
+    A file whose size and mtime_ns match its entry is not read again. Entries
+    whose mtime is within RACY_WINDOW_NS of the time the index was written
+    are not trusted, since the file may have changed again within the same
+    mtime tick (the "racy clean" case), and are rehashed on the next run.
+    """
+
+    def __init__(self, cache_dir: Path, verify: bool = False):
+        """Load the index of a cache directory.
+
+        Args:
+            cache_dir: Templates cache directory.
+            verify: If True, ignore recorded checksums and rehash every file.
+        """
+        self.path = cache_dir / HASH_CACHE_NAME
+        self.cache_dir = cache_dir
+        self.entries: dict[str, list] = {}
+        self.written_ns = 0
+        if verify:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries = dict(data["files"])
+            self.written_ns = int(data["written_ns"])
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError):
+            self.entries = {}
+
+    def checksum(self, rel_path: str) -> str | None:
+        """Get the checksum of a cached file, hashing it only if it changed.
+
+        Args:
+            rel_path: Path relative to the cache directory.
+
+        Returns:
+            SHA-256 checksum, or None if the file does not exist.
+        """
+        file_path = self.cache_dir / rel_path
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        entry = self.entries.get(rel_path)
+        if (
+            entry
+            and entry[0] == stat.st_size
+            and entry[1] == stat.st_mtime_ns
+            and stat.st_mtime_ns + RACY_WINDOW_NS <= self.written_ns
+        ):
+            return entry[2]
 
-    return hashlib.sha256(content).hexdigest()
+        try:
+            checksum = hashlib.sha256(file_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        self.entries[rel_path] = [stat.st_size, stat.st_mtime_ns, checksum]
+        return checksum
+
+    def matches(self, rel_path: str, expected: str) -> bool:
+        """Check a cached file against its manifest checksum."""
+        return self.checksum(rel_path) == expected
+
+    def record(self, rel_path: str, checksum: str) -> None:
+        """Record the checksum of a file just written to the cache."""
+        stat = os.stat(self.cache_dir / rel_path)
+        self.entries[rel_path] = [stat.st_size, stat.st_mtime_ns, checksum]
+
+    def forget(self, rel_path: str) -> None:
+        """Drop the entry of a file removed from the cache."""
+        self.entries.pop(rel_path, None)
+
+    def save(self) -> None:
+        """Write the index next to the files it describes."""
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"written_ns": time.time_ns(), "files": self.entries}, f, sort_keys=True)
+        os.replace(tmp, self.path)
 
 
 def _verify_checksum(file_path: Path, expected: str) -> bool:
@@ -96,15 +697,100 @@ def _verify_checksum(file_path: Path, expected: str) -> bool:
     return actual == expected
 
 
+def _apply_update(
+    cache_dir: Path,
+    staging_dir: Path,
+    manifest: Manifest,
+    changed: list[str],
+    removed: list[str],
+    validators: dict[str, dict[str, str]],
+    hashes: _HashCache,
+) -> None:
+    """Apply a verified update to the cache, touching only what changed.
+
+    Changed files are moved into place with atomic renames, removed files
+    are deleted, and the manifest is replaced last: until then the cache
+    still describes the previous version, and an interrupted update is
+    completed by the next one. The HTTP validators follow the manifest, so
+    they never claim a manifest that was not installed.
+
+    Args:
+        cache_dir: Templates cache directory.
+        staging_dir: Directory holding the verified changed files.
+        manifest: New manifest.
+        changed: Relative paths of added or modified files.
+        removed: Relative paths of files no longer in the manifest.
+        validators: HTTP validators for the new manifest.
+        hashes: Checksum index of the cache, updated for the changed files.
+    """
+    for rel_path in changed:
+        dest = cache_dir / rel_path
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staging_dir / rel_path, dest)
+
+    for rel_path in removed:
+        path = cache_dir / rel_path
+        path.unlink(missing_ok=True)
+        # Drop directories left empty, up to the cache root
+        parent = path.parent
+        while parent != cache_dir and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+    # Pack the new templates so reads take a single mapped file
+    clear_cache_bundle()
+    repack_bundle(cache_dir, cache_dir / BUNDLE_NAME, changed, removed, manifest.version)
+
+    staged_manifest = staging_dir / "manifest.json"
+    with open(staged_manifest, "w", encoding="utf-8") as f:
+        json.dump(manifest.to_json(), f, indent=2)
+    os.replace(staged_manifest, cache_dir / "manifest.json")
+
+    _save_validators(cache_dir, validators)
+
+    for rel_path in changed:
+        hashes.record(rel_path, manifest.templates[rel_path])
+    for rel_path in removed:
+        hashes.forget(rel_path)
+    hashes.save()
+
+
 def update_templates(
     force: bool = False,
     progress_callback: Callable[[int, int, str], None] | None = None,
+    max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    source: str = TEMPLATES_BASE_URL,
+    verify: bool = False,
+    max_file_size: int = MAX_FILE_SIZE,
 ) -> UpdateResult:
-    """Update templates from GitHub.
+    """Update templates from GitHub or another template source.
+
+    Files that changed are downloaded in parallel over one connection pool.
+    The progress callback is always called from the calling thread, once
+    per file as it completes.
+
+    Requests are conditional on the ETag / Last-Modified recorded at the
+    previous update, so an unchanged manifest costs a single 304 response.
+    When the manifest advertises an archive of the templates tree and a
+    large share of the files changed, they are taken from it in one
+    request; files are fetched one by one otherwise, or if the archive is
+    unavailable or incomplete.
+
+    Local sources (a mirror directory, or an archive written by
+    scripts/generate_manifest.py --archive) go through the same manifest
+    and checksum checks without touching the network.
 
     Args:
         force: If True, re-download all files regardless of version.
         progress_callback: Optional callback(current, total, filename) for progress.
+        max_workers: Maximum number of files downloaded at the same time.
+        source: Where to update from: URL of a templates directory (GitHub
+            or a mirror), or a local templates directory or archive, as a
+            path or file:// URL.
+        verify: If True, rehash every cached file instead of trusting the
+            checksums recorded for files whose size and mtime are unchanged,
+            and repair mismatches even when the version did not change.
+        max_file_size: Largest template file accepted from the server, in bytes.
 
     Returns:
         UpdateResult with details of what was done.
@@ -112,82 +798,389 @@ def update_templates(
     result = UpdateResult(status="error")
 
     try:
-        # Use fresh transport to avoid stale CDN edge connections
-        transport = httpx.HTTPTransport(retries=2)
-        with httpx.Client(timeout=30.0, follow_redirects=True, transport=transport) as client:
-            # Fetch remote manifest
-            remote_manifest = _fetch_remote_manifest(client)
-            result.version = remote_manifest.version
-
+        max_workers = max(1, max_workers)
+        # Own pool sized to the downloads, fresh to avoid stale CDN edge connections.
+        # Release assets such as the templates archive are served through redirects.
+        with create_client(max_connections=max_workers, follow_redirects=True) as client:
             # Check local manifest
             local_manifest = get_local_manifest()
             result.previous_version = local_manifest.version if local_manifest else None
 
-            # Check if update needed
-            if not force and local_manifest:
-                if local_manifest.version == remote_manifest.version:
+            # The manifest's validators only apply to a complete cache, and force ignores them
+            cache_dir = get_templates_cache_dir()
+            store = TemplateStore(get_templates_store_dir())
+            validators = _load_validators(cache_dir) if local_manifest and not force else {}
+
+            # Fetch remote manifest (None if not modified since last update).
+            # Verifying needs the manifest even when it did not change.
+            template_source = _open_source(source, client, max_workers, max_file_size)
+            remote_manifest, manifest_validators = template_source.fetch_manifest(
+                None if verify else validators.get("manifest.json")
+            )
+            if remote_manifest is None:
+                result.version = result.previous_version
+                result.status = "up_to_date"
+                _record_update_check(result.version)
+                return result
+            result.version = remote_manifest.version
+
+            new_validators = {"manifest.json": manifest_validators} if manifest_validators else {}
+
+            # Check if update needed; verifying checks the files of the same version too
+            same_version = bool(
+                local_manifest and local_manifest.version == remote_manifest.version
+            )
+            if not force and not verify and local_manifest:
+                if same_version:
+                    # Remember the new validators so the next check is conditional
+                    if manifest_validators != validators.get("manifest.json"):
+                        _save_validators(cache_dir, new_validators)
                     result.status = "up_to_date"
+                    _record_update_check(result.version)
                     return result
 
-            # Download to temp directory first (atomic update)
-            with tempfile.TemporaryDirectory() as temp_dir:
+            # Stage changed files next to the cache (same filesystem) before applying them
+            cache_dir.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(
+                dir=cache_dir.parent, prefix=f".{cache_dir.name}-update-"
+            ) as temp_dir:
                 temp_path = Path(temp_dir)
                 files_to_download = remote_manifest.templates
                 total = len(files_to_download)
+                current = 0
+                pending: list[str] = []
 
-                for idx, (rel_path, expected_checksum) in enumerate(files_to_download.items()):
+                hashes = _HashCache(cache_dir, verify=verify or force)
+                for rel_path, expected_checksum in files_to_download.items():
+                    # Check if we can skip (same checksum in cache)
+                    if force or not hashes.matches(rel_path, expected_checksum):
+                        pending.append(rel_path)
+                        continue
+
+                    current += 1
                     if progress_callback:
-                        progress_callback(idx + 1, total, rel_path)
+                        progress_callback(current, total, rel_path)
 
-                    dest = temp_path / rel_path
+                    result.files_unchanged.append(rel_path)
 
-                    # Check if we can skip (same checksum in cache)
-                    cache_file = get_templates_cache_dir() / rel_path
-                    if not force and cache_file.exists():
-                        if _verify_checksum(cache_file, expected_checksum):
-                            result.files_unchanged.append(rel_path)
-                            # Copy existing file to temp
-                            dest.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(cache_file, dest)
-                            continue
-
-                    # Download file
-                    actual_checksum = _download_file(client, rel_path, dest)
-
-                    # Verify checksum
-                    if actual_checksum != expected_checksum:
-                        result.errors.append(
-                            f"Checksum mismatch for {rel_path}: "
-                            f"expected {expected_checksum[:8]}..., got {actual_checksum[:8]}..."
-                        )
-                        result.status = "error"
-                        return result
+                if verify and same_version and not pending and not force:
+                    # Every cached file checked out against the manifest
+                    hashes.save()
+                    _save_validators(cache_dir, new_validators)
+                    result.status = "up_to_date"
+                    _record_update_check(result.version)
+                    return result
 
-                    result.files_updated.append(rel_path)
+                # Files of a version seen before come from the store, not the source
+                restored: list[tuple[str, str]] = []
+                if not force:
+                    for rel_path in pending:
+                        checksum = files_to_download[rel_path]
+                        if store.restore(checksum, temp_path / rel_path):
+                            restored.append((rel_path, checksum))
+                restored_paths = {rel_path for rel_path, _ in restored}
+                missing = [rel_path for rel_path in pending if rel_path not in restored_paths]
+
+                fetched = template_source.fetch_files(remote_manifest, missing, temp_path)
+                received: set[str] = set()
+                # Closing the generator stops queued downloads after a failure
+                with contextlib.closing(fetched):
+                    for rel_path, actual_checksum in itertools.chain(restored, fetched):
+                        received.add(rel_path)
+
+                        current += 1
+                        if progress_callback:
+                            progress_callback(current, total, rel_path)
 
-                # Save manifest to temp
-                manifest_dest = temp_path / "manifest.json"
-                with open(manifest_dest, "w", encoding="utf-8") as f:
-                    json.dump(remote_manifest.to_json(), f, indent=2)
+                        # Verify checksum
+                        expected_checksum = files_to_download[rel_path]
+                        if actual_checksum != expected_checksum:
+                            result.errors.append(
+                                _checksum_mismatch(rel_path, expected_checksum, actual_checksum)
+                            )
+                            result.status = "error"
+                            return result
 
-                # Atomic replace: remove old cache and move new
-                cache_dir = get_templates_cache_dir()
-                if cache_dir.exists():
-                    shutil.rmtree(cache_dir)
-                cache_dir.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copytree(temp_path, cache_dir)
+                not_found = [rel_path for rel_path in pending if rel_path not in received]
+                if not_found:
+                    result.errors.append(
+                        f"{len(not_found)} files listed in the manifest are missing from "
+                        f"the template source, first: {not_found[0]}"
+                    )
+                    return result
+
+                # Report in manifest order, whatever order downloads finished in
+                result.files_updated = pending
+
+                removed = [
+                    rel_path
+                    for rel_path in (local_manifest.templates if local_manifest else {})
+                    if rel_path not in files_to_download
+                ]
+                # Keep every file of the new version so it can be restored later
+                for rel_path, checksum in files_to_download.items():
+                    blob_path = (
+                        temp_path / rel_path if rel_path in pending else cache_dir / rel_path
+                    )
+                    store.add_file(blob_path, checksum)
+                store.save_version(remote_manifest.version, remote_manifest.to_json())
+
+                _apply_update(
+                    cache_dir, temp_path, remote_manifest, pending, removed, new_validators, hashes
+                )
+                store.set_active(remote_manifest.version)
+                result.files_removed = removed
 
             result.status = "updated"
+            _record_update_check(result.version)
 
     except httpx.HTTPStatusError as e:
         result.errors.append(f"HTTP error: {e.response.status_code} for {e.request.url}")
     except httpx.ConnectError:
-        result.errors.append("Network error: Could not connect to GitHub")
+        host = urlparse(source).hostname or source
+        result.errors.append(f"Network error: Could not connect to {host}")
     except httpx.TimeoutException:
         result.errors.append("Network error: Request timed out")
+    except httpx.TransportError as e:
+        result.errors.append(f"Network error: {e}")
+    except PermissionError as e:
+        result.errors.append(f"Permission error: Cannot write to cache directory: {e}")
+    except OSError as e:
+        result.errors.append(f"File system error: {e}")
+    except ValueError as e:
+        result.errors.append(str(e))
+
+    return result
+
+
+def switch_templates(version: str) -> UpdateResult:
+    """Make a stored template version the active one, without downloading.
+
+    The templates cache is rebuilt from the blobs of the version's manifest,
+    rewriting only the files that differ, the same way an update applies.
+
+    Args:
+        version: Template version previously installed by an update.
+
+    Returns:
+        UpdateResult with details of what was done.
+    """
+    result = UpdateResult(status="error", version=version)
+
+    cache_dir = get_templates_cache_dir()
+    store = TemplateStore(get_templates_store_dir())
+    local_manifest = get_local_manifest()
+    result.previous_version = local_manifest.version if local_manifest else None
+
+    data = store.load_version(version)
+    if data is None:
+        result.errors.append(f"Template version {version} is not in the local store")
+        return result
+
+    missing = store.missing_blobs(data)
+    if missing:
+        result.errors.append(
+            f"Template version {version} is incomplete in the local store "
+            f"({len(missing)} files missing), run 'tdd-llm update --force'"
+        )
+        return result
+
+    manifest = Manifest.from_json(data)
+
+    try:
+        cache_dir.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(
+            dir=cache_dir.parent, prefix=f".{cache_dir.name}-update-"
+        ) as temp_dir:
+            temp_path = Path(temp_dir)
+            hashes = _HashCache(cache_dir)
+            for rel_path, checksum in manifest.templates.items():
+                if hashes.matches(rel_path, checksum):
+                    result.files_unchanged.append(rel_path)
+                elif store.restore(checksum, temp_path / rel_path):
+                    result.files_updated.append(rel_path)
+                else:
+                    result.errors.append(f"Stored copy of {rel_path} is corrupt")
+                    return result
+
+            removed = [
+                rel_path
+                for rel_path in (local_manifest.templates if local_manifest else {})
+                if rel_path not in manifest.templates
+            ]
+
+            # The validators of the previous manifest no longer apply
+            _apply_update(cache_dir, temp_path, manifest, result.files_updated, removed, {}, hashes)
+            store.set_active(version)
+            result.files_removed = removed
+
+        result.status = "updated"
+
     except PermissionError as e:
         result.errors.append(f"Permission error: Cannot write to cache directory: {e}")
     except OSError as e:
         result.errors.append(f"File system error: {e}")
 
     return result
+
+
+def rollback_templates() -> UpdateResult:
+    """Switch back to the template version active before the current one.
+
+    Returns:
+        UpdateResult with details of what was done.
+    """
+    previous = TemplateStore(get_templates_store_dir()).previous()
+    if previous is None:
+        return UpdateResult(status="error", errors=["No previous template version to roll back to"])
+    return switch_templates(previous)
+
+
+@dataclass
+class UpdateCheck:
+    """Result of the last background check for new templates."""
+
+    checked_at: float  # Unix time the check started
+    latest_version: str | None = None  # Version offered by the source, if known
+
+
+def load_update_check() -> UpdateCheck | None:
+    """Load the freshness record of the last update check.
+
+    Returns:
+        UpdateCheck, or None if no check ever ran.
+    """
+    try:
+        with open(get_templates_cache_dir() / UPDATE_CHECK_NAME, encoding="utf-8") as f:
+            data = json.load(f)
+        return UpdateCheck(float(data["checked_at"]), data.get("latest_version"))
+    except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _save_update_check(check: UpdateCheck) -> None:
+    """Write the freshness record atomically."""
+    cache_dir = get_templates_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / UPDATE_CHECK_NAME
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"checked_at": check.checked_at, "latest_version": check.latest_version}, f)
+    os.replace(tmp, path)
+
+
+def _record_update_check(latest_version: str | None) -> None:
+    """Reset the freshness record after talking to the source in the foreground."""
+    try:
+        _save_update_check(UpdateCheck(time.time(), latest_version))
+    except OSError:
+        pass
+
+
+def get_installed_version() -> str | None:
+    """Get the version of the templates deploys use: cached, else packaged."""
+    local_manifest = get_local_manifest()
+    if local_manifest:
+        return local_manifest.version
+    try:
+        with open(get_templates_dir() / "manifest.json", encoding="utf-8") as f:
+            return Manifest.from_json(json.load(f)).version
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def check_for_update(source: str = TEMPLATES_BASE_URL) -> str | None:
+    """Look up the latest template version and record it, without installing it.
+
+    The manifest request is conditional on the cached manifest's validators,
+    so when nothing changed it costs a 304. The validators themselves are not
+    updated: they describe the installed manifest, not the one just seen.
+
+    Args:
+        source: Template source, as for update_templates().
+
+    Returns:
+        Latest version, or None if the source could not be reached.
+    """
+    started = time.time()
+    validators = _load_validators(get_templates_cache_dir()) if get_local_manifest() else {}
+    try:
+        with create_client(timeout=UPDATE_CHECK_TIMEOUT, follow_redirects=True) as client:
+            template_source = _open_source(source, client, 1, MAX_FILE_SIZE)
+            manifest, _ = template_source.fetch_manifest(validators.get("manifest.json"))
+    except (httpx.HTTPError, OSError, ValueError):
+        return None
+
+    latest = manifest.version if manifest else get_installed_version()
+    _save_update_check(UpdateCheck(started, latest))
+    return latest
+
+
+def update_check_due(ttl_hours: float) -> bool:
+    """Check whether the freshness record is older than its TTL.
+
+    Args:
+        ttl_hours: Time between checks, in hours. 0 or less disables checks.
+
+    Returns:
+        True if a background check should be started.
+    """
+    if ttl_hours <= 0:
+        return False
+    check = load_update_check()
+    return check is None or time.time() - check.checked_at >= ttl_hours * 3600
+
+
+def start_background_check(source: str = TEMPLATES_BASE_URL) -> None:
+    """Run check_for_update() in a detached process and return immediately.
+
+    The record is stamped first, so commands run while the check is in
+    flight (or after it failed) do not start another one before the TTL.
+
+    Args:
+        source: Template source, as for update_templates().
+    """
+    previous = load_update_check()
+    try:
+        _save_update_check(UpdateCheck(time.time(), previous.latest_version if previous else None))
+    except OSError:
+        return
+
+    kwargs: dict = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+
+    code = "import sys; from tdd_llm.updater import check_for_update; check_for_update(sys.argv[1])"
+    try:
+        subprocess.Popen(
+            [sys.executable, "-c", code, source],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs,
+        )
+    except OSError:
+        pass
+
+
+def get_update_hint() -> str | None:
+    """Describe templates newer than the installed ones, found by a past check.
+
+    Only reads local files, so it is safe on the hot deploy path.
+
+    Returns:
+        Hint message, or None if no newer version is known.
+    """
+    check = load_update_check()
+    if check is None or not check.latest_version:
+        return None
+    installed = get_installed_version()
+    if check.latest_version == installed:
+        return None
+    return (
+        f"New templates available ({installed or 'none'} -> {check.latest_version}), "
+        "run 'tdd-llm update'"
+    )
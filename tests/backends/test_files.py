@@ -1,10 +1,14 @@
 """Tests for files backend."""
 
 import json
+import os
+import time
+from unittest import mock
 
 import pytest
 
-from tdd_llm.backends.files import FilesBackend
+from tdd_llm.backends import files
+from tdd_llm.backends.files import EPIC_INDEX_FILE, FilesBackend
 
 
 @pytest.fixture
@@ -108,6 +112,16 @@ class TestFilesBackend:
         assert epic.status == "in_progress"
         assert len(epic.tasks) == 2
 
+    def test_get_epic_empty_title_uses_id(self, backend, project_dir):
+        """Test an epic heading without a name falls back to the epic ID."""
+        epic_file = project_dir / "docs" / "epics" / "e1-foundation.md"
+        epic_file.write_text("# E1:\n\nNo name yet.\n")
+
+        epic = backend.get_epic("E1")
+
+        assert epic.name == "E1"
+        assert epic.description == "No name yet."
+
     def test_get_epic_tasks(self, backend):
         """Test that epic tasks are properly loaded."""
         epic = backend.get_epic("E1")
@@ -382,3 +396,245 @@ class TestFilesBackendNoState:
         with open(local_state_file) as f:
             local_state = json.load(f)
         assert "current" in local_state
+
+
+def _age_files(root):
+    """Move the mtime of every file under root out of the racy window."""
+    past = time.time() - 60
+    for path in root.rglob("*"):
+        if path.is_file():
+            os.utime(path, (past, past))
+
+
+class TestFilesBackendEpicIndex:
+    """Tests for the on-disk index of parsed epic files."""
+
+    def test_index_written_on_read(self, backend, project_dir):
+        """Test that reading epics records them in the index."""
+        backend.get_state()
+
+        index = json.loads((project_dir / EPIC_INDEX_FILE).read_text())
+        assert set(index["files"]) == {"docs/epics/e1-foundation.md", "docs/epics/e2-features.md"}
+        assert (project_dir / ".tdd-cache" / ".gitignore").exists()
+
+    def test_unchanged_files_not_parsed_again(self, project_dir):
+        """Test that a new backend reuses the index for unchanged files."""
+        _age_files(project_dir)
+        FilesBackend(project_root=project_dir).get_state()
+
+        with mock.patch.object(
+            files, "_parse_epic_markdown", side_effect=AssertionError("re-parsed")
+        ):
+            state = FilesBackend(project_root=project_dir).get_state()
+
+        assert state.current_epic.name == "Foundation"
+        assert [t.id for t in state.current_epic.tasks] == ["T1", "T2"]
+
+    def test_changed_file_parsed_again(self, project_dir):
+        """Test that an epic file whose stat changed is parsed again."""
+        _age_files(project_dir)
+        FilesBackend(project_root=project_dir).get_state()
+
+        epic_file = project_dir / "docs" / "epics" / "e2-features.md"
+        epic_file.write_text(epic_file.read_text().replace("Features", "Better features"))
+
+        epic = FilesBackend(project_root=project_dir).get_epic("E2")
+        assert epic.name == "Better features"
+
+    def test_task_files_indexed(self, project_dir):
+        """Test that task files in E{N}/ are indexed too."""
+        task_dir = project_dir / "docs" / "epics" / "E2"
+        task_dir.mkdir()
+        (task_dir / "T2.md").write_text("# [E2] T2 - Feature B\n\nSecond feature.\n")
+        _age_files(project_dir)
+        FilesBackend(project_root=project_dir).get_epic("E2")
+
+        with mock.patch.object(
+            files, "_parse_task_markdown", side_effect=AssertionError("re-parsed")
+        ):
+            epic = FilesBackend(project_root=project_dir).get_epic("E2")
+
+        assert [(t.id, t.title) for t in epic.tasks] == [("T1", "Feature A"), ("T2", "Feature B")]
+
+    def test_corrupt_index_ignored(self, backend, project_dir):
+        """Test that an unreadable index is rebuilt."""
+        index_path = project_dir / EPIC_INDEX_FILE
+        index_path.parent.mkdir()
+        index_path.write_text("not json")
+
+        assert backend.get_epic("E1").name == "Foundation"
+        assert "docs/epics/e1-foundation.md" in json.loads(index_path.read_text())["files"]
+
+    def test_deleted_file_dropped_from_index(self, backend, project_dir):
+        """Test that entries of deleted epic files are pruned."""
+        backend.get_state()
+        (project_dir / "docs" / "epics" / "e2-features.md").unlink()
+
+        FilesBackend(project_root=project_dir).get_epic("E1")
+
+        index = json.loads((project_dir / EPIC_INDEX_FILE).read_text())
+        assert "docs/epics/e2-features.md" not in index["files"]
+
+
+class TestFilesBackendEpicLookup:
+    """Tests for the epic ID -> file lookup."""
+
+    def test_exact_id_match(self, project_dir):
+        """Test that E1 does not resolve to an e10 file."""
+        epics_dir = project_dir / "docs" / "epics"
+        (epics_dir / "e1-foundation.md").rename(epics_dir / "e10-later.md")
+        backend = FilesBackend(project_root=project_dir)
+
+        assert backend._find_epic_file("E1") is None
+        assert backend._find_epic_file("E10") == epics_dir / "e10-later.md"
+
+    def test_bare_and_case_insensitive_names(self, project_dir):
+        """Test E{n}.md files and lower-case IDs."""
+        epics_dir = project_dir / "docs" / "epics"
+        (epics_dir / "E3.md").write_text("# E3: Bare\n\nBare file.\n")
+        (epics_dir / "README.md").write_text("# Epics\n")
+        backend = FilesBackend(project_root=project_dir)
+
+        assert backend._find_epic_file("e3") == epics_dir / "E3.md"
+        assert backend._find_epic_file("E1") == epics_dir / "e1-foundation.md"
+
+    def test_directory_scanned_once(self, project_dir):
+        """Test that lookups reuse the scan while the directory is unchanged."""
+        _age_files(project_dir)
+        epics_dir = project_dir / "docs" / "epics"
+        past = time.time() - 60
+        os.utime(epics_dir, (past, past))
+        backend = FilesBackend(project_root=project_dir)
+        backend._find_epic_file("E1")
+
+        with mock.patch.object(files.os, "scandir", side_effect=AssertionError("rescanned")):
+            assert backend._find_epic_file("E2") == epics_dir / "e2-features.md"
+            assert backend._find_epic_file("E99") is None
+
+    def test_new_epic_file_found(self, backend, project_dir):
+        """Test that files added after the first lookup are found."""
+        assert backend._find_epic_file("E3") is None
+
+        epic = backend.create_epic(name="Third", description="Third epic.")
+
+        assert epic.id == "E3"
+        assert backend.get_epic("E3").name == "Third"
+
+
+class TestFilesBackendSnapshot:
+    """Tests for FilesBackend.snapshot."""
+
+    def test_state_files_read_once(self, backend):
+        """Test that get_state loads each state file once for all epics."""
+        backend.get_state()  # Creates the local state file
+
+        with mock.patch.object(files.json, "load", wraps=json.load) as load:
+            backend.get_state()
+            assert load.call_count == 2
+
+            with backend.snapshot():
+                backend.get_state()
+                backend.list_epics()
+                backend.get_task("T2")
+            assert load.call_count == 4
+
+    def test_writes_deferred_to_exit(self, backend, project_dir):
+        """Test that changes are written once, when the snapshot ends."""
+        local_state_file = project_dir / ".tdd-state.local.json"
+        backend.get_state()
+
+        with backend.snapshot():
+            backend.set_current_task("E1", "T2")
+            backend.set_phase("T2", "test")
+            assert backend.get_state().current_task.phase == "test"
+            assert json.loads(local_state_file.read_text())["current"]["task"] is None
+
+        local_state = json.loads(local_state_file.read_text())
+        assert local_state["current"]["task"] == "T2"
+        assert local_state["current"]["phase"] == "test"
+
+    def test_error_discards_changes(self, backend, project_dir):
+        """Test that nothing is written when the unit of work fails."""
+        state_file = project_dir / "docs" / "state.json"
+        before = state_file.read_text()
+
+        with pytest.raises(RuntimeError), backend.snapshot():
+            backend.set_current_task("E2", "T1")
+            raise RuntimeError("interrupted")
+
+        assert state_file.read_text() == before
+        assert backend.get_state().current_task is None
+
+    def test_completing_last_task_completes_epic(self, backend, project_dir):
+        """Test that the epic completion check sees the task just completed."""
+        backend.set_current_task("E1", "T2")
+        backend.update_task_status("T2", "completed")
+
+        state = json.loads((project_dir / "docs" / "state.json").read_text())
+        assert state["epics"]["E1"]["status"] == "completed"
+
+
+class TestFilesBackendTaskIndex:
+    """Tests for the task ID -> epic reverse index."""
+
+    def test_lookup_reads_only_the_owning_epic(self, backend, project_dir):
+        """Test that an indexed task is found without building other epics."""
+        backend.create_epic(name="Third", description="Third epic.")
+        backend.create_task("E3", title="Late task", description="Found directly.", task_id="T5")
+        backend.get_state()
+
+        fresh = FilesBackend(project_root=project_dir)
+        with mock.patch.object(fresh, "_build_epic", wraps=fresh._build_epic) as build:
+            task = fresh.get_task("T5")
+
+        assert (task.epic_id, task.title) == ("E3", "Late task")
+        assert [c.args[0] for c in build.call_args_list] == ["E3"]
+
+    def test_create_task_updates_index(self, backend):
+        """Test that a created task is in the reverse index right away."""
+        backend.get_state()
+        backend.create_task("E2", title="Feature B", description="Second feature.")
+
+        assert ("E2", "docs/epics/e2-features.md") in backend.epic_index.task_locations()["T2"]
+        assert backend.epic_index.task_locations()["E2/T2"][0][0] == "E2"
+
+    def test_qualified_task_id(self, backend):
+        """Test that 'E2/T1' selects the epic of a task ID used twice."""
+        assert backend.get_task("T1").title == "Setup"
+        assert backend.get_task("E2/T1").title == "Feature A"
+
+        with pytest.raises(KeyError):
+            backend.get_task("E2/T2")
+
+    def test_first_epic_wins_when_partly_indexed(self, project_dir):
+        """Test that epics not indexed yet are still searched in state order."""
+        FilesBackend(project_root=project_dir).get_epic("E2")
+
+        task = FilesBackend(project_root=project_dir).get_task("T1")
+
+        assert task.epic_id == "E1"
+
+    def test_stale_index_does_not_change_winner(self, backend, project_dir):
+        """Test a task ID added by hand to an earlier epic wins over a later one."""
+        backend.create_task("E2", title="Feature B", description="Second feature.", task_id="T7")
+        backend.get_state()
+        _age_files(project_dir / "docs")
+        FilesBackend(project_root=project_dir).get_state()
+        assert "E1" not in {epic for epic, _ in backend.epic_index.task_locations()["T7"]}
+
+        epic_file = project_dir / "docs" / "epics" / "e1-foundation.md"
+        epic_file.write_text(epic_file.read_text() + "\n## T7: Manual\n\nAdded by hand.\n")
+
+        task = FilesBackend(project_root=project_dir).get_task("T7")
+
+        assert (task.epic_id, task.title) == ("E1", "Manual")
+
+    def test_task_added_by_hand_found(self, backend, project_dir):
+        """Test that a task added to an indexed epic file is still found."""
+        backend.get_state()
+        epic_file = project_dir / "docs" / "epics" / "e2-features.md"
+        epic_file.write_text(epic_file.read_text() + "\n## T9: Manual\n\nAdded by hand.\n")
+
+        task = FilesBackend(project_root=project_dir).get_task("T9")
+
+        assert (task.epic_id, task.title) == ("E2", "Manual")
@@ -205,6 +205,30 @@ class TestJiraClient:
 
         client.close()
 
+    def test_client_uses_shared_pool(self, jira_config, mock_api_token):
+        """Test requests go through the shared client with full URLs and JSON headers."""
+        from tdd_llm.http_client import get_shared_client
+
+        auth_manager = mock.Mock()
+        auth_manager.get_base_url.return_value = "https://test.atlassian.net"
+        auth_manager.get_auth_header.return_value = {"Authorization": "Basic abc"}
+        client = JiraClient(jira_config, auth_manager=auth_manager)
+
+        shared = get_shared_client()
+        with mock.patch.object(shared, "request") as request:
+            request.return_value = mock.Mock(status_code=200)
+            client._request("GET", "/issue/PROJ-1")
+
+        assert client._ensure_client() is shared
+        method, url = request.call_args.args
+        assert (method, url) == ("GET", "https://test.atlassian.net/rest/api/3/issue/PROJ-1")
+        headers = request.call_args.kwargs["headers"]
+        assert headers["Accept"] == "application/json"
+        assert headers["Authorization"] == "Basic abc"
+
+        client.close()
+        assert not shared.is_closed
+
     def test_client_context_manager(self, jira_config, mock_api_token):
         """Test client as context manager."""
         with JiraClient(jira_config) as client:
@@ -209,7 +209,7 @@ class TestJiraOAuthFlow:
         }
 
         mock_client = mock.Mock()
-        mock_client.post.return_value = mock_response
+        mock_client.request.return_value = mock_response
         mock_client.__enter__ = mock.Mock(return_value=mock_client)
         mock_client.__exit__ = mock.Mock(return_value=False)
         mock_client_class.return_value = mock_client
@@ -238,7 +238,7 @@ class TestJiraOAuthFlow:
         }
 
         mock_client = mock.Mock()
-        mock_client.post.return_value = mock_response
+        mock_client.request.return_value = mock_response
         mock_client.__enter__ = mock.Mock(return_value=mock_client)
         mock_client.__exit__ = mock.Mock(return_value=False)
         mock_client_class.return_value = mock_client
@@ -0,0 +1,124 @@
+"""Tests for the epic and task markdown tokenizer."""
+
+from tdd_llm.backends.markdown import (
+    ACCEPTANCE_CRITERIA,
+    DESCRIPTION,
+    TASK,
+    TITLE,
+    tokenize_epic,
+    tokenize_task,
+)
+
+EPIC = """# E1: Foundation
+
+Set up the project foundation.
+
+## Objective
+
+- Initialize project structure
+
+## T1: Setup
+
+Set up the initial project structure.
+
+### Notes
+
+Keep it small.
+
+## T2: Config
+
+Configure the project settings.
+
+**Acceptance criteria:**
+- Config file exists
+- Tests pass
+
+**Files:**
+- config.yaml
+
+## Completion criteria
+
+- [ ] Build OK
+"""
+
+
+class TestTokenizeEpic:
+    """Tests for tokenize_epic."""
+
+    def test_token_sequence(self):
+        """Test the kinds and values of the tokens of an epic."""
+        tokens = [(t.kind, t.task_id, t.value) for t in tokenize_epic(EPIC)]
+
+        assert tokens == [
+            (TITLE, None, "Foundation"),
+            (DESCRIPTION, None, "Set up the project foundation."),
+            (TASK, "T1", "Setup"),
+            (
+                DESCRIPTION,
+                "T1",
+                "Set up the initial project structure.\n\n### Notes\n\nKeep it small.",
+            ),
+            (TASK, "T2", "Config"),
+            (DESCRIPTION, "T2", EPIC[EPIC.index("Configure") : EPIC.index("config.yaml") + 11]),
+            (ACCEPTANCE_CRITERIA, "T2", "- Config file exists\n- Tests pass"),
+        ]
+
+    def test_offsets_locate_values(self):
+        """Test that every token's offsets slice its value out of the content."""
+        for token in tokenize_epic(EPIC):
+            assert EPIC[token.start : token.end] == token.value
+
+    def test_estimation_closes_task(self):
+        """Test that an Estimation heading ends the last task section."""
+        content = "# E2: X\n\nDesc.\n\n## T1: Only\n\nBody.\n\n### Estimation\n\n3 days\n"
+
+        descriptions = [t.value for t in tokenize_epic(content) if t.task_id == "T1"]
+
+        assert descriptions == ["Only", "Body."]
+
+    def test_task_heading_without_title_ends_section(self):
+        """Test that '## T2:' with no title closes T1 without opening a task."""
+        content = "# E1: X\n\n## T1: First\n\nBody.\n\n## T2:\n\nOrphan.\n"
+
+        tokens = [(t.kind, t.task_id, t.value) for t in tokenize_epic(content)]
+
+        assert (TASK, "T2", "") not in tokens
+        assert (DESCRIPTION, "T1", "Body.") in tokens
+
+    def test_empty_title_not_yielded(self):
+        """Test that '# E1:' with no name yields no TITLE but keeps the description."""
+        tokens = [(t.kind, t.value) for t in tokenize_epic("# E1:\n\nDesc.\n\n## T1: A\n\nB.\n")]
+
+        assert tokens[0] == (DESCRIPTION, "Desc.")
+        assert all(kind != TITLE for kind, _ in tokens)
+
+    def test_no_title(self):
+        """Test a file with only task sections."""
+        tokens = list(tokenize_epic("## T1: First\n\nBody.\n"))
+
+        assert [t.kind for t in tokens] == [TASK, DESCRIPTION]
+
+
+class TestTokenizeTask:
+    """Tests for tokenize_task."""
+
+    def test_task_file(self):
+        """Test the tokens of a task file."""
+        content = (
+            "# [E1] T3 - Logging\n\nAdd structured logging.\n\n"
+            "**Acceptance Criteria:**\n- Logs are JSON\n"
+        )
+
+        tokens = {t.kind: t.value for t in tokenize_task(content)}
+
+        assert tokens == {
+            TITLE: "Logging",
+            DESCRIPTION: "Add structured logging.\n\n**Acceptance Criteria:**\n- Logs are JSON",
+            ACCEPTANCE_CRITERIA: "- Logs are JSON",
+        }
+
+    def test_untitled_task_file(self):
+        """Test a task file whose heading is not a task title."""
+        tokens = {t.kind: t.value for t in tokenize_task("# Notes\n\nFree text.\n")}
+
+        assert tokens == {DESCRIPTION: "Free text."}
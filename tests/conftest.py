@@ -1,13 +1,22 @@
 """Shared test fixtures for tdd-llm."""
 
+import hashlib
+import json
 import os
 import shutil
 import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from tdd_llm.http_client import close_shared_client
+from tdd_llm.updater import update_templates
+
 # Set NO_COLOR before any imports to disable Rich colors
 os.environ["NO_COLOR"] = "1"
 
@@ -24,6 +33,32 @@ def skip_first_run_wizard():
         yield
 
 
+@pytest.fixture(autouse=True)
+def isolated_template_store(tmp_path):
+    """Keep template versions stored by updates out of the user config dir."""
+    store_dir = tmp_path / "template-store"
+    with mock.patch("tdd_llm.updater.get_templates_store_dir", return_value=store_dir):
+        yield store_dir
+
+
+@pytest.fixture(autouse=True)
+def no_background_update_check():
+    """Keep CLI commands from spawning update checks or reading their record."""
+    with (
+        mock.patch("tdd_llm.cli.start_background_check") as start,
+        mock.patch("tdd_llm.cli.get_update_hint", return_value=None),
+    ):
+        yield start
+
+
+@pytest.fixture(autouse=True)
+def fresh_shared_http_client():
+    """Give each test its own shared HTTP client, so httpx.Client patches apply."""
+    close_shared_client()
+    yield
+    close_shared_client()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
@@ -36,3 +71,153 @@ def temp_dir():
 def temp_config_file(temp_dir):
     """Create a temporary config file path."""
     return temp_dir / "config.yaml"
+
+
+class TemplateServer:
+    """Local stand-in for the GitHub raw host serving a templates directory."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.requests: list[str] = []
+        self.statuses: list[int] = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # Request path -> bytes sent before dropping the connection, applied once
+        self.cut_after: dict[str, int] = {}
+        self.honor_ranges = True
+        self.range_headers: list[str] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), partial(_TemplateRequestHandler, self, directory=str(root))
+        )
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        """Base URL of the served templates directory."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def publish(self, files: dict[str, bytes], version: str = "1.0.0") -> dict:
+        """Write template files and their manifest.json.
+
+        Returns:
+            The manifest data.
+        """
+        for rel_path, content in files.items():
+            path = self.root / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+
+        manifest = {
+            "version": version,
+            "templates": {
+                rel_path: hashlib.sha256(content).hexdigest() for rel_path, content in files.items()
+            },
+        }
+        (self.root / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+        return manifest
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _TemplateRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that records requests and concurrency."""
+
+    def __init__(self, server_state: TemplateServer, *args, **kwargs):
+        self.state = server_state
+        self.etag = None
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        state = self.state
+        with state._lock:
+            state.requests.append(self.path)
+            state.in_flight += 1
+            state.max_in_flight = max(state.max_in_flight, state.in_flight)
+        try:
+            if state.delay:
+                time.sleep(state.delay)
+
+            # Strong ETag from the content, as served by the GitHub raw host
+            path = Path(self.translate_path(self.path))
+            if path.is_file():
+                self.etag = f'"{hashlib.sha256(path.read_bytes()).hexdigest()[:16]}"'
+                if self.headers.get("If-None-Match") == self.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self._send_file(path.read_bytes())
+                return
+            super().do_GET()
+        finally:
+            with state._lock:
+                state.in_flight -= 1
+
+    def _send_file(self, body: bytes) -> None:
+        """Send a file, honoring Range requests and simulated dropped connections."""
+        state = self.state
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header:
+            with state._lock:
+                state.range_headers.append(range_header)
+        if_range = self.headers.get("If-Range")
+        if range_header and state.honor_ranges and if_range in (None, self.etag):
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+
+        payload = body[start:]
+        with state._lock:
+            cut = state.cut_after.pop(self.path, None)
+        if cut is not None:
+            payload = payload[:cut]
+            self.close_connection = True
+        self.wfile.write(payload)
+
+    def end_headers(self):
+        if self.etag:
+            self.send_header("ETag", self.etag)
+        super().end_headers()
+
+    def log_request(self, code="-", size="-"):
+        with self.state._lock:
+            self.state.statuses.append(int(code))
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def template_server():
+    """Serve a temporary templates directory over HTTP on localhost."""
+    root = Path(tempfile.mkdtemp())
+    server = TemplateServer(root)
+    server.start()
+    yield server
+    server.stop()
+    shutil.rmtree(root)
+
+
+@pytest.fixture
+def run_update():
+    """Run update_templates() from a source into a given templates cache."""
+
+    def run(cache_dir, source, **kwargs):
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=cache_dir):
+            return update_templates(source=str(source), **kwargs)
+
+    return run
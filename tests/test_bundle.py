@@ -0,0 +1,257 @@
+"""Tests for bundle module."""
+
+import hashlib
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from tdd_llm.bundle import (
+    TemplateBundle,
+    clear_cache_bundle,
+    get_cache_bundle,
+    load_package_bundle,
+    pack_templates,
+    write_bundle,
+)
+from tdd_llm.config import Config, get_available_backends, get_available_languages
+from tdd_llm.deployer import deploy
+from tdd_llm.paths import get_base_templates_dir
+from tdd_llm.placeholder import PlaceholderResolver, load_placeholder
+
+
+@pytest.fixture
+def package_bundle():
+    """Bundle packed from the package templates directory."""
+    return TemplateBundle.from_bytes(pack_templates(get_base_templates_dir(), "1.0.0"))
+
+
+class TestTemplateBundle:
+    """Tests for TemplateBundle."""
+
+    def test_roundtrip(self, temp_dir):
+        """Test packed files read back unchanged."""
+        (temp_dir / "commands" / "tdd").mkdir(parents=True)
+        (temp_dir / "commands" / "tdd" / "a.md").write_text("Héllo", encoding="utf-8")
+        (temp_dir / "commands" / "b.md").write_text("World", encoding="utf-8")
+        (temp_dir / "manifest.json").write_text("{}", encoding="utf-8")
+
+        count = write_bundle(temp_dir, temp_dir / "templates.pack", "2.0.0")
+        bundle = TemplateBundle.load(temp_dir / "templates.pack")
+
+        assert count == 2
+        assert bundle.version == "2.0.0"
+        assert bundle.read_text("commands/tdd/a.md") == "Héllo"
+        assert bundle.read_text("commands/b.md") == "World"
+        assert "manifest.json" not in bundle
+        assert bundle.read_text("missing.md") is None
+
+    def test_files_and_subdirs(self, package_bundle):
+        """Test directory listings match the loose templates."""
+        templates_dir = get_base_templates_dir()
+        commands_dir = templates_dir / "commands"
+        expected = sorted(
+            p.relative_to(commands_dir).as_posix() for p in commands_dir.rglob("*") if p.is_file()
+        )
+
+        assert package_bundle.files("commands") == expected
+        assert package_bundle.subdirs("placeholders/langs") == sorted(
+            p.name for p in (templates_dir / "placeholders" / "langs").iterdir() if p.is_dir()
+        )
+
+    def test_invalid_bundle(self, temp_dir):
+        """Test invalid bundles load as None."""
+        bundle_path = temp_dir / "templates.pack"
+        bundle_path.write_bytes(b'{"format": 99, "files": {}}\n')
+        assert TemplateBundle.load(bundle_path) is None
+        assert TemplateBundle.load(temp_dir / "missing.pack") is None
+
+
+class TestCacheBundle:
+    """Tests for the memory-mapped bundle in the templates cache."""
+
+    @pytest.fixture
+    def cache_dir(self, temp_dir):
+        """Templates cache with one language placeholder, packed."""
+        lang_dir = temp_dir / "placeholders" / "langs" / "python"
+        lang_dir.mkdir(parents=True)
+        (lang_dir / "BUILD_COMMANDS.md").write_text("cached build\n", encoding="utf-8")
+        write_bundle(temp_dir, temp_dir / "templates.pack", "9.0.0")
+        # Loose file differs, to tell which one was read
+        (lang_dir / "BUILD_COMMANDS.md").write_text("loose build", encoding="utf-8")
+
+        clear_cache_bundle()
+        with mock.patch("tdd_llm.bundle.get_templates_cache_dir", return_value=temp_dir):
+            yield temp_dir
+        clear_cache_bundle()
+
+    def test_open_mapped(self, cache_dir):
+        """Test a mapped bundle reads the same content as a loaded one."""
+        bundle = TemplateBundle.open_mapped(cache_dir / "templates.pack")
+
+        assert bundle.version == "9.0.0"
+        assert bundle.read_text("placeholders/langs/python/BUILD_COMMANDS.md") == "cached build\n"
+
+    def test_open_mapped_empty_file(self, temp_dir):
+        """Test empty files are rejected rather than mapped."""
+        (temp_dir / "templates.pack").write_bytes(b"")
+        assert TemplateBundle.open_mapped(temp_dir / "templates.pack") is None
+
+    def test_reused_until_file_changes(self, cache_dir):
+        """Test the mapping is kept while the file is unchanged."""
+        first = get_cache_bundle()
+        assert get_cache_bundle() is first
+
+        write_bundle(cache_dir, cache_dir / "templates.pack", "9.0.10")
+        assert get_cache_bundle().version == "9.0.10"
+
+    def test_clear_closes_mapping(self, cache_dir):
+        """Test clearing the cache bundle closes its memory map."""
+        bundle = get_cache_bundle()
+        mapped = bundle._mapped
+
+        clear_cache_bundle()
+
+        assert mapped.closed
+        assert bundle.read_text("placeholders/langs/python/BUILD_COMMANDS.md") is None
+        os.replace(cache_dir / "templates.pack", cache_dir / "old.pack")
+
+    def test_missing_bundle(self, temp_dir):
+        """Test a cache without a bundle falls back to loose files."""
+        with mock.patch("tdd_llm.bundle.get_templates_cache_dir", return_value=temp_dir):
+            assert get_cache_bundle() is None
+
+    def test_placeholders_read_from_cache_bundle(self, cache_dir):
+        """Test cached placeholders come from the bundle, not loose files."""
+        resolver = PlaceholderResolver("python", "files", Config())
+
+        assert resolver.resolve("BUILD_COMMANDS") == "cached build"
+        assert load_placeholder("BUILD_COMMANDS", "python", "files") == "cached build"
+
+
+class TestPackageBundle:
+    """Tests for loading the bundle shipped with the package."""
+
+    MANIFEST = b'{"version": "1.0.0", "templates": {}}'
+
+    def _build(self, templates_dir):
+        """Write templates and a bundle built after them, against their manifest."""
+        (templates_dir / "commands").mkdir(parents=True)
+        (templates_dir / "commands" / "a.md").write_text("packed", encoding="utf-8")
+        (templates_dir / "manifest.json").write_bytes(self.MANIFEST)
+        checksum = hashlib.sha256(self.MANIFEST).hexdigest()
+        write_bundle(templates_dir, templates_dir / "templates.pack", "1.0.0", checksum)
+        return templates_dir
+
+    @pytest.fixture
+    def templates_dir(self, temp_dir):
+        """Package templates directory of a source checkout."""
+        (temp_dir / "pyproject.toml").write_text("", encoding="utf-8")
+        return self._build(temp_dir / "src" / "tdd_llm" / "templates")
+
+    @pytest.fixture
+    def installed_templates_dir(self, temp_dir):
+        """Package templates directory of an installed package."""
+        return self._build(temp_dir / "site-packages" / "tdd_llm" / "templates")
+
+    def _age(self, path, seconds):
+        """Move the modification time of path by seconds."""
+        stat = path.stat()
+        shift = int(seconds * 1_000_000_000)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + shift))
+
+    @pytest.mark.parametrize("layout", ["templates_dir", "installed_templates_dir"])
+    def test_up_to_date_bundle(self, request, layout):
+        """Test a bundle built after the loose files is used."""
+        bundle = load_package_bundle(request.getfixturevalue(layout))
+
+        assert bundle.read_text("commands/a.md") == "packed"
+
+    def test_edited_template_makes_bundle_stale(self, templates_dir):
+        """Test a loose template edited after the bundle was built wins."""
+        (templates_dir / "commands" / "a.md").write_text("edited", encoding="utf-8")
+        self._age(templates_dir / "commands" / "a.md", 1)
+
+        assert load_package_bundle(templates_dir) is None
+
+    def test_added_template_makes_bundle_stale(self, templates_dir):
+        """Test a template added after the bundle was built is noticed."""
+        (templates_dir / "commands" / "b.md").write_text("new", encoding="utf-8")
+        self._age(templates_dir / "commands", 1)
+        self._age(templates_dir / "commands" / "b.md", -60)
+
+        assert load_package_bundle(templates_dir) is None
+
+    @pytest.mark.parametrize("layout", ["templates_dir", "installed_templates_dir"])
+    def test_other_manifest_makes_bundle_stale(self, request, layout):
+        """Test a bundle built against another manifest.json is ignored."""
+        templates_dir = request.getfixturevalue(layout)
+        (templates_dir / "manifest.json").write_text("{}", encoding="utf-8")
+        self._age(templates_dir / "manifest.json", -60)
+
+        assert load_package_bundle(templates_dir) is None
+
+    def test_installed_package_not_walked(self, installed_templates_dir):
+        """Test an installed package only checks the manifest, not every template."""
+        with mock.patch.object(Path, "rglob", side_effect=AssertionError("walked")):
+            assert load_package_bundle(installed_templates_dir) is not None
+
+
+class TestBundleLookup:
+    """Tests for reading package templates through the bundle."""
+
+    def test_placeholders_match_loose_files(self, package_bundle):
+        """Test placeholder values are the same with and without the bundle."""
+        loose = PlaceholderResolver("python", "files", Config(), no_cache=True).values
+
+        with mock.patch("tdd_llm.placeholder.get_package_bundle", return_value=package_bundle):
+            bundled = PlaceholderResolver("python", "files", Config(), no_cache=True).values
+            assert load_placeholder("BUILD_COMMANDS", "python", "files", no_cache=True)
+
+        assert bundled == loose
+
+    def test_available_languages_and_backends(self, package_bundle):
+        """Test language and backend listings come from the bundle."""
+        loose = (get_available_languages(), get_available_backends())
+
+        with mock.patch("tdd_llm.bundle.get_package_bundle", return_value=package_bundle):
+            assert (get_available_languages(), get_available_backends()) == loose
+
+    def test_deploy_output_matches_loose_files(self, temp_dir, package_bundle):
+        """Test deploying from the bundle writes the same files."""
+        loose_dir = temp_dir / "loose"
+        bundled_dir = temp_dir / "bundled"
+        for project in (loose_dir, bundled_dir):
+            project.mkdir()
+
+        deploy(
+            target="project",
+            lang="python",
+            backend="files",
+            project_path=loose_dir,
+            config=Config(),
+            no_cache=True,
+        )
+        with (
+            mock.patch("tdd_llm.deployer.get_package_bundle", return_value=package_bundle),
+            mock.patch("tdd_llm.placeholder.get_package_bundle", return_value=package_bundle),
+            mock.patch.object(Path, "read_text", side_effect=AssertionError("loose read")),
+        ):
+            result = deploy(
+                target="project",
+                lang="python",
+                backend="files",
+                project_path=bundled_dir,
+                config=Config(),
+                no_cache=True,
+            )
+
+        assert result.success
+        loose_files = sorted(p.relative_to(loose_dir) for p in loose_dir.rglob("*") if p.is_file())
+        bundled_files = sorted(
+            p.relative_to(bundled_dir) for p in bundled_dir.rglob("*") if p.is_file()
+        )
+        assert loose_files == bundled_files
+        for rel_path in loose_files:
+            assert (loose_dir / rel_path).read_bytes() == (bundled_dir / rel_path).read_bytes()
@@ -71,6 +71,31 @@ class TestDeployCommand:
         assert result.exit_code == 0
         assert "dry run" in result.output.lower()
 
+    def test_deploy_update_hint_and_background_check(self, no_background_update_check):
+        """Test deploy shows a known newer version and starts a stale check without waiting."""
+        hint = "New templates available (1.0.0 -> 1.1.0), run 'tdd-llm update'"
+        with (
+            mock.patch("tdd_llm.cli.Config.load", return_value=Config()),
+            mock.patch("tdd_llm.cli.get_update_hint", return_value=hint),
+            mock.patch("tdd_llm.cli.update_check_due", return_value=True),
+        ):
+            result = runner.invoke(app, ["deploy", "--platform", "claude", "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "1.0.0 -> 1.1.0" in result.output
+        no_background_update_check.assert_called_once()
+
+    def test_deploy_no_check_when_fresh(self, no_background_update_check):
+        """Test no background check starts while the freshness record is within its TTL."""
+        with (
+            mock.patch("tdd_llm.cli.Config.load", return_value=Config()),
+            mock.patch("tdd_llm.cli.update_check_due", return_value=False),
+        ):
+            result = runner.invoke(app, ["deploy", "--platform", "claude", "--dry-run"])
+
+        assert result.exit_code == 0
+        no_background_update_check.assert_not_called()
+
     def test_deploy_invalid_language(self):
         """Test deploy with invalid language."""
         result = runner.invoke(app, [
@@ -444,3 +469,48 @@ class TestDeployIntegration:
             assert "skipped" in result.output.lower()
         finally:
             os.chdir(original_cwd)
+
+    def test_deploy_projects_summary(self, temp_dir):
+        """Test deploy --projects deploys every matched project and prints a summary."""
+        for name in ("svc-a", "svc-b"):
+            (temp_dir / name).mkdir()
+
+        with mock.patch("tdd_llm.config.get_config_dir", return_value=temp_dir / "cfg"):
+            result = runner.invoke(app, [
+                "deploy",
+                "--lang", "python",
+                "--backend", "files",
+                "--platform", "claude",
+                "--projects", str(temp_dir / "svc-*"),
+            ])
+
+        assert result.exit_code == 0
+        assert "Deployment Summary" in result.output
+        assert "svc-a" in result.output
+        assert "svc-b" in result.output
+        assert (temp_dir / "svc-a" / ".claude" / "commands").exists()
+        assert (temp_dir / "svc-b" / ".claude" / "commands").exists()
+
+    def test_deploy_projects_no_match(self, temp_dir):
+        """Test deploy --projects fails when nothing matches."""
+        result = runner.invoke(app, ["deploy", "--projects", str(temp_dir / "nothing-*")])
+
+        assert result.exit_code == 1
+        assert "No project directories found" in result.output
+
+    def test_deploy_jobs_requires_projects(self, temp_dir):
+        """Test deploy --jobs is rejected without --projects."""
+        with mock.patch("tdd_llm.cli.deploy") as mock_deploy:
+            result = runner.invoke(app, ["deploy", "--jobs", "2"])
+
+        assert result.exit_code == 1
+        assert "--jobs only applies to --projects" in result.output
+        mock_deploy.assert_not_called()
+
+    def test_deploy_projects_rejects_zero_jobs(self, temp_dir):
+        """Test deploy --projects --jobs 0 is a usage error, not a crash."""
+        result = runner.invoke(
+            app, ["deploy", "--projects", str(temp_dir / "svc-*"), "--jobs", "0"]
+        )
+
+        assert result.exit_code == 2
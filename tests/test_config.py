@@ -115,6 +115,18 @@ class TestConfig:
         assert config.coverage.line == 95
         assert config.coverage.branch == 70  # default
 
+    def test_templates_source_round_trip(self, temp_config_file, monkeypatch):
+        """Test the templates source is saved, loaded and overridable by env."""
+        monkeypatch.delenv("TDD_LLM_TEMPLATES_SOURCE", raising=False)
+        Config(templates_source="/mnt/mirror/templates").save(temp_config_file)
+
+        loaded = Config.load(temp_config_file, include_project=False)
+        assert loaded.get_templates_source() == "/mnt/mirror/templates"
+        assert "templates_source" not in Config().to_dict()
+
+        monkeypatch.setenv("TDD_LLM_TEMPLATES_SOURCE", "file:///opt/templates.tar.gz")
+        assert loaded.get_templates_source() == "file:///opt/templates.tar.gz"
+
     def test_to_dict(self):
         """Test conversion to dictionary."""
         config = Config(
@@ -1,7 +1,14 @@
 """Tests for converter module."""
 
+import io
 
-from tdd_llm.converter import extract_description, md_to_toml
+from tdd_llm.converter import (
+    convert_file,
+    extract_description,
+    iter_toml,
+    md_to_toml,
+    write_toml,
+)
 
 
 class TestExtractDescription:
@@ -44,6 +51,18 @@ class TestExtractDescription:
         result = extract_description(content)
         assert result == "Just a Title"
 
+    def test_stops_at_first_paragraph(self):
+        """Test the description is the first line that is not a heading."""
+        content = "**Bold intro**\n\n# Later Heading\n\nLater text."
+        result = extract_description(content)
+        assert result == "**Bold intro**"
+
+    def test_skips_subheadings(self):
+        """Test headings between the title and the first paragraph are skipped."""
+        content = "\n# Title\n## Subtitle\n\n  First paragraph.  \nSecond line."
+        result = extract_description(content)
+        assert result == "First paragraph."
+
 
 class TestMdToToml:
     """Tests for md_to_toml function."""
@@ -109,3 +128,40 @@ Line 3
         assert "Line 1" in result
         assert "Line 2" in result
         assert "Line 3" in result
+
+
+class TestStreamingToml:
+    """Tests for incremental TOML conversion."""
+
+    CONTENT = '# Title\n\nIntro.\n\n```python\ndoc = """text"""\nq = """"\n```\n'
+
+    def test_triple_quotes_escaped(self):
+        """Test triple quotes are escaped in the prompt."""
+        result = md_to_toml(self.CONTENT)
+
+        assert 'doc = \\"\\"\\"text\\"\\"\\"' in result
+        assert result.count('"""') == 2
+
+    def test_chunk_boundaries(self):
+        """Test output does not depend on where content is split."""
+        expected = md_to_toml(self.CONTENT)
+
+        for chunk_size in range(1, 8):
+            assert "".join(iter_toml(self.CONTENT, chunk_size)) == expected
+
+    def test_write_toml(self):
+        """Test writing to a file handle matches md_to_toml."""
+        out = io.StringIO()
+        write_toml(self.CONTENT, out, chunk_size=4)
+
+        assert out.getvalue() == md_to_toml(self.CONTENT)
+
+    def test_convert_file(self, temp_dir):
+        """Test converting a file on disk."""
+        source = temp_dir / "cmd.md"
+        source.write_text(self.CONTENT, encoding="utf-8")
+        dest = temp_dir / "out" / "cmd.toml"
+
+        convert_file(source, dest)
+
+        assert dest.read_text(encoding="utf-8") == md_to_toml(self.CONTENT)
@@ -1,8 +1,24 @@
 """Tests for deployer module."""
 
+import os
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
 
 from tdd_llm.config import Config, CoverageThresholds
-from tdd_llm.deployer import DeploymentResult, deploy, get_target_dirs
+from tdd_llm.deployer import (
+    DEPLOY_MANIFEST_NAME,
+    DeployManifest,
+    DeploymentResult,
+    deploy,
+    deploy_projects,
+    find_projects,
+    get_target_dirs,
+    write_files_atomic,
+)
+from tdd_llm.placeholder import PlaceholderResolver
 
 
 class TestGetTargetDirs:
@@ -167,7 +183,7 @@ class TestDeploy:
         )
 
         assert result.success
-        assert len(result.skipped) > 0
+        assert len(result.files_unchanged) > 0
         assert len(result.files_created) == 0
 
     def test_deploy_overwrites_with_force(self, temp_dir):
@@ -238,6 +254,387 @@ class TestDeploy:
         content = status_file.read_text()
         assert "Jira" in content or "MCP" in content
 
+    def test_deploy_builds_placeholder_table_once(self, temp_dir):
+        """Test a single placeholder table is shared by all platforms and files."""
+        with mock.patch(
+            "tdd_llm.deployer.placeholder.PlaceholderResolver", wraps=PlaceholderResolver
+        ) as mock_resolver:
+            result = deploy(
+                target="project",
+                lang="python",
+                backend="files",
+                platforms=["claude", "gemini"],
+                project_path=temp_dir,
+            )
+
+        assert result.success
+        assert mock_resolver.call_count == 1
+
+    def test_deploy_renders_each_template_once(self, temp_dir):
+        """Test templates are rendered once and shared by both platforms."""
+        with mock.patch.object(
+            PlaceholderResolver, "compile", autospec=True, side_effect=PlaceholderResolver.compile
+        ) as mock_compile:
+            result = deploy(
+                target="project",
+                lang="python",
+                backend="files",
+                platforms=["claude", "gemini"],
+                project_path=temp_dir,
+            )
+
+        assert result.success
+        assert mock_compile.call_count == len(result.files_created) // 2
+
+        flow_dir = Path("commands") / "tdd" / "flow"
+        claude_content = (temp_dir / ".claude" / flow_dir / "4-docs.md").read_text()
+        gemini_content = (temp_dir / ".gemini" / flow_dir / "4-docs.toml").read_text()
+        assert "CLAUDE.md" in claude_content
+        assert "GEMINI.md" not in claude_content
+        assert "GEMINI.md" in gemini_content
+        assert "CLAUDE.md" not in gemini_content
+
+    def test_deploy_reports_placeholder_cycle(self, temp_dir):
+        """Test a placeholder cycle fails the affected files only."""
+        values = {"TEST_COMMAND": "{{BUILD_COMMANDS}}", "BUILD_COMMANDS": "{{TEST_COMMAND}}"}
+        with mock.patch("tdd_llm.placeholder._read_package_placeholders", return_value=values):
+            result = deploy(
+                target="project",
+                lang="python",
+                backend="files",
+                platforms=["claude"],
+                project_path=temp_dir,
+                config=Config(),
+                no_cache=True,
+            )
+
+        assert not result.success
+        assert any("Placeholder cycle" in error for error in result.errors)
+        assert result.files_created
+
+
+class TestIncrementalDeploy:
+    """Tests for manifest-based incremental deployment."""
+
+    def _deploy(self, temp_dir, **kwargs):
+        return deploy(
+            target="project",
+            lang=kwargs.pop("lang", "python"),
+            backend="files",
+            platforms=kwargs.pop("platforms", ["claude"]),
+            project_path=temp_dir,
+            **kwargs,
+        )
+
+    def test_manifest_written_per_platform(self, temp_dir):
+        """Test a manifest is written into each commands directory."""
+        self._deploy(temp_dir, platforms=["claude", "gemini"], config=Config())
+
+        claude_manifest = DeployManifest.load(temp_dir / ".claude" / "commands")
+        gemini_manifest = DeployManifest.load(temp_dir / ".gemini" / "commands")
+        assert "tdd/flow/1-analyze.md" in claude_manifest.files
+        assert "tdd/flow/1-analyze.toml" in gemini_manifest.files
+
+        manifest = DeployManifest.load(temp_dir / ".claude" / "commands")
+        entry = manifest.files["tdd/flow/5-review.md"]
+        assert entry["inputs"]["lang"] == "python"
+        assert entry["inputs"]["backend"] == "files"
+        assert entry["inputs"]["coverage"] == {"line": 80, "branch": 70}
+        assert "COVERAGE_THRESHOLDS" in entry["inputs"]["placeholders"]
+        assert manifest.files["tdd/flow/2-test.md"]["inputs"]["coverage"] is None
+
+    def test_redeploy_is_noop(self, temp_dir):
+        """Test re-deploying with unchanged inputs writes nothing."""
+        first = self._deploy(temp_dir, config=Config())
+        second = self._deploy(temp_dir, config=Config())
+
+        assert second.files_created == []
+        assert sorted(second.files_unchanged) == sorted(first.files_created)
+        assert second.skipped == []
+
+    def test_rewrites_files_with_changed_inputs(self, temp_dir):
+        """Test only files whose inputs changed are rewritten."""
+        self._deploy(temp_dir, config=Config())
+
+        config = Config(coverage=CoverageThresholds(line=95, branch=90))
+        result = self._deploy(temp_dir, config=config)
+
+        review_file = temp_dir / ".claude" / "commands" / "tdd" / "flow" / "5-review.md"
+        assert result.files_created == [str(review_file)]
+        assert "95%" in review_file.read_text()
+        assert len(result.files_unchanged) > 0
+
+    def test_rewrites_all_when_lang_changes(self, temp_dir):
+        """Test changing language re-renders every file."""
+        first = self._deploy(temp_dir, config=Config())
+        result = self._deploy(temp_dir, lang="csharp", config=Config())
+
+        assert len(result.files_created) == len(first.files_created)
+        test_file = temp_dir / ".claude" / "commands" / "tdd" / "flow" / "2-test.md"
+        assert "dotnet test" in test_file.read_text()
+
+    def test_user_edits_preserved(self, temp_dir):
+        """Test user-edited files are left alone unless forced."""
+        self._deploy(temp_dir, config=Config())
+        review_file = temp_dir / ".claude" / "commands" / "tdd" / "flow" / "5-review.md"
+        review_file.write_text("my own review command")
+
+        config = Config(coverage=CoverageThresholds(line=95, branch=90))
+        result = self._deploy(temp_dir, config=config)
+
+        assert result.skipped == [str(review_file)]
+        assert review_file.read_text() == "my own review command"
+
+        result = self._deploy(temp_dir, config=config, force=True)
+        assert str(review_file) in result.files_created
+        assert "95%" in review_file.read_text()
+
+    def test_dry_run_reports_changes_without_manifest(self, temp_dir):
+        """Test dry run reports changed files and does not touch the manifest."""
+        self._deploy(temp_dir, config=Config())
+        manifest_path = temp_dir / ".claude" / "commands" / DEPLOY_MANIFEST_NAME
+        before = manifest_path.read_text()
+
+        config = Config(coverage=CoverageThresholds(line=95, branch=90))
+        result = self._deploy(temp_dir, config=config, dry_run=True)
+
+        assert len(result.files_created) == 1
+        assert manifest_path.read_text() == before
+
+    def test_invalid_manifest_ignored(self, temp_dir):
+        """Test an unreadable manifest is treated as empty."""
+        commands_dir = temp_dir / ".claude" / "commands"
+        commands_dir.mkdir(parents=True)
+        (commands_dir / DEPLOY_MANIFEST_NAME).write_text("not json")
+
+        assert DeployManifest.load(commands_dir).files == {}
+
+
+class TestFindProjects:
+    """Tests for find_projects function."""
+
+    def test_glob_pattern(self, temp_dir):
+        """Test a glob pattern matches project directories only."""
+        (temp_dir / "svc-a").mkdir()
+        (temp_dir / "svc-b").mkdir()
+        (temp_dir / "svc-file.txt").write_text("not a project")
+
+        projects = find_projects(str(temp_dir / "svc-*"))
+
+        assert projects == [(temp_dir / "svc-a").resolve(), (temp_dir / "svc-b").resolve()]
+
+    def test_list_file(self, temp_dir):
+        """Test a file listing project directories."""
+        (temp_dir / "svc-a").mkdir()
+        (temp_dir / "svc-b").mkdir()
+        list_file = temp_dir / "projects.txt"
+        list_file.write_text(
+            f"# services\n{temp_dir / 'svc-b'}\n\n{temp_dir / 'svc-a'}\n{temp_dir / 'missing'}\n"
+        )
+
+        projects = find_projects(str(list_file))
+
+        assert projects == [(temp_dir / "svc-a").resolve(), (temp_dir / "svc-b").resolve()]
+
+
+class TestDeployProjects:
+    """Tests for deploy_projects function."""
+
+    def _make_projects(self, temp_dir, configs):
+        paths = []
+        for name, project_config in configs.items():
+            path = temp_dir / name
+            path.mkdir()
+            if project_config:
+                (path / ".tdd-llm.yaml").write_text(project_config)
+            paths.append(path)
+        return paths
+
+    def test_deploys_each_project_with_its_config(self, temp_dir):
+        """Test each project is deployed using its own configuration."""
+        paths = self._make_projects(
+            temp_dir,
+            {
+                "py": "default_language: python\n",
+                "cs": "default_language: csharp\ncoverage:\n  line: 95\n",
+            },
+        )
+
+        with mock.patch("tdd_llm.config.get_config_dir", return_value=temp_dir / "cfg"):
+            results = deploy_projects(paths, platforms=["claude"], max_workers=2)
+
+        assert list(results) == paths
+        assert all(result.success for result in results.values())
+
+        flow_dir = Path(".claude") / "commands" / "tdd" / "flow"
+        assert "pytest" in (paths[0] / flow_dir / "2-test.md").read_text()
+        assert "dotnet test" in (paths[1] / flow_dir / "2-test.md").read_text()
+        assert "95%" in (paths[1] / flow_dir / "5-review.md").read_text()
+
+    def test_renders_once_per_combination(self, temp_dir):
+        """Test projects sharing a configuration share one rendering."""
+        paths = self._make_projects(temp_dir, {f"svc-{i}": "" for i in range(4)})
+
+        with (
+            mock.patch("tdd_llm.config.get_config_dir", return_value=temp_dir / "cfg"),
+            mock.patch.object(
+                PlaceholderResolver,
+                "compile",
+                autospec=True,
+                side_effect=PlaceholderResolver.compile,
+            ) as mock_compile,
+        ):
+            results = deploy_projects(paths, lang="python", backend="files")
+
+        created = [len(result.files_created) for result in results.values()]
+        assert len(set(created)) == 1
+        # One compile per template, each template deployed to two platforms
+        assert mock_compile.call_count == created[0] // 2
+
+    def test_unknown_language_reported_per_project(self, temp_dir):
+        """Test an invalid project config fails only that project."""
+        paths = self._make_projects(
+            temp_dir,
+            {"good": "default_language: python\n", "bad": "default_language: cobol\n"},
+        )
+
+        with mock.patch("tdd_llm.config.get_config_dir", return_value=temp_dir / "cfg"):
+            results = deploy_projects(paths, platforms=["claude"])
+
+        assert results[paths[0]].success
+        assert not results[paths[1]].success
+        assert "cobol" in results[paths[1]].errors[0]
+
+    def test_concurrent_expansion_reports_cycle(self, temp_dir):
+        """Test workers re-expanding a failed template do not share a stack."""
+        paths = self._make_projects(temp_dir, {f"svc-{i}": "" for i in range(8)})
+        # STATE_READ -> P1 -> ... -> P5 -> STATE_READ; templates using it
+        # cannot be rendered up front and are expanded again by every worker
+        chain = ["STATE_READ", "P1", "P2", "P3", "P4", "P5"]
+        values = {name: f"{{{{{chain[(i + 1) % len(chain)]}}}}}" for i, name in enumerate(chain)}
+        resolve = PlaceholderResolver.resolve
+
+        def _slow_resolve(self, name, platform=None):
+            time.sleep(0.005)
+            return resolve(self, name, platform)
+
+        with (
+            mock.patch("tdd_llm.config.get_config_dir", return_value=temp_dir / "cfg"),
+            mock.patch("tdd_llm.placeholder._read_package_placeholders", return_value=values),
+            mock.patch.object(PlaceholderResolver, "resolve", _slow_resolve),
+        ):
+            results = deploy_projects(
+                paths,
+                lang="python",
+                backend="files",
+                platforms=["claude"],
+                no_cache=True,
+                max_workers=8,
+            )
+
+        for result in results.values():
+            assert not result.success
+            assert result.errors
+            assert all("Placeholder cycle" in error for error in result.errors)
+
+
+class TestAtomicWrites:
+    """Tests for atomic batched writes."""
+
+    def test_write_files_atomic(self, temp_dir):
+        """Test a batch of files is written, creating directories as needed."""
+        files = [
+            (temp_dir / "a" / "one.md", "one"),
+            (temp_dir / "a" / "two.md", "two"),
+            (temp_dir / "b" / "c" / "three.md", "three"),
+        ]
+
+        write_files_atomic(files)
+
+        for path, text in files:
+            assert path.read_text() == text
+        assert not list(temp_dir.rglob("*.tmp"))
+
+    def test_staging_failure_writes_nothing(self, temp_dir):
+        """Test a failure before commit leaves existing files untouched."""
+        existing = temp_dir / "existing.md"
+        existing.write_text("original")
+        blocker = temp_dir / "blocker"
+        blocker.write_text("a file, not a directory")
+
+        with pytest.raises(OSError):
+            write_files_atomic([(existing, "new"), (blocker / "nested.md", "x")])
+
+        assert existing.read_text() == "original"
+        assert not list(temp_dir.rglob("*.tmp"))
+
+    def test_commit_failure_cleans_temp_files(self, temp_dir):
+        """Test staged files are removed if moving them into place fails."""
+        files = [(temp_dir / "one.md", "one"), (temp_dir / "two.md", "two")]
+
+        with mock.patch("tdd_llm.deployer.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_files_atomic(files)
+
+        assert list(temp_dir.iterdir()) == []
+
+    def test_commit_failure_rolls_back_batch(self, temp_dir):
+        """Test files already moved into place are restored when a later one fails."""
+        existing = temp_dir / "existing.md"
+        existing.write_text("original")
+        manifest = temp_dir / DEPLOY_MANIFEST_NAME
+        manifest.write_text("old manifest")
+        files = [
+            (existing, "new"),
+            (temp_dir / "created.md", "created"),
+            (temp_dir / "failing.md", "never written"),
+            (manifest, "new manifest"),
+        ]
+        real_replace = os.replace
+
+        def replace(src, dst):
+            if Path(dst).name == "failing.md":
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        with mock.patch("tdd_llm.deployer.os.replace", side_effect=replace):
+            with pytest.raises(OSError):
+                write_files_atomic(files)
+
+        assert existing.read_text() == "original"
+        assert manifest.read_text() == "old manifest"
+        assert sorted(p.name for p in temp_dir.iterdir()) == [DEPLOY_MANIFEST_NAME, "existing.md"]
+
+    def test_deploy_failed_batch_reports_error(self, temp_dir):
+        """Test a failed batch is reported and no files are listed as created."""
+        with mock.patch("tdd_llm.deployer.write_files_atomic", side_effect=OSError("read-only")):
+            result = deploy(
+                target="project",
+                lang="python",
+                backend="files",
+                platforms=["claude"],
+                project_path=temp_dir,
+                config=Config(),
+            )
+
+        assert not result.success
+        assert result.files_created == []
+        assert "read-only" in result.errors[0]
+        assert not (temp_dir / ".claude").exists()
+
+    def test_deploy_reports_duration(self, temp_dir):
+        """Test deployment timing is reported."""
+        result = deploy(
+            target="project",
+            lang="python",
+            backend="files",
+            platforms=["claude"],
+            project_path=temp_dir,
+            config=Config(),
+        )
+
+        assert result.duration > 0
+
 
 class TestDeploymentResult:
     """Tests for DeploymentResult dataclass."""
@@ -252,6 +649,7 @@ class TestDeploymentResult:
         assert result.placeholders_replaced == []
         assert result.errors == []
         assert result.skipped == []
+        assert result.files_unchanged == []
 
     def test_result_with_data(self):
         """Test DeploymentResult with data."""
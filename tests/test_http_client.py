@@ -0,0 +1,137 @@
+"""Tests for the shared HTTP client policy."""
+
+from unittest import mock
+
+import httpx
+import pytest
+
+from tdd_llm.http_client import (
+    MAX_BACKOFF,
+    close_shared_client,
+    create_client,
+    get_shared_client,
+    http2_enabled,
+    send_with_retry,
+)
+
+
+def _client(statuses, headers=None):
+    """Client answering with the given statuses in turn, recording requests."""
+    seen = []
+
+    def handler(request):
+        seen.append(request.method)
+        status = statuses[min(len(seen), len(statuses)) - 1]
+        if isinstance(status, Exception):
+            raise status
+        return httpx.Response(status, headers=headers or {})
+
+    return httpx.Client(transport=httpx.MockTransport(handler)), seen
+
+
+@pytest.fixture
+def no_sleep():
+    with mock.patch("tdd_llm.http_client.time.sleep") as sleep:
+        yield sleep
+
+
+class TestSharedClient:
+    """Tests for the process-wide client."""
+
+    def test_reused_until_closed(self):
+        """Test one client serves every caller until closed."""
+        client = get_shared_client()
+
+        assert get_shared_client() is client
+        close_shared_client()
+        assert client.is_closed
+        assert get_shared_client() is not client
+
+    def test_create_client_pool_size(self):
+        """Test a dedicated client gets its own pool size and the shared timeout."""
+        with create_client(max_connections=3) as client:
+            assert client.timeout.connect == 10.0
+            assert not client.follow_redirects
+
+    def test_redirects_opt_in(self):
+        """Test callers can opt in to following redirects."""
+        with create_client(follow_redirects=True) as client:
+            assert client.follow_redirects
+
+    def test_http2_opt_out(self, monkeypatch):
+        """Test TDD_LLM_HTTP2=0 disables HTTP/2 even with h2 installed."""
+        monkeypatch.setenv("TDD_LLM_HTTP2", "0")
+        assert not http2_enabled()
+
+
+class TestSendWithRetry:
+    """Tests for the retry and backoff policy."""
+
+    def test_throttled_post_not_retried_by_default(self, no_sleep):
+        """Test 429 is returned for POST unless the caller opts in."""
+        client, seen = _client([429, 200])
+
+        response = send_with_retry(client, "POST", "https://jira.example/issue")
+
+        assert response.status_code == 429
+        assert seen == ["POST"]
+        no_sleep.assert_not_called()
+
+    def test_retries_throttled_post_when_opted_in(self, no_sleep):
+        """Test 429 and 503 are retried for POST with retry_non_idempotent."""
+        client, seen = _client([429, 503, 200])
+
+        response = send_with_retry(
+            client, "POST", "https://jira.example/search", retry_non_idempotent=True
+        )
+
+        assert response.status_code == 200
+        assert seen == ["POST"] * 3
+        assert [c.args[0] for c in no_sleep.call_args_list] == [0.5, 1.0]
+
+    def test_opt_in_keeps_gateway_errors_idempotent_only(self, no_sleep):
+        """Test opting in does not replay a POST after a 502."""
+        client, seen = _client([502, 200])
+
+        response = send_with_retry(
+            client, "POST", "https://jira.example/search", retry_non_idempotent=True
+        )
+
+        assert response.status_code == 502
+        assert seen == ["POST"]
+
+    def test_gateway_errors_only_for_idempotent(self, no_sleep):
+        """Test 502 is retried for GET but not for POST, which may have been applied."""
+        client, seen = _client([502, 200])
+        assert send_with_retry(client, "GET", "https://jira.example/issue").status_code == 200
+
+        client, seen = _client([502, 200])
+        assert send_with_retry(client, "POST", "https://jira.example/issue").status_code == 502
+        assert seen == ["POST"]
+
+    def test_retry_after_honored_and_capped(self, no_sleep):
+        """Test Retry-After sets the wait, up to MAX_BACKOFF."""
+        client, _ = _client([429, 200], headers={"Retry-After": "3600"})
+
+        send_with_retry(client, "GET", "https://jira.example/issue")
+
+        no_sleep.assert_called_once_with(MAX_BACKOFF)
+
+    def test_gives_up_after_max_retries(self, no_sleep):
+        """Test the last response is returned once retries are exhausted."""
+        client, seen = _client([503])
+
+        response = send_with_retry(client, "GET", "https://jira.example/issue", max_retries=2)
+
+        assert response.status_code == 503
+        assert len(seen) == 3
+
+    def test_transport_errors(self, no_sleep):
+        """Test dropped connections are retried for GET and raised for POST."""
+        error = httpx.ReadError("connection reset")
+        client, seen = _client([error, 200])
+        assert send_with_retry(client, "GET", "https://jira.example/issue").status_code == 200
+
+        client, _ = _client([error, 200])
+        with pytest.raises(httpx.ReadError):
+            send_with_retry(client, "POST", "https://jira.example/issue")
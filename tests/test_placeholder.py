@@ -1,8 +1,15 @@
 """Tests for placeholder module."""
 
+from unittest import mock
+
+import pytest
 
 from tdd_llm.config import Config, CoverageThresholds
 from tdd_llm.placeholder import (
+    MAX_PLACEHOLDER_DEPTH,
+    PlaceholderCycleError,
+    PlaceholderDepthError,
+    PlaceholderResolver,
     find_placeholders,
     get_all_placeholders_for_backend,
     get_all_placeholders_for_lang,
@@ -10,6 +17,7 @@ from tdd_llm.placeholder import (
     get_platform_placeholder,
     load_placeholder,
     replace_placeholders,
+    substitute_placeholders,
 )
 
 
@@ -206,6 +214,264 @@ class TestReplacePlaceholders:
         assert "80%" in result
 
 
+class TestSubstitutePlaceholders:
+    """Tests for substitute_placeholders function."""
+
+    def test_replaces_and_reports_names(self):
+        """Test rendered text and replaced/unresolved sets."""
+        values = {"FOO": "foo", "BAR": "bar"}
+        result = substitute_placeholders("{{FOO}} {{BAR}} {{MISSING}}", values.get)
+
+        assert result.text == "foo bar "
+        assert result.replaced == {"FOO", "BAR"}
+        assert result.unresolved == {"MISSING"}
+
+    def test_keep_unfound(self):
+        """Test unresolved placeholders are kept when remove_unfound is False."""
+        result = substitute_placeholders("a {{MISSING}} b", lambda name: None, False)
+
+        assert result.text == "a {{MISSING}} b"
+        assert result.unresolved == {"MISSING"}
+
+    def test_lookup_called_once_per_name(self):
+        """Test each distinct name is looked up only once."""
+        lookup = mock.Mock(return_value="x")
+        result = substitute_placeholders("{{FOO}}{{FOO}}{{BAR}}{{FOO}}", lookup)
+
+        assert result.text == "xxxx"
+        assert lookup.call_count == 2
+
+    def test_nested_placeholders_expanded(self):
+        """Test placeholders inside values are expanded recursively."""
+        values = {"FOO": "<{{BAR}}>", "BAR": "[{{BAZ}}]", "BAZ": "baz"}
+        result = substitute_placeholders("{{FOO}} {{BAR}} {{MISSING_REF}}", values.get)
+
+        assert result.text == "<[baz]> [baz] "
+        assert result.replaced == {"FOO", "BAR", "BAZ"}
+        assert result.unresolved == {"MISSING_REF"}
+
+    def test_nested_unresolved_reported(self):
+        """Test unresolved names inside values are reported."""
+        result = substitute_placeholders("{{FOO}}", {"FOO": "a{{NOPE}}b"}.get, False)
+
+        assert result.text == "a{{NOPE}}b"
+        assert result.unresolved == {"NOPE"}
+
+    def test_nested_expanded_once(self):
+        """Test each placeholder is expanded once however often it is nested."""
+        values = {"A": "{{SHARED}}{{SHARED}}", "B": "{{SHARED}}", "SHARED": "{{LEAF}}"}
+        lookup = mock.Mock(side_effect=lambda name: values.get(name, "leaf"))
+
+        result = substitute_placeholders("{{A}} {{B}} {{SHARED}}", lookup)
+
+        assert result.text == "leafleaf leaf leaf"
+        assert sorted(call.args[0] for call in lookup.call_args_list) == [
+            "A",
+            "B",
+            "LEAF",
+            "SHARED",
+        ]
+
+    def test_cycle_raises(self):
+        """Test placeholders referencing each other are reported as a cycle."""
+        values = {"A": "{{B}}", "B": "{{C}}", "C": "{{A}}"}
+
+        with pytest.raises(PlaceholderCycleError) as exc_info:
+            substitute_placeholders("x {{A}}", values.get)
+
+        assert exc_info.value.chain == ["A", "B", "C", "A"]
+        assert "A -> B -> C -> A" in str(exc_info.value)
+
+    def test_self_reference_raises(self):
+        """Test a placeholder referencing itself is a cycle."""
+        with pytest.raises(PlaceholderCycleError):
+            substitute_placeholders("{{A}}", {"A": "again {{A}}"}.get)
+
+    def _chain(self, levels):
+        """Placeholders P1 -> P2 -> ... nested levels deep, the last one plain text."""
+        values = {f"P{i}": f"{{{{P{i + 1}}}}}" for i in range(1, levels)}
+        values[f"P{levels}"] = "end"
+        return values
+
+    def test_depth_limit_allows_max_depth_levels(self):
+        """Test a chain exactly max_depth placeholders deep expands."""
+        values = self._chain(5)
+
+        assert substitute_placeholders("{{P1}}", values.get, max_depth=5).text == "end"
+
+    def test_depth_limit_rejects_one_level_more(self):
+        """Test a chain max_depth + 1 placeholders deep raises."""
+        values = self._chain(6)
+
+        with pytest.raises(PlaceholderDepthError) as exc_info:
+            substitute_placeholders("{{P1}}", values.get, max_depth=5)
+
+        assert exc_info.value.chain == [f"P{i}" for i in range(1, 7)]
+
+    def test_default_depth_limit(self):
+        """Test the default limit is MAX_PLACEHOLDER_DEPTH levels."""
+        values = self._chain(MAX_PLACEHOLDER_DEPTH)
+        assert substitute_placeholders("{{P1}}", values.get).text == "end"
+
+        values = self._chain(MAX_PLACEHOLDER_DEPTH + 1)
+        with pytest.raises(PlaceholderDepthError):
+            substitute_placeholders("{{P1}}", values.get)
+
+    def test_empty_value_counts_as_replaced(self):
+        """Test an empty string value is a valid replacement."""
+        result = substitute_placeholders("[{{EMPTY}}]", {"EMPTY": ""}.get)
+
+        assert result.text == "[]"
+        assert result.replaced == {"EMPTY"}
+        assert result.unresolved == set()
+
+
+class TestPlaceholderResolver:
+    """Tests for PlaceholderResolver class."""
+
+    def test_resolves_lang_and_backend(self):
+        """Test resolver loads both lang and backend placeholders."""
+        resolver = PlaceholderResolver("python", "files", no_cache=True)
+
+        assert "pytest" in resolver.resolve("BUILD_COMMANDS")
+        assert "state.json" in resolver.resolve("STATE_READ")
+        assert resolver.resolve("NONEXISTENT") is None
+
+    def test_matches_load_placeholder(self):
+        """Test resolver returns the same values as load_placeholder."""
+        config = Config(coverage=CoverageThresholds(line=91, branch=81))
+        resolver = PlaceholderResolver("python", "jira", config, no_cache=True)
+
+        for name in ["BUILD_COMMANDS", "STATE_READ", "COVERAGE_THRESHOLDS", "AGENT_FILE"]:
+            expected = load_placeholder(
+                name, "python", "jira", config, no_cache=True, platform="gemini"
+            )
+            assert resolver.resolve(name, platform="gemini") == expected
+
+    def test_platform_and_config_resolved_per_call(self):
+        """Test platform and config placeholders are resolved dynamically."""
+        config = Config(coverage=CoverageThresholds(line=95, branch=85))
+        resolver = PlaceholderResolver("python", "files", config, no_cache=True)
+
+        assert resolver.resolve("AGENT_FILE", platform="claude") == "CLAUDE.md"
+        assert resolver.resolve("AGENT_FILE", platform="gemini") == "GEMINI.md"
+        assert "Line >= 95%" in resolver.resolve("COVERAGE_THRESHOLDS")
+
+    def test_cached_placeholders_take_priority(self, temp_dir):
+        """Test cached placeholder files override package files."""
+        cached_lang = temp_dir / "langs" / "python"
+        cached_lang.mkdir(parents=True)
+        (cached_lang / "BUILD_COMMANDS.md").write_text("cached commands\n")
+
+        with mock.patch(
+            "tdd_llm.placeholder.get_cached_lang_placeholders_dir", return_value=cached_lang
+        ):
+            resolver = PlaceholderResolver("python", "files")
+            assert resolver.resolve("BUILD_COMMANDS") == "cached commands"
+
+            resolver = PlaceholderResolver("python", "files", no_cache=True)
+            assert "pytest" in resolver.resolve("BUILD_COMMANDS")
+
+    def test_lang_takes_priority_over_backend(self, temp_dir):
+        """Test language placeholders override backend placeholders of the same name."""
+        lang_dir = temp_dir / "lang"
+        backend_dir = temp_dir / "backend"
+        lang_dir.mkdir()
+        backend_dir.mkdir()
+        (lang_dir / "SHARED.md").write_text("from lang")
+        (backend_dir / "SHARED.md").write_text("from backend")
+
+        with (
+            mock.patch("tdd_llm.placeholder.get_package_bundle", return_value=None),
+            mock.patch("tdd_llm.placeholder.get_lang_placeholders_dir", return_value=lang_dir),
+            mock.patch(
+                "tdd_llm.placeholder.get_backend_placeholders_dir", return_value=backend_dir
+            ),
+        ):
+            resolver = PlaceholderResolver("python", "files", no_cache=True)
+
+        assert resolver.resolve("SHARED") == "from lang"
+
+    def test_compile_leaves_platform_slots(self):
+        """Test compile renders everything except platform placeholders."""
+        resolver = PlaceholderResolver("python", "files", no_cache=True)
+        compiled = resolver.compile("{{AGENT_FILE}}: {{BUILD_COMMANDS}} {{MISSING}} {{AGENT_FILE}}")
+
+        assert compiled.slots == ["AGENT_FILE", "AGENT_FILE"]
+        assert compiled.replaced == {"BUILD_COMMANDS"}
+        assert compiled.unresolved == {"MISSING"}
+        assert "pytest" in compiled.chunks[1]
+
+    def test_compiled_render_per_platform(self):
+        """Test a compiled template renders for each platform."""
+        resolver = PlaceholderResolver("python", "files", no_cache=True)
+        compiled = resolver.compile("See {{AGENT_FILE}} and {{AGENT_FILE}}.")
+
+        claude = compiled.render("claude")
+        gemini = compiled.render("gemini")
+
+        assert claude.text == "See CLAUDE.md and CLAUDE.md."
+        assert gemini.text == "See GEMINI.md and GEMINI.md."
+        assert claude.replaced == {"AGENT_FILE"}
+
+    def test_compiled_render_without_platform(self):
+        """Test platform slots follow remove_unfound when no platform is given."""
+        resolver = PlaceholderResolver("python", "files", no_cache=True)
+
+        assert resolver.compile("[{{AGENT_FILE}}]").render().text == "[]"
+        kept = resolver.compile("[{{AGENT_FILE}}]", remove_unfound=False).render()
+        assert kept.text == "[{{AGENT_FILE}}]"
+        assert kept.unresolved == {"AGENT_FILE"}
+
+    def test_nested_platform_placeholder_stays_a_slot(self):
+        """Test platform placeholders nested in values are rendered per platform."""
+        resolver = PlaceholderResolver("python", "files", no_cache=True)
+        resolver.values["OUTER"] = "Read {{AGENT_FILE}} then {{INNER}}"
+        resolver.values["INNER"] = "{{BUILD_COMMANDS}}"
+
+        compiled = resolver.compile("{{OUTER}}")
+
+        assert compiled.slots == ["AGENT_FILE"]
+        assert compiled.replaced == {"OUTER", "INNER", "BUILD_COMMANDS"}
+        assert compiled.render("gemini").text.startswith("Read GEMINI.md then ")
+        assert "pytest" in compiled.render("claude").text
+
+    def test_expansion_memoized_across_templates(self):
+        """Test a placeholder is expanded once per resolver, not per template."""
+        resolver = PlaceholderResolver("python", "files", no_cache=True)
+        resolver.values["OUTER"] = "<{{INNER}}>"
+        resolver.values["INNER"] = "inner"
+
+        with mock.patch.object(resolver, "resolve", wraps=resolver.resolve) as mock_resolve:
+            resolver.compile("{{OUTER}}")
+            resolver.compile("{{OUTER}} {{INNER}}")
+
+        assert mock_resolve.call_count == 2
+        assert resolver.expand("OUTER") == "<inner>"
+
+    def test_compile_cycle_raises(self):
+        """Test cycles are reported when compiling through the resolver."""
+        resolver = PlaceholderResolver("python", "files", no_cache=True)
+        resolver.values["A"] = "{{B}}"
+        resolver.values["B"] = "{{A}}"
+
+        with pytest.raises(PlaceholderCycleError):
+            resolver.compile("{{A}}")
+
+    def test_replace(self):
+        """Test replacing placeholders through the resolver."""
+        resolver = PlaceholderResolver("python", "files", no_cache=True)
+        content = "{{BUILD_COMMANDS}} / {{AGENT_FILE}} / {{NONEXISTENT}}"
+
+        result = resolver.replace(content, platform="claude")
+        assert "pytest" in result
+        assert "CLAUDE.md" in result
+        assert "{{" not in result
+
+        result = resolver.replace(content, platform="claude", remove_unfound=False)
+        assert "{{NONEXISTENT}}" in result
+
+
 class TestGetAllPlaceholders:
     """Tests for get_all_placeholders_* functions."""
 
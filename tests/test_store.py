@@ -0,0 +1,129 @@
+"""Tests for the content-addressed template store."""
+
+import hashlib
+
+import pytest
+
+from tdd_llm.store import TemplateStore
+
+
+@pytest.fixture
+def store(temp_dir):
+    return TemplateStore(temp_dir / "store")
+
+
+def _add(store, temp_dir, content):
+    """Store content through a file, returning its checksum."""
+    checksum = hashlib.sha256(content).hexdigest()
+    path = temp_dir / f"{checksum}.src"
+    path.write_bytes(content)
+    store.add_file(path, checksum)
+    return checksum
+
+
+class TestBlobs:
+    """Tests for content-addressed blobs."""
+
+    def test_add_and_read(self, store, temp_dir):
+        """Test a blob is named by the SHA-256 of its content."""
+        checksum = _add(store, temp_dir, b"hello")
+
+        assert checksum == hashlib.sha256(b"hello").hexdigest()
+        assert store.blob_path(checksum).parent.name == checksum[:2]
+        assert store.read_blob(checksum) == b"hello"
+
+    def test_add_file(self, store, temp_dir):
+        """Test storing a file under its known checksum."""
+        path = temp_dir / "a.md"
+        path.write_bytes(b"# A\n")
+        checksum = hashlib.sha256(b"# A\n").hexdigest()
+
+        store.add_file(path, checksum)
+
+        assert store.has_blob(checksum)
+        assert store.read_blob(checksum) == b"# A\n"
+
+    def test_missing_blob(self, store):
+        """Test reading a blob that was never stored."""
+        assert store.read_blob("0" * 64) is None
+
+    def test_corrupt_blob_dropped(self, store, temp_dir):
+        """Test a blob that no longer matches its name is deleted."""
+        checksum = _add(store, temp_dir, b"hello")
+        store.blob_path(checksum).write_bytes(b"tampered")
+
+        assert store.read_blob(checksum) is None
+        assert not store.has_blob(checksum)
+
+    def test_restore(self, store, temp_dir):
+        """Test copying a blob out of the store."""
+        checksum = _add(store, temp_dir, b"hello")
+        dest = temp_dir / "out" / "a.md"
+
+        assert store.restore(checksum, dest)
+        assert dest.read_bytes() == b"hello"
+        assert not store.restore("0" * 64, temp_dir / "b.md")
+
+
+class TestVersions:
+    """Tests for version manifests and the active pointer."""
+
+    def test_save_and_load(self, store):
+        """Test a version manifest round-trips."""
+        manifest = {"version": "1.0.0", "templates": {"a.md": "abc"}}
+        store.save_version("1.0.0", manifest)
+
+        assert store.load_version("1.0.0") == manifest
+        assert store.load_version("2.0.0") is None
+        assert store.versions() == ["1.0.0"]
+
+    def test_invalid_version_name(self, store):
+        """Test versions that are not safe file names are rejected."""
+        with pytest.raises(ValueError, match="Invalid template version"):
+            store.save_version("../evil", {"templates": {}})
+        assert store.load_version("../evil") is None
+
+    def test_missing_blobs(self, store, temp_dir):
+        """Test listing the files of a version that are not stored."""
+        checksum = _add(store, temp_dir, b"a")
+        manifest = {"templates": {"a.md": checksum, "b.md": "0" * 64}}
+
+        assert store.missing_blobs(manifest) == ["b.md"]
+
+    def test_active_pointer(self, store):
+        """Test switching versions keeps the previous one for rollback."""
+        assert store.active() is None
+
+        store.set_active("1.0.0")
+        store.set_active("2.0.0")
+        store.set_active("2.0.0")
+
+        assert store.active() == "2.0.0"
+        assert store.previous() == "1.0.0"
+
+    def test_set_active_prunes_old_versions(self, store, temp_dir):
+        """Test only the active and previous versions and their blobs are kept."""
+        shared = _add(store, temp_dir, b"shared")
+        blobs = {}
+        for version in ("1.0.0", "2.0.0", "3.0.0"):
+            blobs[version] = _add(store, temp_dir, version.encode())
+            store.save_version(version, {"templates": {"a.md": shared, "b.md": blobs[version]}})
+            store.set_active(version)
+
+        assert store.versions() == ["2.0.0", "3.0.0"]
+        assert not store.has_blob(blobs["1.0.0"])
+        assert store.has_blob(blobs["2.0.0"])
+        assert store.has_blob(blobs["3.0.0"])
+        assert store.has_blob(shared)
+
+    def test_prune_drops_unreferenced_blobs(self, store, temp_dir):
+        """Test blobs left by an update that never became active are pruned."""
+        kept = _add(store, temp_dir, b"kept")
+        orphan = _add(store, temp_dir, b"orphan")
+        store.save_version("1.0.0", {"templates": {"a.md": kept}})
+
+        store.set_active("1.0.0")
+
+        assert store.has_blob(kept)
+        assert not store.has_blob(orphan)
+        assert not store.blob_path(orphan).parent.exists()
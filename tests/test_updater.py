@@ -1,18 +1,56 @@
 """Tests for updater module."""
 
+import contextlib
 import hashlib
+import io
 import json
+import os
+import shutil
+import tarfile
+import time
+import zipfile
 from unittest import mock
+from urllib.parse import urlparse
 
+import httpx
+import pytest
+
+from tdd_llm.bundle import TemplateBundle, pack_templates
+from tdd_llm.store import TemplateStore
 from tdd_llm.updater import (
     Manifest,
+    UpdateCheck,
     UpdateResult,
+    _HashCache,
+    _save_update_check,
     _verify_checksum,
+    check_for_update,
+    get_installed_version,
     get_local_manifest,
+    get_update_hint,
+    load_update_check,
+    rollback_templates,
+    start_background_check,
+    switch_templates,
+    update_check_due,
     update_templates,
 )
 
 
+def _mock_stream(content):
+    """Build a client.stream() side effect serving content for every URL."""
+
+    @contextlib.contextmanager
+    def stream(method, url, **kwargs):
+        response = mock.Mock()
+        response.status_code = 200
+        response.headers = {}
+        response.iter_bytes.return_value = [content]
+        yield response
+
+    return stream
+
+
 class TestManifest:
     """Tests for Manifest dataclass."""
 
@@ -36,6 +74,18 @@ class TestManifest:
         result = manifest.to_json()
         assert result == {"version": "1.0.0", "templates": {"foo.md": "abc123"}}
 
+    def test_archive_roundtrip(self):
+        """Test the archive field survives a JSON roundtrip."""
+        data = {
+            "version": "1.0.0",
+            "templates": {"foo.md": "abc123"},
+            "archive": {"path": "templates.tar.gz", "sha256": "def456"},
+        }
+        manifest = Manifest.from_json(data)
+        assert manifest.archive == "templates.tar.gz"
+        assert manifest.archive_checksum == "def456"
+        assert manifest.to_json() == data
+
 
 class TestVerifyChecksum:
     """Tests for checksum verification."""
@@ -101,6 +151,7 @@ class TestUpdateResult:
         assert result.previous_version is None
         assert result.files_updated == []
         assert result.files_unchanged == []
+        assert result.files_removed == []
         assert result.errors == []
 
 
@@ -123,6 +174,19 @@ class TestUpdateTemplates:
                 assert len(result.errors) > 0
                 assert "Network error" in result.errors[0]
 
+    def test_connect_error_names_source_host(self, temp_dir, template_server):
+        """Test a connection error late in the update still reports the source host."""
+        template_server.publish({"commands/a.md": b"# A\n"}, "1.0.0")
+
+        with (
+            mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir),
+            mock.patch("tdd_llm.updater._apply_update", side_effect=httpx.ConnectError("refused")),
+        ):
+            result = update_templates(source=template_server.url)
+
+        host = urlparse(template_server.url).hostname
+        assert result.errors == [f"Network error: Could not connect to {host}"]
+
     def test_up_to_date(self, temp_dir):
         """Test when already up to date."""
         # Setup existing cache with same version
@@ -135,6 +199,7 @@ class TestUpdateTemplates:
                 mock_response = mock.Mock()
                 mock_response.json.return_value = {"version": "1.0.0", "templates": {}}
                 mock_response.raise_for_status = mock.Mock()
+                mock_response.headers = {}
                 mock_client.return_value.__enter__.return_value.get.return_value = mock_response
 
                 result = update_templates()
@@ -154,6 +219,7 @@ class TestUpdateTemplates:
                 mock_response = mock.Mock()
                 mock_response.json.return_value = {"version": "1.0.0", "templates": {}}
                 mock_response.raise_for_status = mock.Mock()
+                mock_response.headers = {}
                 mock_client.return_value.__enter__.return_value.get.return_value = mock_response
 
                 result = update_templates(force=True)
@@ -171,15 +237,15 @@ class TestUpdateTemplates:
         def mock_get(url, **kwargs):
             mock_resp = mock.Mock()
             mock_resp.raise_for_status = mock.Mock()
-            if "manifest.json" in url:
-                mock_resp.json.return_value = manifest_data
-            else:
-                mock_resp.content = test_content
+            mock_resp.headers = {}
+            mock_resp.json.return_value = manifest_data
             return mock_resp
 
         with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
             with mock.patch("httpx.Client") as mock_client:
-                mock_client.return_value.__enter__.return_value.get.side_effect = mock_get
+                client = mock_client.return_value.__enter__.return_value
+                client.get.side_effect = mock_get
+                client.stream.side_effect = _mock_stream(test_content)
 
                 result = update_templates()
 
@@ -187,6 +253,10 @@ class TestUpdateTemplates:
                 assert result.version == "1.1.0"
                 assert "commands/test.md" in result.files_updated
 
+                bundle = TemplateBundle.load(temp_dir / "templates.pack")
+                assert bundle.version == "1.1.0"
+                assert bundle.read_text("commands/test.md") == "# Test Template"
+
     def test_checksum_mismatch(self, temp_dir):
         """Test handling of checksum mismatch."""
         manifest_data = {"version": "1.0.0", "templates": {"commands/test.md": "expected_checksum"}}
@@ -194,15 +264,15 @@ class TestUpdateTemplates:
         def mock_get(url, **kwargs):
             mock_resp = mock.Mock()
             mock_resp.raise_for_status = mock.Mock()
-            if "manifest.json" in url:
-                mock_resp.json.return_value = manifest_data
-            else:
-                mock_resp.content = b"different content"
+            mock_resp.headers = {}
+            mock_resp.json.return_value = manifest_data
             return mock_resp
 
         with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
             with mock.patch("httpx.Client") as mock_client:
-                mock_client.return_value.__enter__.return_value.get.side_effect = mock_get
+                client = mock_client.return_value.__enter__.return_value
+                client.get.side_effect = mock_get
+                client.stream.side_effect = _mock_stream(b"different content")
 
                 result = update_templates()
 
@@ -219,10 +289,8 @@ class TestUpdateTemplates:
         def mock_get(url, **kwargs):
             mock_resp = mock.Mock()
             mock_resp.raise_for_status = mock.Mock()
-            if "manifest.json" in url:
-                mock_resp.json.return_value = manifest_data
-            else:
-                mock_resp.content = test_content
+            mock_resp.headers = {}
+            mock_resp.json.return_value = manifest_data
             return mock_resp
 
         callback_calls = []
@@ -232,9 +300,876 @@ class TestUpdateTemplates:
 
         with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
             with mock.patch("httpx.Client") as mock_client:
-                mock_client.return_value.__enter__.return_value.get.side_effect = mock_get
+                client = mock_client.return_value.__enter__.return_value
+                client.get.side_effect = mock_get
+                client.stream.side_effect = _mock_stream(test_content)
 
                 update_templates(progress_callback=progress_callback)
 
                 assert len(callback_calls) == 1
                 assert callback_calls[0] == (1, 1, "commands/test.md")
+
+
+class TestConcurrentDownloads:
+    """Tests for parallel downloads against a local HTTP server."""
+
+    FILES = {f"commands/tdd/cmd-{i}.md": f"# Command {i}\n".encode() for i in range(6)}
+
+    def test_downloads_all_files(self, temp_dir, template_server):
+        """Test every file is downloaded, verified and reported in manifest order."""
+        template_server.publish(self.FILES, "2.0.0")
+        calls = []
+
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
+            result = update_templates(
+                progress_callback=lambda *args: calls.append(args),
+                source=template_server.url,
+            )
+
+        assert result.status == "updated"
+        assert result.version == "2.0.0"
+        assert result.files_updated == list(self.FILES)
+        for rel_path, content in self.FILES.items():
+            assert (temp_dir / rel_path).read_bytes() == content
+        assert [call[:2] for call in calls] == [(i, 6) for i in range(1, 7)]
+        assert sorted(call[2] for call in calls) == sorted(self.FILES)
+
+    def test_parallelism_cap(self, temp_dir, template_server):
+        """Test downloads overlap but never exceed max_workers."""
+        template_server.publish(self.FILES)
+        template_server.delay = 0.05
+
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
+            result = update_templates(max_workers=2, source=template_server.url)
+
+        assert result.status == "updated"
+        assert template_server.max_in_flight == 2
+
+    def test_unchanged_files_not_downloaded(self, temp_dir, template_server):
+        """Test files already in the cache are kept without a request."""
+        template_server.publish(self.FILES, "1.0.0")
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
+            update_templates(source=template_server.url)
+
+            changed = dict(self.FILES)
+            changed["commands/tdd/cmd-0.md"] = b"# Changed\n"
+            template_server.publish(changed, "1.1.0")
+            template_server.requests.clear()
+            result = update_templates(source=template_server.url)
+
+        assert result.files_updated == ["commands/tdd/cmd-0.md"]
+        assert len(result.files_unchanged) == 5
+        assert template_server.requests == ["/manifest.json", "/commands/tdd/cmd-0.md"]
+
+    def test_checksum_mismatch_keeps_cache(self, temp_dir, template_server):
+        """Test a corrupted download fails the update without touching the cache."""
+        template_server.publish(self.FILES)
+        (template_server.root / "commands/tdd/cmd-3.md").write_bytes(b"tampered")
+
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
+            result = update_templates(source=template_server.url)
+
+        assert result.status == "error"
+        assert any("cmd-3.md" in error for error in result.errors)
+        assert not (temp_dir / "manifest.json").exists()
+
+
+class TestConditionalRequests:
+    """Tests for ETag / Last-Modified revalidation."""
+
+    FILES = {"commands/a.md": b"# A\n", "placeholders/langs/python/X.md": b"x\n"}
+
+    def test_unchanged_manifest_single_request(self, temp_dir, template_server):
+        """Test a no-op update is one conditional request answered with 304."""
+        template_server.publish(self.FILES, "1.0.0")
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
+            update_templates(source=template_server.url)
+            template_server.requests.clear()
+            template_server.statuses.clear()
+
+            result = update_templates(source=template_server.url)
+
+        assert result.status == "up_to_date"
+        assert result.version == "1.0.0"
+        assert template_server.requests == ["/manifest.json"]
+        assert template_server.statuses == [304]
+
+    def test_validators_stored_in_cache(self, temp_dir, template_server):
+        """Test validators of the manifest are kept, outside the bundle."""
+        template_server.publish(self.FILES)
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
+            update_templates(source=template_server.url)
+
+        validators = json.loads((temp_dir / ".http-cache.json").read_text())
+        assert set(validators) == {"manifest.json"}
+        assert all(entry["etag"].startswith('"') for entry in validators.values())
+        assert ".http-cache.json" not in TemplateBundle.load(temp_dir / "templates.pack")
+
+    def test_unchanged_manifest_revalidated_after_update(self, temp_dir, template_server):
+        """Test only changed files are fetched, and the new manifest then gets a 304."""
+        template_server.publish(self.FILES, "1.0.0")
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
+            update_templates(source=template_server.url)
+            template_server.publish(dict(self.FILES, **{"commands/a.md": b"# A2\n"}), "1.1.0")
+            template_server.requests.clear()
+            template_server.statuses.clear()
+
+            assert update_templates(source=template_server.url).status == "updated"
+            assert template_server.requests == ["/manifest.json", "/commands/a.md"]
+            assert template_server.statuses == [200, 200]
+            template_server.requests.clear()
+            template_server.statuses.clear()
+
+            result = update_templates(source=template_server.url)
+
+        assert result.status == "up_to_date"
+        assert result.version == "1.1.0"
+        assert template_server.requests == ["/manifest.json"]
+        assert template_server.statuses == [304]
+
+    def test_force_ignores_validators(self, temp_dir, template_server):
+        """Test --force downloads everything unconditionally."""
+        template_server.publish(self.FILES)
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
+            update_templates(source=template_server.url)
+            template_server.statuses.clear()
+
+            result = update_templates(force=True, source=template_server.url)
+
+        assert result.status == "updated"
+        assert template_server.statuses == [200, 200, 200]
+
+    @pytest.mark.parametrize("damage", ["corrupt", "delete"])
+    def test_bad_cached_copy_fetched_unconditionally(
+        self, temp_dir, template_server, isolated_template_store, damage
+    ):
+        """Test a missing or corrupt cached file is not revalidated against its old ETag."""
+        template_server.publish(self.FILES, "1.0.0")
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
+            update_templates(source=template_server.url)
+            if damage == "corrupt":
+                (temp_dir / "commands/a.md").write_bytes(b"# Corrupt\n")
+            else:
+                (temp_dir / "commands/a.md").unlink()
+            # Nothing to restore from: the file has to come from the server
+            shutil.rmtree(isolated_template_store)
+
+            template_server.publish(
+                dict(self.FILES, **{"placeholders/langs/python/X.md": b"y\n"}), "1.0.1"
+            )
+            template_server.statuses.clear()
+            result = update_templates(source=template_server.url)
+
+        assert result.status == "updated", result.errors
+        assert sorted(result.files_updated) == sorted(self.FILES)
+        assert 304 not in template_server.statuses
+        assert (temp_dir / "commands/a.md").read_bytes() == b"# A\n"
+
+    def test_last_modified_revalidation(self, temp_dir):
+        """Test If-Modified-Since is sent when the server only gives Last-Modified."""
+        last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+        responses = []
+
+        def mock_get(url, headers=None):
+            mock_resp = mock.Mock()
+            mock_resp.raise_for_status = mock.Mock()
+            mock_resp.headers = {"Last-Modified": last_modified}
+            if headers.get("If-Modified-Since") == last_modified:
+                mock_resp.status_code = 304
+            else:
+                mock_resp.status_code = 200
+                mock_resp.json.return_value = {"version": "1.0.0", "templates": {}}
+            responses.append(mock_resp.status_code)
+            return mock_resp
+
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=temp_dir):
+            with mock.patch("httpx.Client") as mock_client:
+                mock_client.return_value.__enter__.return_value.get.side_effect = mock_get
+
+                assert update_templates().status == "updated"
+                assert update_templates().status == "up_to_date"
+
+        assert responses == [200, 304]
+
+
+def _publish_archive(server, files, version="1.0.0", name="templates.tar.gz", skip=()):
+    """Publish files plus an archive of them advertised in the manifest."""
+    manifest = server.publish(files, version)
+
+    buffer = io.BytesIO()
+    if name.endswith(".zip"):
+        with zipfile.ZipFile(buffer, "w") as zf:
+            for rel_path, content in files.items():
+                if rel_path not in skip:
+                    zf.writestr(rel_path, content)
+    else:
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tf:
+            for rel_path, content in files.items():
+                if rel_path not in skip:
+                    info = tarfile.TarInfo(f"./{rel_path}")
+                    info.size = len(content)
+                    tf.addfile(info, io.BytesIO(content))
+
+    archive = buffer.getvalue()
+    (server.root / name).write_bytes(archive)
+    manifest["archive"] = {"path": name, "sha256": hashlib.sha256(archive).hexdigest()}
+    (server.root / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return manifest
+
+
+class TestArchiveUpdate:
+    """Tests for updating from a single templates archive."""
+
+    FILES = {f"commands/tdd/cmd-{i}.md": f"# Command {i}\n".encode() for i in range(4)}
+
+    def test_single_request(self, temp_dir, template_server, run_update):
+        """Test every file comes from the archive in one request."""
+        _publish_archive(template_server, self.FILES)
+        calls = []
+
+        result = run_update(
+            temp_dir, template_server.url, progress_callback=lambda *args: calls.append(args)
+        )
+
+        assert result.status == "updated"
+        assert result.files_updated == list(self.FILES)
+        assert template_server.requests == ["/manifest.json", "/templates.tar.gz"]
+        assert calls == [(i + 1, 4, path) for i, path in enumerate(self.FILES)]
+        for rel_path, content in self.FILES.items():
+            assert (temp_dir / rel_path).read_bytes() == content
+        assert not (temp_dir / "templates.tar.gz").exists()
+
+    def test_zip_archive(self, temp_dir, template_server, run_update):
+        """Test zip archives are supported too."""
+        _publish_archive(template_server, self.FILES, name="templates.zip")
+
+        result = run_update(temp_dir, template_server.url)
+
+        assert result.status == "updated"
+        assert template_server.requests == ["/manifest.json", "/templates.zip"]
+
+    def test_archive_checksum_mismatch(self, temp_dir, template_server, run_update):
+        """Test a corrupted archive fails the update."""
+        _publish_archive(template_server, self.FILES)
+        (template_server.root / "templates.tar.gz").write_bytes(b"corrupted")
+
+        result = run_update(temp_dir, template_server.url)
+
+        assert result.status == "error"
+        assert "templates.tar.gz" in result.errors[0]
+        assert not (temp_dir / "manifest.json").exists()
+
+    def test_missing_archive_falls_back(self, temp_dir, template_server, run_update):
+        """Test files are fetched one by one when the archive is unavailable."""
+        _publish_archive(template_server, self.FILES)
+        (template_server.root / "templates.tar.gz").unlink()
+
+        result = run_update(temp_dir, template_server.url)
+
+        assert result.status == "updated"
+        assert len(template_server.requests) == 2 + len(self.FILES)
+
+    def test_incomplete_archive_falls_back_per_file(self, temp_dir, template_server, run_update):
+        """Test files missing from the archive are fetched individually."""
+        missing = "commands/tdd/cmd-2.md"
+        _publish_archive(template_server, self.FILES, skip={missing})
+
+        result = run_update(temp_dir, template_server.url)
+
+        assert result.status == "updated"
+        assert template_server.requests[-1] == f"/{missing}"
+        assert (temp_dir / missing).read_bytes() == self.FILES[missing]
+
+    def test_few_changes_fetched_per_file(self, temp_dir, template_server, run_update):
+        """Test a small change is downloaded file by file, not as the archive."""
+        _publish_archive(template_server, self.FILES, "1.0.0")
+        run_update(temp_dir, template_server.url)
+        changed = dict(self.FILES, **{"commands/tdd/cmd-1.md": b"# Changed\n"})
+        _publish_archive(template_server, changed, "1.0.1")
+        template_server.requests.clear()
+
+        result = run_update(temp_dir, template_server.url)
+
+        assert result.files_updated == ["commands/tdd/cmd-1.md"]
+        assert template_server.requests == ["/manifest.json", "/commands/tdd/cmd-1.md"]
+
+    def test_many_changes_use_archive(self, temp_dir, template_server, run_update):
+        """Test the archive is used once enough of the files changed."""
+        _publish_archive(template_server, self.FILES, "1.0.0")
+        run_update(temp_dir, template_server.url)
+        changed = {rel_path: content + b"v2\n" for rel_path, content in self.FILES.items()}
+        changed["commands/tdd/cmd-0.md"] = self.FILES["commands/tdd/cmd-0.md"]
+        _publish_archive(template_server, changed, "1.0.1")
+        template_server.requests.clear()
+
+        result = run_update(temp_dir, template_server.url)
+
+        assert len(result.files_updated) == 3
+        assert template_server.requests == ["/manifest.json", "/templates.tar.gz"]
+
+    def test_unchanged_files_skip_archive(self, temp_dir, template_server, run_update):
+        """Test the archive is not fetched when nothing changed but the version."""
+        _publish_archive(template_server, self.FILES, "1.0.0")
+        run_update(temp_dir, template_server.url)
+        _publish_archive(template_server, self.FILES, "1.0.1")
+        template_server.requests.clear()
+
+        result = run_update(temp_dir, template_server.url)
+
+        assert result.status == "updated"
+        assert result.files_unchanged == list(self.FILES)
+        assert template_server.requests == ["/manifest.json"]
+
+
+class TestDeltaUpdate:
+    """Tests for incremental updates of the template cache."""
+
+    FILES = {
+        "commands/a.md": b"# A\n",
+        "commands/b.md": b"# B\n",
+        "commands/old/c.md": b"# C\n",
+    }
+
+    @pytest.fixture
+    def cache_dir(self, temp_dir):
+        return temp_dir / "templates"
+
+    def test_only_changed_files_written(self, cache_dir, template_server, run_update):
+        """Test unchanged files are left untouched on disk."""
+        template_server.publish(self.FILES, "1.0.0")
+        run_update(cache_dir, template_server.url)
+        before = (cache_dir / "commands/b.md").stat()
+
+        changed = dict(self.FILES, **{"commands/a.md": b"# A2\n"})
+        template_server.publish(changed, "1.0.1")
+        result = run_update(cache_dir, template_server.url)
+
+        after = (cache_dir / "commands/b.md").stat()
+        assert result.files_updated == ["commands/a.md"]
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+        assert (cache_dir / "commands/a.md").read_bytes() == b"# A2\n"
+        assert json.loads((cache_dir / "manifest.json").read_text())["version"] == "1.0.1"
+
+    def test_removed_files_deleted(self, cache_dir, template_server, run_update):
+        """Test files dropped from the manifest are deleted with their empty directories."""
+        template_server.publish(self.FILES, "1.0.0")
+        run_update(cache_dir, template_server.url)
+
+        remaining = {k: v for k, v in self.FILES.items() if k != "commands/old/c.md"}
+        (template_server.root / "manifest.json").unlink()
+        template_server.publish(remaining, "1.1.0")
+        result = run_update(cache_dir, template_server.url)
+
+        assert result.files_removed == ["commands/old/c.md"]
+        assert not (cache_dir / "commands/old").exists()
+        assert (cache_dir / "commands/a.md").exists()
+
+    def test_bundle_matches_cache(self, cache_dir, template_server, run_update):
+        """Test the repacked bundle has the same content as packing the cache."""
+        template_server.publish(self.FILES, "1.0.0")
+        run_update(cache_dir, template_server.url)
+        changed = {"commands/a.md": b"# A2\n", "commands/new.md": b"# New\n"}
+        template_server.publish(changed, "1.1.0")
+
+        run_update(cache_dir, template_server.url)
+
+        assert (cache_dir / "templates.pack").read_bytes() == pack_templates(cache_dir, "1.1.0")
+
+    def test_interrupted_update_completes_next_time(self, cache_dir, template_server, run_update):
+        """Test the manifest is swapped last, so a failed apply is finished later."""
+        template_server.publish(self.FILES, "1.0.0")
+        run_update(cache_dir, template_server.url)
+        template_server.publish(dict(self.FILES, **{"commands/a.md": b"# A2\n"}), "1.0.1")
+
+        with mock.patch("tdd_llm.updater.repack_bundle", side_effect=OSError("disk full")):
+            failed = run_update(cache_dir, template_server.url)
+
+        assert failed.status == "error"
+        assert json.loads((cache_dir / "manifest.json").read_text())["version"] == "1.0.0"
+
+        template_server.requests.clear()
+        result = run_update(cache_dir, template_server.url)
+
+        assert result.status == "updated"
+        assert result.files_updated == []
+        assert template_server.requests == ["/manifest.json"]
+
+    def test_no_staging_left_behind(self, cache_dir, template_server, run_update):
+        """Test the staging directory is removed after the update."""
+        template_server.publish(self.FILES)
+        run_update(cache_dir, template_server.url)
+
+        assert [p.name for p in cache_dir.parent.iterdir()] == ["templates"]
+
+
+class TestVersionStore:
+    """Tests for installed versions kept in the template store."""
+
+    V1 = {"commands/a.md": b"# A\n", "commands/b.md": b"# B\n"}
+    V2 = {"commands/a.md": b"# A2\n", "commands/b.md": b"# B\n", "commands/c.md": b"# C\n"}
+
+    @pytest.fixture
+    def cache_dir(self, temp_dir):
+        cache_dir = temp_dir / "templates"
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=cache_dir):
+            yield cache_dir
+
+    def _install(self, server, *versions):
+        for version, files in versions:
+            (server.root / "manifest.json").unlink(missing_ok=True)
+            server.publish(files, version)
+            result = update_templates(source=server.url)
+            assert result.status == "updated"
+
+    def test_versions_recorded(self, cache_dir, template_server, isolated_template_store):
+        """Test each update records its manifest and the active version."""
+        self._install(template_server, ("1.0.0", self.V1), ("2.0.0", self.V2))
+
+        store = TemplateStore(isolated_template_store)
+        assert store.versions() == ["1.0.0", "2.0.0"]
+        assert (store.active(), store.previous()) == ("2.0.0", "1.0.0")
+
+    def test_old_versions_pruned(self, cache_dir, template_server, isolated_template_store):
+        """Test the store keeps only the active and previous versions."""
+        v3 = {"commands/a.md": b"# A3\n"}
+        self._install(template_server, ("1.0.0", self.V1), ("2.0.0", self.V2), ("3.0.0", v3))
+
+        store = TemplateStore(isolated_template_store)
+        assert store.versions() == ["2.0.0", "3.0.0"]
+        blobs = [p for p in (isolated_template_store / "objects").rglob("*") if p.is_file()]
+        # V2's three files plus A3; V1's A is gone, its B is shared with V2
+        assert len(blobs) == 4
+
+    def test_shared_blobs_stored_once(self, cache_dir, template_server, isolated_template_store):
+        """Test a file unchanged across versions has a single blob."""
+        self._install(template_server, ("1.0.0", self.V1), ("2.0.0", self.V2))
+
+        blobs = [p for p in (isolated_template_store / "objects").rglob("*") if p.is_file()]
+        assert len(blobs) == 4
+
+    def test_rollback_without_downloads(self, cache_dir, template_server):
+        """Test rollback restores the previous version from the store alone."""
+        self._install(template_server, ("1.0.0", self.V1), ("2.0.0", self.V2))
+        template_server.requests.clear()
+
+        result = rollback_templates()
+
+        assert result.status == "updated"
+        assert (result.previous_version, result.version) == ("2.0.0", "1.0.0")
+        assert result.files_updated == ["commands/a.md"]
+        assert result.files_removed == ["commands/c.md"]
+        assert template_server.requests == []
+        assert (cache_dir / "commands/a.md").read_bytes() == b"# A\n"
+        assert not (cache_dir / "commands/c.md").exists()
+        assert get_local_manifest().version == "1.0.0"
+        assert (cache_dir / "templates.pack").read_bytes() == pack_templates(cache_dir, "1.0.0")
+
+    def test_update_after_rollback_uses_store(self, cache_dir, template_server):
+        """Test returning to a stored version only fetches the manifest."""
+        self._install(template_server, ("1.0.0", self.V1), ("2.0.0", self.V2))
+        rollback_templates()
+        template_server.requests.clear()
+
+        result = update_templates(source=template_server.url)
+
+        assert result.status == "updated"
+        assert template_server.requests == ["/manifest.json"]
+        assert (cache_dir / "commands/c.md").read_bytes() == b"# C\n"
+
+    def test_rollback_without_previous(self, cache_dir, template_server):
+        """Test rollback fails when only one version was installed."""
+        self._install(template_server, ("1.0.0", self.V1))
+
+        result = rollback_templates()
+
+        assert result.status == "error"
+        assert "No previous template version" in result.errors[0]
+
+    def test_switch_unknown_version(self, cache_dir):
+        """Test switching to a version never installed fails."""
+        result = switch_templates("9.9.9")
+
+        assert result.status == "error"
+        assert "not in the local store" in result.errors[0]
+
+    def test_switch_with_missing_blob(self, cache_dir, template_server, isolated_template_store):
+        """Test a version whose blobs were deleted is not half-applied."""
+        self._install(template_server, ("1.0.0", self.V1), ("2.0.0", self.V2))
+        checksum = hashlib.sha256(self.V1["commands/a.md"]).hexdigest()
+        TemplateStore(isolated_template_store).blob_path(checksum).unlink()
+
+        result = switch_templates("1.0.0")
+
+        assert result.status == "error"
+        assert "1 files missing" in result.errors[0]
+        assert get_local_manifest().version == "2.0.0"
+
+
+class TestHashCache:
+    """Tests for the stat-keyed checksum index of the cache."""
+
+    OLD_NS = 1_000_000_000_000_000_000  # 2001, well outside the racy window
+
+    def _write(self, path, content, mtime_ns=OLD_NS):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def _tamper(self, path, content):
+        """Change content without changing size or mtime."""
+        stat = path.stat()
+        path.write_bytes(content)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    def test_unchanged_stat_skips_rehash(self, temp_dir):
+        """Test a file with unchanged size and mtime is not read again."""
+        self._write(temp_dir / "a.md", b"# A\n")
+        hashes = _HashCache(temp_dir)
+        recorded = hashes.checksum("a.md")
+        hashes.save()
+        self._tamper(temp_dir / "a.md", b"# X\n")
+
+        assert _HashCache(temp_dir).checksum("a.md") == recorded
+        assert _HashCache(temp_dir, verify=True).checksum("a.md") == (
+            hashlib.sha256(b"# X\n").hexdigest()
+        )
+
+    def test_changed_stat_rehashes(self, temp_dir):
+        """Test a file whose size changed is hashed again."""
+        self._write(temp_dir / "a.md", b"# A\n")
+        hashes = _HashCache(temp_dir)
+        hashes.checksum("a.md")
+        hashes.save()
+        self._write(temp_dir / "a.md", b"# Longer\n")
+
+        assert _HashCache(temp_dir).checksum("a.md") == hashlib.sha256(b"# Longer\n").hexdigest()
+
+    def test_recent_mtime_not_trusted(self, temp_dir):
+        """Test files modified around the index write are rehashed (racy clean)."""
+        (temp_dir / "a.md").write_bytes(b"# A\n")
+        hashes = _HashCache(temp_dir)
+        hashes.checksum("a.md")
+        hashes.save()
+        self._tamper(temp_dir / "a.md", b"# X\n")
+
+        assert _HashCache(temp_dir).checksum("a.md") == hashlib.sha256(b"# X\n").hexdigest()
+
+    def test_missing_file(self, temp_dir):
+        """Test a missing file has no checksum."""
+        assert _HashCache(temp_dir).checksum("missing.md") is None
+
+    def test_corrupt_index_ignored(self, temp_dir):
+        """Test an unreadable index is treated as empty."""
+        self._write(temp_dir / "a.md", b"# A\n")
+        (temp_dir / ".hash-cache.json").write_text("not json")
+
+        assert _HashCache(temp_dir).checksum("a.md") == hashlib.sha256(b"# A\n").hexdigest()
+
+    def test_update_records_index(self, temp_dir, template_server):
+        """Test an update records the checksums of the files it wrote."""
+        files = {"commands/a.md": b"# A\n", "commands/b.md": b"# B\n"}
+        manifest = template_server.publish(files)
+        cache_dir = temp_dir / "templates"
+
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=cache_dir):
+            update_templates(source=template_server.url)
+
+        index = json.loads((cache_dir / ".hash-cache.json").read_text())
+        assert {path: entry[2] for path, entry in index["files"].items()} == manifest["templates"]
+        assert ".hash-cache.json" not in TemplateBundle.load(cache_dir / "templates.pack")
+
+    def test_verify_flag_rehashes(self, temp_dir, template_server):
+        """Test --verify catches a cached file changed behind the index's back."""
+        files = {"commands/a.md": b"# A\n", "commands/b.md": b"# B\n"}
+        template_server.publish(files, "1.0.0")
+        cache_dir = temp_dir / "templates"
+
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=cache_dir):
+            update_templates(source=template_server.url)
+            # Age the cache and index it, then corrupt a file keeping its stat data
+            for path in files:
+                os.utime(cache_dir / path, ns=(self.OLD_NS, self.OLD_NS))
+            hashes = _HashCache(cache_dir)
+            for path in files:
+                hashes.checksum(path)
+            hashes.save()
+            self._tamper(cache_dir / "commands/a.md", b"# X\n")
+
+            template_server.publish(dict(files, **{"commands/b.md": b"# B2\n"}), "1.0.1")
+            trusted = update_templates(source=template_server.url)
+            template_server.publish(dict(files, **{"commands/b.md": b"# B3\n"}), "1.0.2")
+            verified = update_templates(source=template_server.url, verify=True)
+
+        assert trusted.files_updated == ["commands/b.md"]
+        assert verified.files_updated == ["commands/a.md", "commands/b.md"]
+        assert (cache_dir / "commands/a.md").read_bytes() == b"# A\n"
+
+    def test_verify_repairs_same_version(self, temp_dir, template_server):
+        """Test --verify repairs a corrupt cached file when no new version exists."""
+        files = {"commands/a.md": b"# A\n", "commands/b.md": b"# B\n"}
+        template_server.publish(files, "1.0.0")
+        cache_dir = temp_dir / "templates"
+
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=cache_dir):
+            update_templates(source=template_server.url)
+            for path in files:
+                os.utime(cache_dir / path, ns=(self.OLD_NS, self.OLD_NS))
+            hashes = _HashCache(cache_dir)
+            for path in files:
+                hashes.checksum(path)
+            hashes.save()
+            self._tamper(cache_dir / "commands/a.md", b"# X\n")
+
+            plain = update_templates(source=template_server.url)
+            assert plain.status == "up_to_date"
+            assert (cache_dir / "commands/a.md").read_bytes() == b"# X\n"
+
+            verified = update_templates(source=template_server.url, verify=True)
+            clean = update_templates(source=template_server.url, verify=True)
+
+        assert verified.status == "updated"
+        assert verified.version == "1.0.0"
+        assert verified.files_updated == ["commands/a.md"]
+        assert (cache_dir / "commands/a.md").read_bytes() == b"# A\n"
+        assert clean.status == "up_to_date"
+        assert clean.files_unchanged == sorted(files)
+
+
+class TestStreamingDownloads:
+    """Tests for streamed, resumable file downloads."""
+
+    BODY = b"".join(f"line {i}\n".encode() for i in range(20000))
+
+    def test_resume_after_dropped_connection(self, temp_dir, template_server, run_update):
+        """Test an interrupted transfer resumes with a Range request."""
+        template_server.publish({"commands/big.md": self.BODY})
+        template_server.cut_after["/commands/big.md"] = 1000
+
+        result = run_update(temp_dir, template_server.url)
+
+        assert result.status == "updated"
+        assert (temp_dir / "commands/big.md").read_bytes() == self.BODY
+        assert template_server.range_headers == ["bytes=1000-"]
+        assert template_server.requests.count("/commands/big.md") == 2
+
+    def test_restart_when_range_ignored(self, temp_dir, template_server, run_update):
+        """Test the download starts over if the server ignores the range."""
+        template_server.publish({"commands/big.md": self.BODY})
+        template_server.cut_after["/commands/big.md"] = 1000
+        template_server.honor_ranges = False
+
+        result = run_update(temp_dir, template_server.url)
+
+        assert result.status == "updated"
+        assert (temp_dir / "commands/big.md").read_bytes() == self.BODY
+
+    def test_size_cap(self, temp_dir, template_server, run_update):
+        """Test a file larger than the cap is rejected and the cache left alone."""
+        template_server.publish({"commands/big.md": self.BODY})
+
+        result = run_update(temp_dir, template_server.url, max_file_size=1024)
+
+        assert result.status == "error"
+        assert "exceeds the size limit of 1024 bytes" in result.errors[0]
+        assert not (temp_dir / "manifest.json").exists()
+
+    def test_no_part_files_left(self, temp_dir, template_server, run_update):
+        """Test completed downloads are renamed from their .part file."""
+        template_server.publish({"commands/a.md": b"# A\n", "commands/big.md": self.BODY})
+        template_server.cut_after["/commands/big.md"] = 10
+
+        run_update(temp_dir, template_server.url)
+
+        assert not list(temp_dir.rglob("*.part"))
+        assert not list(temp_dir.parent.glob(".templates-update-*"))
+
+
+class TestLocalSources:
+    """Tests for updating from a mirror directory or archive on disk."""
+
+    FILES = {"commands/a.md": b"# A\n", "placeholders/langs/python/X.md": b"x\n"}
+
+    def _mirror(self, temp_dir, files=None):
+        mirror = temp_dir / "mirror"
+        files = files or self.FILES
+        for rel_path, content in files.items():
+            (mirror / rel_path).parent.mkdir(parents=True, exist_ok=True)
+            (mirror / rel_path).write_bytes(content)
+        manifest = {
+            "version": "2.0.0",
+            "templates": {p: hashlib.sha256(c).hexdigest() for p, c in files.items()},
+        }
+        (mirror / "manifest.json").write_text(json.dumps(manifest))
+        return mirror, manifest
+
+    def _archive(self, temp_dir, files, manifest, name="templates.tar.gz"):
+        path = temp_dir / name
+        with tarfile.open(path, "w:gz") as tf:
+            entries = {"manifest.json": json.dumps(manifest).encode(), **files}
+            for rel_path, content in entries.items():
+                info = tarfile.TarInfo(rel_path)
+                info.size = len(content)
+                tf.addfile(info, io.BytesIO(content))
+        return path
+
+    @pytest.fixture(autouse=True)
+    def no_network(self):
+        with mock.patch("tdd_llm.updater._fetch_remote_manifest") as fetch:
+            yield
+        fetch.assert_not_called()
+
+    def test_directory(self, temp_dir, run_update):
+        """Test updating from a local templates directory."""
+        mirror, _ = self._mirror(temp_dir)
+
+        result = run_update(temp_dir / "templates", mirror)
+
+        assert result.status == "updated"
+        assert result.version == "2.0.0"
+        assert (temp_dir / "templates/commands/a.md").read_bytes() == b"# A\n"
+        assert json.loads((temp_dir / "templates/.http-cache.json").read_text()) == {}
+
+    def test_file_url_and_manifest_path(self, temp_dir, run_update):
+        """Test file:// URLs and paths to manifest.json select the directory."""
+        mirror, _ = self._mirror(temp_dir)
+
+        assert run_update(temp_dir / "templates", mirror.as_uri()).status == "updated"
+        assert run_update(temp_dir / "templates", mirror / "manifest.json").status == "up_to_date"
+
+    def test_archive_with_manifest(self, temp_dir, run_update):
+        """Test updating from an archive carrying its manifest."""
+        mirror, manifest = self._mirror(temp_dir)
+        archive = self._archive(temp_dir, self.FILES, manifest)
+
+        result = run_update(temp_dir / "templates", archive)
+
+        assert result.status == "updated"
+        assert sorted(result.files_updated) == sorted(self.FILES)
+        assert (temp_dir / "templates/placeholders/langs/python/X.md").read_bytes() == b"x\n"
+
+    def test_archive_with_sibling_manifest(self, temp_dir, run_update):
+        """Test an archive without manifest uses the manifest next to it."""
+        mirror, manifest = self._mirror(temp_dir)
+        archive = mirror / "templates.tar.gz"
+        with tarfile.open(archive, "w:gz") as tf:
+            for rel_path, content in self.FILES.items():
+                info = tarfile.TarInfo(rel_path)
+                info.size = len(content)
+                tf.addfile(info, io.BytesIO(content))
+
+        assert run_update(temp_dir / "templates", archive).status == "updated"
+
+    def test_archive_missing_file(self, temp_dir, run_update):
+        """Test a file listed in the manifest but absent from the archive fails."""
+        _, manifest = self._mirror(temp_dir)
+        archive = self._archive(temp_dir, {"commands/a.md": b"# A\n"}, manifest)
+
+        result = run_update(temp_dir / "templates", archive)
+
+        assert result.status == "error"
+        assert "missing from the template source" in result.errors[0]
+        assert not (temp_dir / "templates/manifest.json").exists()
+
+    def test_checksum_mismatch(self, temp_dir, run_update):
+        """Test local files go through the same checksum verification."""
+        mirror, _ = self._mirror(temp_dir)
+        (mirror / "commands/a.md").write_bytes(b"# tampered\n")
+
+        result = run_update(temp_dir / "templates", mirror)
+
+        assert result.status == "error"
+        assert "Checksum mismatch for commands/a.md" in result.errors[0]
+
+    def test_missing_source(self, temp_dir, run_update):
+        """Test a source that does not exist is reported."""
+        result = run_update(temp_dir / "templates", temp_dir / "nowhere")
+
+        assert result.status == "error"
+        assert "Template source not found" in result.errors[0]
+
+
+class TestUpdateCheck:
+    """Tests for the background update check and its freshness record."""
+
+    @pytest.fixture
+    def cache_dir(self, temp_dir):
+        cache_dir = temp_dir / "templates"
+        with mock.patch("tdd_llm.updater.get_templates_cache_dir", return_value=cache_dir):
+            yield cache_dir
+
+    def test_check_records_latest_version(self, cache_dir, template_server):
+        """Test a check records the source's version without installing it."""
+        template_server.publish({"commands/a.md": b"# A\n"}, "1.1.0")
+
+        assert check_for_update(template_server.url) == "1.1.0"
+
+        check = load_update_check()
+        assert check.latest_version == "1.1.0"
+        assert time.time() - check.checked_at < 60
+        assert get_local_manifest() is None
+        assert not (cache_dir / "commands").exists()
+
+    def test_check_not_modified(self, cache_dir, template_server):
+        """Test an unchanged manifest costs a 304 and records the installed version."""
+        template_server.publish({"commands/a.md": b"# A\n"}, "1.0.0")
+        update_templates(source=template_server.url)
+        template_server.statuses.clear()
+
+        assert check_for_update(template_server.url) == "1.0.0"
+        assert template_server.statuses == [304]
+
+    def test_check_unreachable_source(self, cache_dir, temp_dir):
+        """Test a failed check returns None and records nothing."""
+        assert check_for_update(str(temp_dir / "nowhere")) is None
+        assert load_update_check() is None
+
+    def test_check_due(self, cache_dir):
+        """Test the TTL against the freshness record."""
+        assert update_check_due(24)
+        assert not update_check_due(0)
+
+        _save_update_check(UpdateCheck(time.time(), "1.0.0"))
+        assert not update_check_due(24)
+
+        _save_update_check(UpdateCheck(time.time() - 25 * 3600, "1.0.0"))
+        assert update_check_due(24)
+
+    def test_background_check_detached(self, cache_dir):
+        """Test the check runs in a detached process after stamping the record."""
+        _save_update_check(UpdateCheck(0, "1.1.0"))
+
+        with mock.patch("tdd_llm.updater.subprocess.Popen") as popen:
+            start_background_check("https://mirror.example/templates")
+
+        args, kwargs = popen.call_args
+        assert args[0][-1] == "https://mirror.example/templates"
+        assert kwargs["stdout"] is not None and kwargs["stdin"] is not None
+        check = load_update_check()
+        assert check.latest_version == "1.1.0"
+        assert not update_check_due(24)
+
+    def test_update_hint(self, cache_dir):
+        """Test the hint compares the recorded version with the installed one."""
+        cache_dir.mkdir()
+        (cache_dir / "manifest.json").write_text(json.dumps({"version": "1.0.0", "templates": {}}))
+        assert get_update_hint() is None
+
+        _save_update_check(UpdateCheck(time.time(), "1.0.0"))
+        assert get_update_hint() is None
+
+        _save_update_check(UpdateCheck(time.time(), "1.1.0"))
+        assert "1.0.0 -> 1.1.0" in get_update_hint()
+
+    def test_installed_version_falls_back_to_package(self, cache_dir):
+        """Test the packaged manifest gives the version when nothing is cached."""
+        assert get_installed_version() is not None
+
+    def test_update_resets_record(self, cache_dir, template_server):
+        """Test a foreground update refreshes the record, clearing the hint."""
+        _save_update_check(UpdateCheck(0, "2.0.0"))
+        template_server.publish({"commands/a.md": b"# A\n"}, "2.0.0")
+
+        update_templates(source=template_server.url)
+
+        assert not update_check_due(24)
+        assert get_update_hint() is None